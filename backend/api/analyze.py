@@ -6,22 +6,33 @@ Combines OCR, clause extraction, RAG analysis, and risk scoring.
 """
 
 import asyncio
+import json
 import logging
 import time
-from datetime import datetime
+from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
+from typing import Any, Awaitable, Callable
 
-from fastapi import APIRouter, BackgroundTasks, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Response, status
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
 
-from api.upload import get_document_store
+from api.dependencies import expire_stale_analysis, require_document
 from core import (
+    CategoryRisk,
     ClauseExtractor,
+    ClauseRisk,
+    ComplianceAnalysis,
     ContractRiskReport,
     OCRError,
     OCRProcessor,
     RAGEngine,
     RiskEngine,
 )
+from core.config import get_settings
+from core.document_store import get_document_store
+from core.report_store import get_report_store
 from schemas import (
     AnalysisStatusEnum,
     AnalyzeRequest,
@@ -29,6 +40,7 @@ from schemas import (
     CategoryRiskSchema,
     CitationSchema,
     ClauseRiskSchema,
+    ClauseTypeEnum,
     ContributingFactorSchema,
     DocumentStatusResponse,
     ErrorResponse,
@@ -39,48 +51,138 @@ from schemas import (
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/analyze", tags=["Analyze"])
+settings = get_settings()
 
+# Built once; each validates a whole list in a single pydantic-core call
+_CLAUSE_RISKS_ADAPTER = TypeAdapter(list[ClauseRiskSchema])
+_CATEGORY_RISKS_ADAPTER = TypeAdapter(list[CategoryRiskSchema])
+_CITATIONS_ADAPTER = TypeAdapter(list[CitationSchema])
 
-def convert_risk_report_to_schema(report: ContractRiskReport) -> RiskReportSchema:
-    """Convert internal risk report to API schema."""
-    # Convert clause risks
-    high_risk_clauses = [
-        ClauseRiskSchema(
+# How often the SSE stream re-reads the document store
+STREAM_POLL_INTERVAL_SECONDS = 1.0
+
+# Risk levels surfaced as findings while analysis is still running
+FINDING_RISK_LEVELS = {"critical", "high"}
+
+ProgressCallback = Callable[[dict[str, Any]], Awaitable[None]]
+
+
+@lru_cache(maxsize=1)
+def get_ocr() -> OCRProcessor:
+    """Get the shared OCRProcessor instance."""
+    return OCRProcessor()
+
+
+@lru_cache(maxsize=1)
+def get_extractor() -> ClauseExtractor:
+    """Get the shared ClauseExtractor instance."""
+    return ClauseExtractor()
+
+
+@lru_cache(maxsize=1)
+def get_rag() -> RAGEngine:
+    """Get the shared RAGEngine instance."""
+    return RAGEngine()
+
+
+@lru_cache(maxsize=1)
+def get_risk() -> RiskEngine:
+    """Get the shared RiskEngine instance."""
+    return RiskEngine()
+
+
+async def warmup_engines() -> None:
+    """
+    Build the pipeline engines and run a warmup pass on each.
+    
+    Called once at application startup so model loading (Tesseract language
+    data, the sentence-transformers embedding model) happens before the first
+    request rather than inside it. Failures are logged and do not block
+    startup; the engine will be retried lazily on first use.
+    """
+    try:
+        await get_ocr().warmup()
+        logger.info("OCR engine warmed up")
+    except Exception as e:
+        logger.warning(f"OCR warmup failed: {e}")
+    
+    try:
+        get_extractor()
+        logger.info("Clause extractor ready")
+    except Exception as e:
+        get_extractor.cache_clear()
+        logger.warning(f"Clause extractor init failed: {e}")
+    
+    try:
+        await get_rag().warmup()
+        logger.info("RAG engine warmed up")
+    except Exception as e:
+        get_rag.cache_clear()
+        logger.warning(f"RAG engine warmup failed: {e}")
+    
+    get_risk()
+
+
+def _construct_clause_risks(risks: list[ClauseRisk]) -> list[ClauseRiskSchema]:
+    """Build clause risk schemas from risk engine output without validation."""
+    return [
+        ClauseRiskSchema.model_construct(
             clause_id=r.clause_id,
-            clause_type=r.clause_type,
+            clause_type=ClauseTypeEnum(r.clause_type),
             clause_title=r.clause_title,
-            clause_text_preview=r.clause_text_preview[:500],
+            clause_text_preview=r.clause_text_preview,
             risk_score=r.risk_score,
             risk_level=RiskLevelEnum(r.risk_level.value),
             contributing_factors=[
-                ContributingFactorSchema(**f) for f in r.contributing_factors
+                ContributingFactorSchema.model_construct(**factor)
+                for factor in r.contributing_factors
             ],
             violated_regulations=r.violated_regulations,
             recommendations=r.recommendations,
             explanation=r.explanation,
             confidence=r.confidence
         )
-        for r in report.top_risks
+        for r in risks
     ]
-    
-    # Convert category risks
-    category_risks = [
-        CategoryRiskSchema(
-            category=c.category,
-            category_display=c.category_display,
-            risk_score=c.risk_score,
-            risk_level=RiskLevelEnum(c.risk_level.value),
-            clause_count=c.clause_count,
-            high_risk_clauses=c.high_risk_clauses,
-            top_issues=c.top_issues
+
+
+def _construct_category_risks(risks: list[CategoryRisk]) -> list[CategoryRiskSchema]:
+    """Build category risk schemas from risk engine output without validation."""
+    return [
+        CategoryRiskSchema.model_construct(
+            category=r.category,
+            category_display=r.category_display,
+            risk_score=r.risk_score,
+            risk_level=RiskLevelEnum(r.risk_level.value),
+            clause_count=r.clause_count,
+            high_risk_clauses=r.high_risk_clauses,
+            top_issues=r.top_issues
         )
-        for c in report.category_risks
-    ]
-    
-    # Convert citations
-    citations = [
-        CitationSchema(**c) for c in report.citations
+        for r in risks
     ]
+
+
+def convert_risk_report_to_schema(report: ContractRiskReport) -> RiskReportSchema:
+    """Convert internal risk report to API schema."""
+    if settings.debug:
+        # Validate the risk dataclasses directly, so drift between the
+        # engine and the schemas shows up while developing; nested
+        # contributing factors are validated by pydantic-core in the same pass
+        high_risk_clauses = _CLAUSE_RISKS_ADAPTER.validate_python(
+            report.top_risks, from_attributes=True
+        )
+        category_risks = _CATEGORY_RISKS_ADAPTER.validate_python(
+            report.category_risks, from_attributes=True
+        )
+        citations = _CITATIONS_ADAPTER.validate_python(report.citations)
+    else:
+        # The report is our own output; skip per-field validation
+        high_risk_clauses = _construct_clause_risks(report.top_risks)
+        category_risks = _construct_category_risks(report.category_risks)
+        citations = [
+            CitationSchema.model_construct(**citation)
+            for citation in report.citations
+        ]
     
     # Convert scoring breakdown
     scoring_breakdown = ScoringBreakdownSchema(
@@ -108,46 +210,129 @@ def convert_risk_report_to_schema(report: ContractRiskReport) -> RiskReportSchem
     )
 
 
-async def run_analysis_pipeline(document_id: str, file_path: Path) -> ContractRiskReport:
+async def run_analysis_pipeline(
+    document_id: str,
+    file_path: Path,
+    on_progress: ProgressCallback | None = None
+) -> ContractRiskReport:
     """
     Run the complete document analysis pipeline.
     
     Pipeline steps:
     1. OCR / Text Extraction
     2. Clause Extraction & Classification
-    3. RAG Compliance Analysis
+    3. RAG Compliance Analysis (starts on each extraction batch as it lands)
     4. Risk Scoring
     
     Args:
         document_id: Unique document identifier
         file_path: Path to the PDF file
+        on_progress: Optional callback awaited with a progress event after
+            each step and after each clause's compliance analysis
         
     Returns:
         ContractRiskReport with complete analysis
     """
+    last_progress = 0.0
+    
+    async def report(event: dict[str, Any]) -> None:
+        nonlocal last_progress
+        # Steps 2 and 3 overlap; never let reported progress go backwards
+        last_progress = max(last_progress, event["progress"])
+        event["progress"] = last_progress
+        if on_progress is not None:
+            await on_progress(event)
+    
     logger.info(f"Starting analysis pipeline for {document_id}")
     
     # Step 1: OCR Processing
     logger.info(f"[{document_id}] Step 1: OCR Processing")
-    ocr_processor = OCRProcessor()
+    ocr_processor = get_ocr()
     document_content = await ocr_processor.process_document(file_path, document_id)
     logger.info(
         f"[{document_id}] OCR complete: {document_content.total_pages} pages, "
         f"confidence: {document_content.overall_confidence:.2f}"
     )
+    await report({
+        "step": "ocr",
+        "progress": 0.25,
+        "pages": document_content.total_pages
+    })
     
-    # Step 2: Clause Extraction
+    # Steps 2-3: Clause Extraction feeding RAG Compliance Analysis
+    # Each extraction batch goes to the RAG engine as soon as the LLM returns
+    # it, so compliance analysis overlaps the remaining extraction calls
     logger.info(f"[{document_id}] Step 2: Clause Extraction")
-    clause_extractor = ClauseExtractor()
-    extraction_result = await clause_extractor.extract_clauses(document_content)
+    logger.info(f"[{document_id}] Step 3: RAG Compliance Analysis (streaming)")
+    clause_extractor = get_extractor()
+    rag_engine = get_rag()
+    discovered = 0
+    analyzed = 0
+    
+    async def on_clause_analyzed(analysis: ComplianceAnalysis) -> None:
+        nonlocal analyzed
+        analyzed += 1
+        event = {
+            "step": "compliance",
+            "progress": round(0.5 + 0.4 * analyzed / max(discovered, 1), 3),
+            "completed": analyzed,
+            "total": discovered
+        }
+        if analysis.risk_level in FINDING_RISK_LEVELS:
+            event["finding"] = {
+                "clause_id": analysis.clause_id,
+                "clause_type": analysis.clause_type,
+                "risk_level": analysis.risk_level,
+                "risk_score": analysis.risk_score,
+                "violated_regulations": analysis.violated_regulations,
+                "explanation": analysis.explanation[:300]
+            }
+        await report(event)
+    
+    extracted_at = datetime.now(timezone.utc)
+    batches = []
+    analysis_tasks = {}  # batch index -> task
+    try:
+        async for batch in clause_extractor.iter_clause_batches(
+            document_content, extracted_at
+        ):
+            batches.append(batch)
+            index, clauses, _ = batch
+            discovered += len(clauses)
+            if clauses:
+                analysis_tasks[index] = asyncio.create_task(
+                    rag_engine.analyze_clauses(clauses, on_result=on_clause_analyzed)
+                )
+    except BaseException:
+        for task in analysis_tasks.values():
+            task.cancel()
+        raise
+    
+    extraction_result = clause_extractor.build_result(
+        document_id, batches, extracted_at
+    )
     logger.info(
         f"[{document_id}] Extracted {extraction_result.total_clauses} clauses"
     )
+    await report({
+        "step": "clauses",
+        "progress": 0.5,
+        "count": extraction_result.total_clauses,
+        "preview": [
+            {
+                "clause_id": c.clause_id,
+                "clause_type": c.clause_type.value,
+                "title": c.title
+            }
+            for c in extraction_result.clauses[:10]
+        ]
+    })
     
-    # Step 3: RAG Compliance Analysis
-    logger.info(f"[{document_id}] Step 3: RAG Compliance Analysis")
-    rag_engine = RAGEngine()
-    compliance_analyses = await rag_engine.analyze_clauses(extraction_result.clauses)
+    # Concatenate in batch order so analyses line up with the clauses
+    analysis_batches = await asyncio.gather(
+        *(analysis_tasks[index] for index in sorted(analysis_tasks))
+    )
+    compliance_analyses = [a for batch in analysis_batches for a in batch]
     logger.info(
         f"[{document_id}] Compliance analysis complete for "
         f"{len(compliance_analyses)} clauses"
@@ -155,8 +340,10 @@ async def run_analysis_pipeline(document_id: str, file_path: Path) -> ContractRi
     
     # Step 4: Risk Scoring
     logger.info(f"[{document_id}] Step 4: Risk Scoring")
-    risk_engine = RiskEngine()
-    risk_report = await risk_engine.calculate_risk_report(
+    risk_engine = get_risk()
+    # Pure CPU work; run it off the event loop
+    risk_report = await asyncio.to_thread(
+        risk_engine.calculate_risk_report,
         document_id,
         extraction_result.clauses,
         compliance_analyses
@@ -165,10 +352,37 @@ async def run_analysis_pipeline(document_id: str, file_path: Path) -> ContractRi
         f"[{document_id}] Risk report complete: "
         f"Overall score: {risk_report.overall_risk_score:.1f}"
     )
+    await report({"step": "risk", "progress": 1.0})
     
     return risk_report
 
 
+def _completed_json(document_id: str, doc: dict, report: ContractRiskReport) -> str:
+    """
+    Encode the AnalyzeResponse for a completed analysis.
+    
+    pydantic-core validates and encodes the report in one pass, instead of
+    FastAPI dumping the model to Python objects, running them through
+    jsonable_encoder, and encoding again.
+    """
+    result = AnalyzeResponse(
+        document_id=document_id,
+        status=AnalysisStatusEnum.COMPLETED,
+        risk_report=convert_risk_report_to_schema(report),
+        processing_time_seconds=_processing_time(doc)
+    )
+    return result.model_dump_json(by_alias=True)
+
+
+def _processing_time(doc: dict) -> float | None:
+    """Wall-clock analysis time for a document, if it has finished."""
+    started = doc.get("analysis_started_at")
+    completed = doc.get("analysis_completed_at")
+    if not started or not completed:
+        return None
+    return round((completed - started).total_seconds(), 2)
+
+
 async def process_document_async(document_id: str):
     """
     Background task to process a document.
@@ -176,13 +390,41 @@ async def process_document_async(document_id: str):
     """
     store = get_document_store()
     
-    if document_id not in store:
+    doc = await store.get(document_id)
+    if doc is None:
         logger.error(f"Document {document_id} not found in store")
         return
     
-    doc = store[document_id]
-    doc["status"] = AnalysisStatusEnum.PROCESSING
-    doc["analysis_started_at"] = datetime.utcnow()
+    doc = await store.update(
+        document_id,
+        status=AnalysisStatusEnum.PROCESSING,
+        analysis_started_at=doc.get("analysis_started_at") or datetime.utcnow()
+    )
+    await store.set_progress(document_id, None)
+    
+    # Cumulative progress snapshot read by the SSE stream; findings accumulate
+    # so a reader polling between events doesn't miss any
+    progress: dict[str, Any] = {"findings": []}
+    last_saved = float("-inf")
+    
+    async def save_progress(event: dict[str, Any]) -> None:
+        nonlocal last_saved
+        finding = event.pop("finding", None)
+        if finding is not None:
+            progress["findings"].append(finding)
+        progress.update(event)
+        
+        # Per-clause events can arrive far faster than the stream polls;
+        # write those at most once per poll interval. Every other step is
+        # written, and the final "risk" step flushes any held-back findings
+        now = time.monotonic()
+        if event["step"] == "compliance" and now - last_saved < STREAM_POLL_INTERVAL_SECONDS:
+            return
+        last_saved = now
+        try:
+            await store.set_progress(document_id, progress)
+        except Exception as e:
+            logger.warning(f"Failed to record progress for {document_id}: {e}")
     
     try:
         file_path = Path(doc["file_path"])
@@ -191,34 +433,47 @@ async def process_document_async(document_id: str):
             raise FileNotFoundError(f"Document file not found: {file_path}")
         
         # Run the analysis pipeline
-        risk_report = await run_analysis_pipeline(document_id, file_path)
+        risk_report = await run_analysis_pipeline(
+            document_id, file_path, on_progress=save_progress
+        )
         
-        # Update store with results
-        doc["status"] = AnalysisStatusEnum.COMPLETED
-        doc["analysis_completed_at"] = datetime.utcnow()
-        doc["risk_report"] = risk_report
-        doc["error_message"] = None
+        # Persist the report separately; the record only carries status
+        report_etag = await get_report_store().set(document_id, risk_report)
+        await store.update(
+            document_id,
+            status=AnalysisStatusEnum.COMPLETED,
+            analysis_completed_at=datetime.utcnow(),
+            report_etag=report_etag,
+            error_message=None
+        )
         
         logger.info(f"Document {document_id} analysis completed successfully")
         
     except OCRError as e:
         logger.error(f"OCR error for {document_id}: {e}")
-        doc["status"] = AnalysisStatusEnum.FAILED
-        doc["error_message"] = f"OCR processing failed: {str(e)}"
+        await store.update(
+            document_id,
+            status=AnalysisStatusEnum.FAILED,
+            error_message=f"OCR processing failed: {str(e)}"
+        )
         
     except Exception as e:
         logger.exception(f"Analysis failed for {document_id}: {e}")
-        doc["status"] = AnalysisStatusEnum.FAILED
-        doc["error_message"] = f"Analysis failed: {str(e)}"
+        await store.update(
+            document_id,
+            status=AnalysisStatusEnum.FAILED,
+            error_message=f"Analysis failed: {str(e)}"
+        )
 
 
 @router.post(
     "/{document_id}",
     response_model=AnalyzeResponse,
+    status_code=status.HTTP_202_ACCEPTED,
     responses={
+        200: {"model": AnalyzeResponse, "description": "Analysis already completed"},
         404: {"model": ErrorResponse, "description": "Document not found"},
-        409: {"model": ErrorResponse, "description": "Analysis already in progress"},
-        500: {"model": ErrorResponse, "description": "Analysis failed"}
+        409: {"model": ErrorResponse, "description": "Analysis already in progress"}
     },
     summary="Analyze a document",
     description="""
@@ -230,32 +485,24 @@ async def process_document_async(document_id: str):
     3. **Compliance Analysis**: Check clauses against GDPR and SEC regulations
     4. **Risk Scoring**: Calculate clause-level and overall risk scores
     
-    The analysis runs synchronously and returns the complete risk report.
-    For large documents, this may take 30-60 seconds.
+    The analysis runs in the background and this endpoint returns `202 Accepted`
+    immediately. Poll `GET /analyze/{document_id}/status` until the status is
+    `completed` or `failed`, or subscribe to `GET /analyze/{document_id}/stream`
+    for step-level progress and early high-risk findings. Calling this endpoint
+    again on a completed document returns the full risk report with `200 OK`.
     """
 )
 async def analyze_document(
     document_id: str,
+    background_tasks: BackgroundTasks,
+    doc: dict[str, Any] = Depends(require_document),
     request: AnalyzeRequest | None = None
-) -> AnalyzeResponse:
+) -> AnalyzeResponse | Response:
     """
-    Analyze an uploaded document and return the risk report.
+    Queue an uploaded document for analysis.
     """
     store = get_document_store()
     
-    # Check if document exists
-    if document_id not in store:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail={
-                "error": "DocumentNotFound",
-                "message": f"Document with ID '{document_id}' not found.",
-                "details": {"document_id": document_id}
-            }
-        )
-    
-    doc = store[document_id]
-    
     # Check if already processing
     if doc["status"] == AnalysisStatusEnum.PROCESSING:
         raise HTTPException(
@@ -271,72 +518,34 @@ async def analyze_document(
         )
     
     # Check if already completed
-    if doc["status"] == AnalysisStatusEnum.COMPLETED and doc.get("risk_report"):
-        return AnalyzeResponse(
-            document_id=document_id,
-            status=AnalysisStatusEnum.COMPLETED,
-            risk_report=convert_risk_report_to_schema(doc["risk_report"]),
-            processing_time_seconds=None
-        )
+    if doc["status"] == AnalysisStatusEnum.COMPLETED:
+        risk_report = await get_report_store().get(document_id)
+        if risk_report is not None:
+            return Response(
+                content=_completed_json(document_id, doc, risk_report),
+                media_type="application/json"
+            )
     
-    # Run analysis
-    start_time = time.time()
+    # Mark as processing before scheduling so a second request gets 409
+    await store.update(
+        document_id,
+        status=AnalysisStatusEnum.PROCESSING,
+        analysis_started_at=datetime.utcnow(),
+        analysis_completed_at=None,
+        error_message=None,
+        report_etag=None
+    )
+    await store.set_progress(document_id, None)
     
-    try:
-        doc["status"] = AnalysisStatusEnum.PROCESSING
-        doc["analysis_started_at"] = datetime.utcnow()
-        
-        file_path = Path(doc["file_path"])
-        
-        if not file_path.exists():
-            raise FileNotFoundError(f"Document file not found: {file_path}")
-        
-        # Run the analysis pipeline
-        risk_report = await run_analysis_pipeline(document_id, file_path)
-        
-        # Update store
-        doc["status"] = AnalysisStatusEnum.COMPLETED
-        doc["analysis_completed_at"] = datetime.utcnow()
-        doc["risk_report"] = risk_report
-        
-        processing_time = time.time() - start_time
-        
-        return AnalyzeResponse(
-            document_id=document_id,
-            status=AnalysisStatusEnum.COMPLETED,
-            risk_report=convert_risk_report_to_schema(risk_report),
-            processing_time_seconds=round(processing_time, 2)
-        )
-        
-    except OCRError as e:
-        doc["status"] = AnalysisStatusEnum.FAILED
-        doc["error_message"] = str(e)
-        
-        raise HTTPException(
-            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-            detail={
-                "error": "OCRError",
-                "message": str(e),
-                "details": {
-                    "document_id": document_id,
-                    "suggestion": "Document may be too low quality. Try uploading a higher resolution scan."
-                }
-            }
-        )
-        
-    except Exception as e:
-        logger.exception(f"Analysis failed for {document_id}")
-        doc["status"] = AnalysisStatusEnum.FAILED
-        doc["error_message"] = str(e)
-        
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail={
-                "error": "AnalysisFailed",
-                "message": f"Document analysis failed: {str(e)}",
-                "details": {"document_id": document_id}
-            }
-        )
+    background_tasks.add_task(process_document_async, document_id)
+    logger.info(f"Document {document_id} queued for analysis")
+    
+    return AnalyzeResponse(
+        document_id=document_id,
+        status=AnalysisStatusEnum.PROCESSING,
+        risk_report=None,
+        processing_time_seconds=None
+    )
 
 
 @router.get(
@@ -348,22 +557,10 @@ async def analyze_document(
     summary="Get analysis status",
     description="Check the current status of a document analysis."
 )
-async def get_analysis_status(document_id: str) -> DocumentStatusResponse:
+async def get_analysis_status(
+    doc: dict[str, Any] = Depends(require_document)
+) -> DocumentStatusResponse:
     """Get the current status of document analysis."""
-    store = get_document_store()
-    
-    if document_id not in store:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail={
-                "error": "DocumentNotFound",
-                "message": f"Document with ID '{document_id}' not found.",
-                "details": {"document_id": document_id}
-            }
-        )
-    
-    doc = store[document_id]
-    
     return DocumentStatusResponse(
         document_id=doc["document_id"],
         filename=doc["filename"],
@@ -373,3 +570,83 @@ async def get_analysis_status(document_id: str) -> DocumentStatusResponse:
         analysis_completed_at=doc.get("analysis_completed_at"),
         error_message=doc.get("error_message")
     )
+
+
+def _sse_event(event: str, data: Any) -> str:
+    """Format one Server-Sent Events message."""
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+
+
+@router.get(
+    "/{document_id}/stream",
+    dependencies=[Depends(require_document)],
+    responses={
+        200: {"content": {"text/event-stream": {}}, "description": "Analysis event stream"},
+        404: {"model": ErrorResponse, "description": "Document not found"}
+    },
+    summary="Stream analysis progress",
+    description="""
+    Stream analysis progress as Server-Sent Events.
+    
+    Events:
+    - `progress`: pipeline step and fraction complete (`ocr`, `clauses`, `compliance`, `risk`)
+    - `finding`: a high or critical risk clause, sent as soon as it is analyzed
+    - `complete`: the final `AnalyzeResponse` with the full risk report
+    - `error`: analysis failed or was never started
+    
+    Start the analysis with `POST /analyze/{document_id}` first.
+    """
+)
+async def stream_analysis(document_id: str) -> StreamingResponse:
+    """Stream analysis progress for a document."""
+    store = get_document_store()
+    
+    async def events():
+        sent_findings = 0
+        last_progress = None
+        
+        while True:
+            doc = await store.get(document_id)
+            if doc is None:
+                yield _sse_event("error", {"message": "Document was removed."})
+                return
+            doc = await expire_stale_analysis(store, doc)
+            
+            progress = await store.get_progress(document_id) or {}
+            findings = progress.pop("findings", [])
+            
+            for finding in findings[sent_findings:]:
+                yield _sse_event("finding", finding)
+            sent_findings = len(findings)
+            
+            if progress and progress != last_progress:
+                yield _sse_event("progress", progress)
+                last_progress = progress
+            
+            if doc["status"] == AnalysisStatusEnum.COMPLETED:
+                risk_report = await get_report_store().get(document_id)
+                if risk_report is None:
+                    yield _sse_event("error", {"message": "Risk report not found."})
+                    return
+                
+                result = _completed_json(document_id, doc, risk_report)
+                yield f"event: complete\ndata: {result}\n\n"
+                return
+            
+            if doc["status"] == AnalysisStatusEnum.FAILED:
+                yield _sse_event("error", {"message": doc.get("error_message")})
+                return
+            
+            if doc["status"] == AnalysisStatusEnum.PENDING:
+                yield _sse_event("error", {
+                    "message": f"Analysis has not been started. POST /analyze/{document_id} first."
+                })
+                return
+            
+            await asyncio.sleep(STREAM_POLL_INTERVAL_SECONDS)
+    
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
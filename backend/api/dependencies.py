@@ -0,0 +1,96 @@
+"""
+LawVisor API Dependencies
+=========================
+Shared FastAPI dependencies for document lookups.
+"""
+
+from datetime import datetime, timedelta
+from typing import Any
+
+from fastapi import Depends, HTTPException, status
+
+from core.config import get_settings
+from core.document_store import DocumentStore, get_document_store
+from schemas import AnalysisStatusEnum
+
+settings = get_settings()
+
+
+async def expire_stale_analysis(
+    store: DocumentStore,
+    doc: dict[str, Any]
+) -> dict[str, Any]:
+    """
+    Mark an analysis that has been processing too long as failed.
+
+    Analyses run as in-process background tasks, which don't survive a
+    restart; without this a record left processing by a stopped process
+    would answer 409 to every retry and never finish.
+
+    Returns:
+        The record, updated if it was expired
+    """
+    if doc["status"] != AnalysisStatusEnum.PROCESSING:
+        return doc
+
+    started = doc.get("analysis_started_at")
+    timeout = timedelta(seconds=settings.analysis_timeout_seconds)
+    if started is not None and datetime.utcnow() - started < timeout:
+        return doc
+
+    updated = await store.update(
+        doc["document_id"],
+        status=AnalysisStatusEnum.FAILED,
+        error_message="Analysis was interrupted before it finished. Please retry."
+    )
+    return updated if updated is not None else doc
+
+
+async def require_document(
+    document_id: str,
+    store: DocumentStore = Depends(get_document_store)
+) -> dict[str, Any]:
+    """
+    Load the document record for the request's document_id.
+
+    Raises:
+        HTTPException: 404 if the document doesn't exist
+    """
+    doc = await store.get(document_id)
+
+    if doc is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={
+                "error": "DocumentNotFound",
+                "message": f"Document with ID '{document_id}' not found.",
+                "details": {"document_id": document_id}
+            }
+        )
+
+    return await expire_stale_analysis(store, doc)
+
+
+async def require_completed(
+    doc: dict[str, Any] = Depends(require_document)
+) -> dict[str, Any]:
+    """
+    Load the document record and require its analysis to be complete.
+
+    Raises:
+        HTTPException: 400 if the analysis hasn't completed
+    """
+    if doc["status"] != AnalysisStatusEnum.COMPLETED:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={
+                "error": "AnalysisNotComplete",
+                "message": f"Document analysis is not complete. Status: {doc['status'].value}",
+                "details": {
+                    "current_status": doc["status"].value,
+                    "error_message": doc.get("error_message")
+                }
+            }
+        )
+
+    return doc
@@ -4,18 +4,198 @@ LawVisor Risk API
 Direct access to risk data and regulation information.
 """
 
+import asyncio
 import logging
-from typing import Any
+import time
+from itertools import islice
+from typing import Any, AsyncIterator
 
-from fastapi import APIRouter, HTTPException, status
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from fastapi.responses import ORJSONResponse, StreamingResponse
 
-from api.upload import get_document_store
+from api.dependencies import require_completed, require_document
+from core.report_store import get_report_store
 from core.regulations import get_regulations_fetcher
+from core.risk_engine import ContractRiskReport
 from schemas import AnalysisStatusEnum, ErrorResponse
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/risk", tags=["Risk"])
 
+# Regulation texts change rarely; let browsers and CDNs reuse them for a day
+REGULATIONS_CACHE_CONTROL = "public, max-age=86400"
+
+# Completed reports never change, but they are per-user data
+REPORT_CACHE_CONTROL = "private, max-age=3600"
+
+
+# List elements (clause risks, categories) encoded per chunk when streaming
+REPORT_STREAM_BATCH = 64
+
+# Same options ORJSONResponse encodes with
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+# Encoded /risk/regulations body and its monotonic expiry time; rebuilt
+# daily, in step with the fetcher's regulation cache
+REGULATIONS_BODY_TTL_S = 24 * 60 * 60
+_regulations_body: tuple[float, bytes] | None = None
+
+
+async def _stream_report_json(report: ContractRiskReport) -> AsyncIterator[bytes]:
+    """
+    Encode a report's to_dict() form as JSON, a slice of each list at a time.
+    
+    Produces the same bytes as ORJSONResponse, but the client receives the
+    first chunk right away and a report with thousands of clauses is never
+    held as one JSON buffer. Each chunk is a single orjson call, so this
+    runs on the event loop.
+    """
+    separator = b"{"
+    for key, value in report.to_dict().items():
+        prefix = separator + orjson.dumps(key) + b":"
+        separator = b","
+        if not isinstance(value, list):
+            yield prefix + orjson.dumps(value, option=ORJSON_OPTIONS)
+            continue
+        
+        yield prefix + b"["
+        for start in range(0, len(value), REPORT_STREAM_BATCH):
+            # Encode the slice as a list and drop its brackets
+            chunk = orjson.dumps(
+                value[start:start + REPORT_STREAM_BATCH], option=ORJSON_OPTIONS
+            )[1:-1]
+            yield b"," + chunk if start else chunk
+        yield b"]"
+    yield b"}"
+
+
+def _report_cache_headers(etag: str | None) -> dict[str, str]:
+    """Caching headers for a completed report response."""
+    if not etag:
+        return {}
+    return {"ETag": etag, "Cache-Control": REPORT_CACHE_CONTROL}
+
+
+def _not_modified(request: Request, etag: str | None) -> bool:
+    """Check whether the client's If-None-Match already covers this report."""
+    if_none_match = request.headers.get("if-none-match")
+    if not etag or not if_none_match:
+        return False
+    tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return etag in tags or "*" in tags
+
+
+# === Regulations Endpoints ===
+# Registered before the /{document_id} routes, which would otherwise match
+# /regulations as a document ID
+
+@router.get(
+    "/regulations/gdpr/{article_number}",
+    summary="Get GDPR article",
+    description="Fetch a specific GDPR article and its requirements."
+)
+async def get_gdpr_article(article_number: str, response: Response) -> dict[str, Any]:
+    """Fetch a specific GDPR article."""
+    fetcher = get_regulations_fetcher()
+    article = await fetcher.fetch_gdpr_article(article_number)
+    
+    if not article:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={
+                "error": "ArticleNotFound",
+                "message": f"GDPR Article {article_number} not found."
+            }
+        )
+    
+    response.headers["Cache-Control"] = REGULATIONS_CACHE_CONTROL
+    return article.to_dict()
+
+
+@router.get(
+    "/regulations/sec/{regulation_id}",
+    summary="Get SEC regulation",
+    description="Fetch a specific SEC regulation and its requirements."
+)
+async def get_sec_regulation(regulation_id: str, response: Response) -> dict[str, Any]:
+    """Fetch a specific SEC regulation."""
+    fetcher = get_regulations_fetcher()
+    regulation = await fetcher.fetch_sec_regulation(regulation_id)
+    
+    if not regulation:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={
+                "error": "RegulationNotFound",
+                "message": f"SEC Regulation {regulation_id} not found."
+            }
+        )
+    
+    response.headers["Cache-Control"] = REGULATIONS_CACHE_CONTROL
+    return regulation.to_dict()
+
+
+@router.get(
+    "/regulations",
+    summary="List available regulations",
+    description="Get a list of all available regulations in the system."
+)
+async def list_regulations() -> Response:
+    """
+    List all available regulations.
+    
+    The listing only changes when the regulation cache is refreshed, so
+    the encoded body is reused until REGULATIONS_BODY_TTL_S passes.
+    """
+    global _regulations_body
+    
+    if _regulations_body is None or time.monotonic() >= _regulations_body[0]:
+        fetcher = get_regulations_fetcher()
+        
+        gdpr_set, sec_set = await asyncio.gather(
+            fetcher.fetch_all_gdpr_articles(),
+            fetcher.fetch_all_sec_regulations()
+        )
+        
+        body = orjson.dumps({
+            "gdpr": {
+                "name": gdpr_set.name,
+                "version": gdpr_set.version,
+                "article_count": len(gdpr_set.articles),
+                "articles": [
+                    {
+                        "article_number": a.article_number,
+                        "title": a.title,
+                        "regulation_id": a.regulation_id
+                    }
+                    for a in gdpr_set.articles
+                ]
+            },
+            "sec": {
+                "name": sec_set.name,
+                "version": sec_set.version,
+                "regulation_count": len(sec_set.articles),
+                "regulations": [
+                    {
+                        "regulation_id": a.regulation_id,
+                        "article_number": a.article_number,
+                        "title": a.title
+                    }
+                    for a in sec_set.articles
+                ]
+            }
+        })
+        _regulations_body = (time.monotonic() + REGULATIONS_BODY_TTL_S, body)
+    
+    return Response(
+        _regulations_body[1],
+        media_type="application/json",
+        headers={"Cache-Control": REGULATIONS_CACHE_CONTROL}
+    )
+
+
+# === Risk Report Endpoints ===
 
 @router.get(
     "/{document_id}",
@@ -26,7 +206,11 @@ router = APIRouter(prefix="/risk", tags=["Risk"])
     summary="Get risk report",
     description="Retrieve the full risk report for an analyzed document."
 )
-async def get_risk_report(document_id: str) -> dict[str, Any]:
+async def get_risk_report(
+    document_id: str,
+    request: Request,
+    doc: dict[str, Any] = Depends(require_completed)
+) -> StreamingResponse:
     """
     Get the complete risk report for a document.
     
@@ -37,33 +221,15 @@ async def get_risk_report(document_id: str) -> dict[str, Any]:
     - Regulatory citations
     - Recommendations
     """
-    store = get_document_store()
-    
-    if document_id not in store:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail={
-                "error": "DocumentNotFound",
-                "message": f"Document with ID '{document_id}' not found."
-            }
-        )
-    
-    doc = store[document_id]
-    
-    if doc["status"] != AnalysisStatusEnum.COMPLETED:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail={
-                "error": "AnalysisNotComplete",
-                "message": f"Document analysis is not complete. Status: {doc['status'].value}",
-                "details": {
-                    "current_status": doc["status"].value,
-                    "error_message": doc.get("error_message")
-                }
-            }
+    # Revalidation: skip loading and encoding the report entirely
+    etag = doc.get("report_etag")
+    if _not_modified(request, etag):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED,
+            headers=_report_cache_headers(etag)
         )
     
-    risk_report = doc.get("risk_report")
+    risk_report = await get_report_store().get(document_id)
     
     if not risk_report:
         raise HTTPException(
@@ -74,7 +240,12 @@ async def get_risk_report(document_id: str) -> dict[str, Any]:
             }
         )
     
-    return risk_report.to_dict()
+    # Stream the encoded report rather than going through jsonable_encoder
+    return StreamingResponse(
+        _stream_report_json(risk_report),
+        media_type="application/json",
+        headers=_report_cache_headers(etag)
+    )
 
 
 @router.get(
@@ -85,22 +256,25 @@ async def get_risk_report(document_id: str) -> dict[str, Any]:
     summary="Get risk summary",
     description="Get a condensed summary of the risk assessment."
 )
-async def get_risk_summary(document_id: str) -> dict[str, Any]:
+async def get_risk_summary(
+    document_id: str,
+    request: Request,
+    response: Response,
+    doc: dict[str, Any] = Depends(require_document)
+) -> dict[str, Any]:
     """Get a condensed risk summary."""
-    store = get_document_store()
+    report = None
+    if doc["status"] == AnalysisStatusEnum.COMPLETED:
+        etag = doc.get("report_etag")
+        if _not_modified(request, etag):
+            return Response(
+                status_code=status.HTTP_304_NOT_MODIFIED,
+                headers=_report_cache_headers(etag)
+            )
+        
+        report = await get_report_store().get(document_id)
     
-    if document_id not in store:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail={
-                "error": "DocumentNotFound",
-                "message": f"Document with ID '{document_id}' not found."
-            }
-        )
-    
-    doc = store[document_id]
-    
-    if doc["status"] != AnalysisStatusEnum.COMPLETED or not doc.get("risk_report"):
+    if report is None:
         return {
             "document_id": document_id,
             "status": doc["status"].value,
@@ -108,8 +282,7 @@ async def get_risk_summary(document_id: str) -> dict[str, Any]:
             "message": "Analysis not complete"
         }
     
-    report = doc["risk_report"]
-    
+    response.headers.update(_report_cache_headers(doc.get("report_etag")))
     return {
         "document_id": document_id,
         "overall_risk_score": round(report.overall_risk_score, 1),
@@ -117,38 +290,32 @@ async def get_risk_summary(document_id: str) -> dict[str, Any]:
         "total_clauses": report.total_clauses_analyzed,
         "high_risk_clauses": report.high_risk_clause_count,
         "summary": report.summary,
-        "top_violations": [
-            r.violated_regulations[0] 
-            for r in report.top_risks 
-            if r.violated_regulations
-        ][:5]
+        # top_risks is sorted by risk score, highest first
+        "top_violations": list(islice(
+            (
+                r.violated_regulations[0]
+                for r in report.top_risks
+                if r.violated_regulations
+            ),
+            5
+        ))
     }
 
 
 @router.get(
     "/{document_id}/clauses/{clause_id}",
+    dependencies=[Depends(require_document)],
     responses={
         404: {"model": ErrorResponse, "description": "Document or clause not found"}
     },
     summary="Get clause risk details",
     description="Get detailed risk information for a specific clause."
 )
-async def get_clause_risk(document_id: str, clause_id: str) -> dict[str, Any]:
+async def get_clause_risk(document_id: str, clause_id: str) -> ORJSONResponse:
     """Get detailed risk information for a specific clause."""
-    store = get_document_store()
+    report = await get_report_store().get(document_id)
     
-    if document_id not in store:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail={
-                "error": "DocumentNotFound",
-                "message": f"Document with ID '{document_id}' not found."
-            }
-        )
-    
-    doc = store[document_id]
-    
-    if not doc.get("risk_report"):
+    if report is None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail={
@@ -157,12 +324,10 @@ async def get_clause_risk(document_id: str, clause_id: str) -> dict[str, Any]:
             }
         )
     
-    report = doc["risk_report"]
-    
     # Find the clause
     for clause_risk in report.all_clause_risks:
         if clause_risk.clause_id == clause_id:
-            return clause_risk.to_dict()
+            return ORJSONResponse(clause_risk.to_dict())
     
     raise HTTPException(
         status_code=status.HTTP_404_NOT_FOUND,
@@ -171,91 +336,3 @@ async def get_clause_risk(document_id: str, clause_id: str) -> dict[str, Any]:
             "message": f"Clause with ID '{clause_id}' not found in document."
         }
     )
-
-
-# === Regulations Endpoints ===
-
-@router.get(
-    "/regulations/gdpr/{article_number}",
-    summary="Get GDPR article",
-    description="Fetch a specific GDPR article and its requirements."
-)
-async def get_gdpr_article(article_number: str) -> dict[str, Any]:
-    """Fetch a specific GDPR article."""
-    fetcher = get_regulations_fetcher()
-    article = await fetcher.fetch_gdpr_article(article_number)
-    
-    if not article:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail={
-                "error": "ArticleNotFound",
-                "message": f"GDPR Article {article_number} not found."
-            }
-        )
-    
-    return article.to_dict()
-
-
-@router.get(
-    "/regulations/sec/{regulation_id}",
-    summary="Get SEC regulation",
-    description="Fetch a specific SEC regulation and its requirements."
-)
-async def get_sec_regulation(regulation_id: str) -> dict[str, Any]:
-    """Fetch a specific SEC regulation."""
-    fetcher = get_regulations_fetcher()
-    regulation = await fetcher.fetch_sec_regulation(regulation_id)
-    
-    if not regulation:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail={
-                "error": "RegulationNotFound",
-                "message": f"SEC Regulation {regulation_id} not found."
-            }
-        )
-    
-    return regulation.to_dict()
-
-
-@router.get(
-    "/regulations",
-    summary="List available regulations",
-    description="Get a list of all available regulations in the system."
-)
-async def list_regulations() -> dict[str, Any]:
-    """List all available regulations."""
-    fetcher = get_regulations_fetcher()
-    
-    gdpr_set = await fetcher.fetch_all_gdpr_articles()
-    sec_set = await fetcher.fetch_all_sec_regulations()
-    
-    return {
-        "gdpr": {
-            "name": gdpr_set.name,
-            "version": gdpr_set.version,
-            "article_count": len(gdpr_set.articles),
-            "articles": [
-                {
-                    "article_number": a.article_number,
-                    "title": a.title,
-                    "regulation_id": a.regulation_id
-                }
-                for a in gdpr_set.articles
-            ]
-        },
-        "sec": {
-            "name": sec_set.name,
-            "version": sec_set.version,
-            "regulation_count": len(sec_set.articles),
-            "regulations": [
-                {
-                    "regulation_id": a.regulation_id,
-                    "article_number": a.article_number,
-                    "title": a.title
-                }
-                for a in sec_set.articles
-            ]
-        }
-    }
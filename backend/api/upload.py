@@ -4,26 +4,27 @@ LawVisor Upload API
 Handles document upload, validation, and storage.
 """
 
+import asyncio
 import hashlib
 import logging
 import uuid
 from datetime import datetime
 from pathlib import Path
-from typing import Annotated
+from typing import Annotated, Any, BinaryIO
 
-import aiofiles
-from fastapi import APIRouter, File, HTTPException, UploadFile, status
+from fastapi import APIRouter, Depends, File, HTTPException, Response, UploadFile, status
 
+from api.dependencies import require_document
 from core.config import get_settings
+from core.document_store import get_document_store
 from schemas import AnalysisStatusEnum, ErrorResponse, UploadResponse
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/upload", tags=["Upload"])
 settings = get_settings()
 
-# In-memory document store (replace with database in production)
-# Stores document metadata and processing status
-DOCUMENT_STORE: dict[str, dict] = {}
+# Large chunks keep the copy loop to a handful of syscalls per upload
+UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024
 
 
 def generate_document_id() -> str:
@@ -69,17 +70,69 @@ def validate_file(file: UploadFile) -> None:
         )
 
 
-async def save_file(file: UploadFile, document_id: str) -> tuple[Path, int]:
+def file_too_large(received_bytes: int) -> HTTPException:
+    """Build the 413 error for an oversized upload."""
+    return HTTPException(
+        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+        detail={
+            "error": "FileTooLarge",
+            "message": f"File exceeds maximum size of {settings.max_file_size_mb}MB.",
+            "details": {
+                "max_size_mb": settings.max_file_size_mb,
+                "received_bytes": received_bytes
+            }
+        }
+    )
+
+
+def _copy_to_disk(source: BinaryIO, file_path: Path) -> tuple[int, str | None]:
+    """
+    Copy an upload to disk, hashing it on the way.
+    
+    Returns:
+        Tuple of (bytes_read, sha256_hex). The hash is None if the size
+        limit was exceeded, in which case the partial file is removed.
+    """
+    file_size = 0
+    content_hash = hashlib.sha256()
+    
+    with open(file_path, 'wb') as out_file:
+        while chunk := source.read(UPLOAD_CHUNK_SIZE):
+            file_size += len(chunk)
+            
+            # Check file size limit
+            if file_size > settings.max_file_size_bytes:
+                break
+            
+            content_hash.update(chunk)
+            out_file.write(chunk)
+        else:
+            return file_size, content_hash.hexdigest()
+    
+    # Clean up partial file
+    file_path.unlink(missing_ok=True)
+    return file_size, None
+
+
+async def save_file(file: UploadFile, document_id: str) -> tuple[Path, int, str]:
     """
     Save uploaded file to disk.
     
+    The copy runs in a worker thread so the event loop isn't bounced once
+    per chunk. The SHA-256 of the content is computed while copying so
+    duplicate uploads can be detected without re-reading the file.
+    
     Args:
         file: Uploaded file
         document_id: Unique document identifier
         
     Returns:
-        Tuple of (file_path, file_size_bytes)
+        Tuple of (file_path, file_size_bytes, sha256_hex)
     """
+    # Reject oversized uploads before writing anything when the size is known
+    if file.size is not None and file.size > settings.max_file_size_bytes:
+        raise file_too_large(file.size)
+    
     # Ensure upload directory exists
     upload_dir = settings.upload_dir
     upload_dir.mkdir(parents=True, exist_ok=True)
@@ -89,30 +142,34 @@ async def save_file(file: UploadFile, document_id: str) -> tuple[Path, int]:
     file_path = upload_dir / safe_filename
     
     # Stream file to disk
-    file_size = 0
-    async with aiofiles.open(file_path, 'wb') as out_file:
-        while chunk := await file.read(1024 * 1024):  # 1MB chunks
-            file_size += len(chunk)
-            
-            # Check file size limit
-            if file_size > settings.max_file_size_bytes:
-                # Clean up partial file
-                file_path.unlink(missing_ok=True)
-                raise HTTPException(
-                    status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
-                    detail={
-                        "error": "FileTooLarge",
-                        "message": f"File exceeds maximum size of {settings.max_file_size_mb}MB.",
-                        "details": {
-                            "max_size_mb": settings.max_file_size_mb,
-                            "received_bytes": file_size
-                        }
-                    }
-                )
-            
-            await out_file.write(chunk)
+    await file.seek(0)
+    file_size, content_hash = await asyncio.to_thread(
+        _copy_to_disk, file.file, file_path
+    )
+    if content_hash is None:
+        raise file_too_large(file_size)
+    
+    return file_path, file_size, content_hash
+
+
+async def find_duplicate(content_hash: str) -> dict | None:
+    """
+    Find a previously uploaded document with identical content.
+    
+    Returns:
+        The existing document record, or None if there is no usable match
+    """
+    store = get_document_store()
+    
+    existing_id = await store.find_by_hash(content_hash)
+    if existing_id is None:
+        return None
+    
+    doc = await store.get(existing_id)
+    if doc is None or not Path(doc["file_path"]).exists():
+        return None
     
-    return file_path, file_size
+    return doc
 
 
 @router.post(
@@ -131,12 +188,17 @@ async def save_file(file: UploadFile, document_id: str) -> tuple[Path, int]:
     The document will be validated and stored. Once uploaded, use the 
     returned `document_id` to initiate analysis via the `/analyze/{document_id}` endpoint.
     
+    Re-uploading a file with identical content returns the existing
+    `document_id` (and its current status) with `200 OK`, so a completed
+    analysis is reused instead of being run again.
+    
     **Accepted file types:** PDF only
     **Maximum file size:** 50MB
     """
 )
 async def upload_document(
-    file: Annotated[UploadFile, File(description="PDF document to upload")]
+    file: Annotated[UploadFile, File(description="PDF document to upload")],
+    response: Response
 ) -> UploadResponse:
     """
     Upload a PDF legal document for analysis.
@@ -152,22 +214,40 @@ async def upload_document(
     document_id = generate_document_id()
     
     # Save file
-    file_path, file_size = await save_file(file, document_id)
+    file_path, file_size, content_hash = await save_file(file, document_id)
+    
+    # Reuse an existing document with the same content
+    existing = await find_duplicate(content_hash)
+    if existing is not None:
+        file_path.unlink(missing_ok=True)
+        logger.info(f"Duplicate upload of {existing['document_id']}, reusing existing document")
+        
+        response.status_code = status.HTTP_200_OK
+        return UploadResponse(
+            document_id=existing["document_id"],
+            filename=existing["filename"],
+            file_size_bytes=existing["file_size_bytes"],
+            upload_timestamp=existing["upload_timestamp"],
+            status=existing["status"],
+            message="Identical document already uploaded. Reusing existing document."
+        )
     
     # Store document metadata
     upload_timestamp = datetime.utcnow()
-    DOCUMENT_STORE[document_id] = {
+    store = get_document_store()
+    await store.set(document_id, {
         "document_id": document_id,
         "filename": file.filename,
         "file_path": str(file_path),
         "file_size_bytes": file_size,
+        "content_hash": content_hash,
         "upload_timestamp": upload_timestamp,
         "status": AnalysisStatusEnum.PENDING,
         "analysis_started_at": None,
         "analysis_completed_at": None,
-        "risk_report": None,
         "error_message": None
-    }
+    })
+    await store.index_hash(content_hash, document_id)
     
     logger.info(f"Document uploaded: {document_id} ({file_size} bytes)")
     
@@ -186,19 +266,8 @@ async def upload_document(
     summary="Get upload status",
     description="Check the status of an uploaded document."
 )
-async def get_upload_status(document_id: str):
+async def get_upload_status(doc: dict[str, Any] = Depends(require_document)):
     """Get the status of an uploaded document."""
-    if document_id not in DOCUMENT_STORE:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail={
-                "error": "DocumentNotFound",
-                "message": f"Document with ID '{document_id}' not found.",
-                "details": {"document_id": document_id}
-            }
-        )
-    
-    doc = DOCUMENT_STORE[document_id]
     return {
         "document_id": doc["document_id"],
         "filename": doc["filename"],
@@ -206,8 +275,3 @@ async def get_upload_status(document_id: str):
         "upload_timestamp": doc["upload_timestamp"],
         "file_size_bytes": doc["file_size_bytes"]
     }
-
-
-def get_document_store() -> dict:
-    """Get the document store (for use by other modules)."""
-    return DOCUMENT_STORE
@@ -15,19 +15,30 @@ import asyncio
 import hashlib
 import json
 import logging
-import re
-from dataclasses import dataclass
-from datetime import datetime
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
 from enum import Enum
-from typing import Any
+from statistics import fmean
+from typing import Any, AsyncIterator
 
-from openai import AsyncOpenAI
+import orjson
+import regex
+from diskcache import Cache
+from openai import RateLimitError
+from tenacity import (
+    retry,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_random_exponential,
+)
 
 from core.config import CLAUSE_TYPES, get_settings
+from core.llm_client import get_llm_client
 from core.ocr import DocumentContent
+from core.rate_limit import AsyncRateLimiter
 
 logger = logging.getLogger(__name__)
-settings = get_settings()
 
 
 class ClauseType(str, Enum):
@@ -53,7 +64,34 @@ class ClauseType(str, Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
+# Clause type lookup keyed by normalized name, including the aliases
+# LLMs commonly return in place of the canonical values
+CLAUSE_TYPE_ALIASES: dict[str, ClauseType] = {
+    **{ct.value: ct for ct in ClauseType},
+    "ip": ClauseType.INTELLECTUAL_PROPERTY,
+    "privacy": ClauseType.DATA_PROTECTION,
+    "data_privacy": ClauseType.DATA_PROTECTION,
+    "limitation_of_liability": ClauseType.LIABILITY,
+    "indemnity": ClauseType.INDEMNIFICATION,
+    "warranty": ClauseType.WARRANTIES,
+    "payment": ClauseType.PAYMENT_TERMS,
+    "arbitration": ClauseType.DISPUTE_RESOLUTION,
+    "choice_of_law": ClauseType.GOVERNING_LAW,
+    "notice": ClauseType.NOTICES,
+}
+
+
+def parse_clause_type(value: str) -> ClauseType:
+    """Map a clause type name (any case, spaces or hyphens) to a ClauseType."""
+    key = value.strip().lower().replace(" ", "_").replace("-", "_")
+    return CLAUSE_TYPE_ALIASES.get(key, ClauseType.UNKNOWN)
+
+
+# Characters of clause text shown in previews (risk report, API responses)
+TEXT_PREVIEW_CHARS = 300
+
+
+@dataclass(slots=True, frozen=True)
 class ExtractedClause:
     """A single extracted and classified clause."""
     clause_id: str
@@ -67,25 +105,21 @@ class ExtractedClause:
     confidence: float
     sub_clauses: list['ExtractedClause']
     metadata: dict[str, Any]
+    text_preview: str = field(init=False)  # raw_text, cut to TEXT_PREVIEW_CHARS
     
-    def to_dict(self) -> dict[str, Any]:
-        """Convert to dictionary for JSON serialization."""
-        return {
-            "clause_id": self.clause_id,
-            "clause_type": self.clause_type.value,
-            "title": self.title,
-            "raw_text": self.raw_text,
-            "normalized_text": self.normalized_text,
-            "page_number": self.page_number,
-            "start_position": self.start_position,
-            "end_position": self.end_position,
-            "confidence": self.confidence,
-            "sub_clauses": [sc.to_dict() for sc in self.sub_clauses],
-            "metadata": self.metadata
-        }
+    def __post_init__(self):
+        # Built once per clause; the ellipsis only marks text that was cut
+        preview = self.raw_text
+        if len(preview) > TEXT_PREVIEW_CHARS:
+            preview = preview[:TEXT_PREVIEW_CHARS] + "..."
+        object.__setattr__(self, "text_preview", preview)
+    
+    def to_json(self) -> bytes:
+        """Serialize to JSON, including sub-clauses."""
+        return orjson.dumps(self)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ExtractionResult:
     """Complete clause extraction result."""
     document_id: str
@@ -96,17 +130,85 @@ class ExtractionResult:
     average_confidence: float
     warnings: list[str]
     
-    def to_dict(self) -> dict[str, Any]:
-        """Convert to dictionary for JSON serialization."""
-        return {
-            "document_id": self.document_id,
-            "extracted_at": self.extracted_at.isoformat(),
-            "clauses": [c.to_dict() for c in self.clauses],
-            "total_clauses": self.total_clauses,
-            "clause_type_distribution": self.clause_type_distribution,
-            "average_confidence": self.average_confidence,
-            "warnings": self.warnings
-        }
+    def to_json(self) -> bytes:
+        """
+        Serialize to JSON.
+        
+        orjson encodes the dataclass tree, enums, and datetimes natively,
+        so the whole result is written in one pass without building
+        intermediate dicts.
+        """
+        return orjson.dumps(self)
+
+
+# Clause/section header patterns, matched at the start of each line
+# (leading indentation allowed) in a single MULTILINE sweep over a page.
+# Uses the `regex` module for Unicode property classes so non-English
+# headers (ÜBEREINKUNFT, RÉSILIATION, § 3) are recognized too. Whitespace
+# inside a header is [^\S\n] so no alternative can match across lines.
+SECTION_HEADER_RE = regex.compile(
+    r'^[ \t]*(?:'
+    r'(?:ARTICLE|Article)[^\S\n]+[\p{N}IVXLCDM]+[.:]'
+    r'|(?:SECTION|Section)[^\S\n]+[\p{N}.]+[.:]'
+    r'|(?:§|Art\.)[^\S\n]*\p{N}[\p{N}.]*'
+    r'|\p{N}+\.\p{N}*[^\S\n]+\p{Lu}'
+    r'|\p{Lu}(?:\p{Lu}|[^\S\n]){5,}$'  # All caps headers
+    r'|\(\p{Ll}\)[^\S\n]'  # Sub-clause markers
+    r')',
+    regex.MULTILINE
+)
+
+# Segments below these thresholds (page numbers, table-of-contents lines,
+# stray headers) never contain a clause and aren't worth an LLM call
+MIN_SEGMENT_WORDS = 5
+MIN_SEGMENT_ALPHA_RATIO = 0.5
+
+
+# Headings of boilerplate clauses that can be classified without the LLM.
+# Each must open the section (after any article/section numbering) and be
+# followed by heading punctuation or a line break
+_HEADING_PREFIX = (
+    r'^[ \t]*(?:(?:article|section|§)[ \t]*)?'
+    r'(?:[\p{N}ivxlcdm]+(?:[.):][ \t]*|[ \t]+))*'
+)
+_HEADING_END = r'(?=[ \t]*(?:[.:\-—]|\n|$))'
+RULE_CLAUSE_HEADINGS: dict[ClauseType, regex.Pattern] = {
+    clause_type: regex.compile(
+        _HEADING_PREFIX + f"(?:{heading})" + _HEADING_END,
+        regex.IGNORECASE
+    )
+    for clause_type, heading in {
+        ClauseType.GOVERNING_LAW: r'governing[ \t]+law|choice[ \t]+of[ \t]+law',
+        ClauseType.COUNTERPARTS: r'counterparts',
+        ClauseType.NOTICES: r'notices?',
+        ClauseType.SEVERABILITY: r'severability',
+        ClauseType.ENTIRE_AGREEMENT: r'entire[ \t]+agreement',
+    }.items()
+}
+RULE_CLAUSE_CONFIDENCE = 0.95
+RULE_HEADING_WINDOW = 120
+
+# Sub-clauses nested deeper than this are dropped
+MAX_SUB_CLAUSE_DEPTH = 8
+
+
+def match_rule_clause_type(text: str) -> ClauseType | None:
+    """Classify a section by its boilerplate heading, if it has one."""
+    head = text[:RULE_HEADING_WINDOW]
+    for clause_type, pattern in RULE_CLAUSE_HEADINGS.items():
+        if pattern.match(head):
+            return clause_type
+    return None
+
+
+def looks_like_clause(text: str) -> bool:
+    """Cheap check that a segment has enough prose to hold a clause."""
+    if len(text.split()) < MIN_SEGMENT_WORDS:
+        return False
+    
+    visible = [c for c in text if not c.isspace()]
+    alpha = sum(c.isalpha() for c in visible)
+    return alpha / len(visible) >= MIN_SEGMENT_ALPHA_RATIO
 
 
 # System prompt for clause extraction
@@ -146,6 +248,49 @@ Output your response as a JSON array of clauses with this structure:
     "warnings": []
 }}"""
 
+# Formatted once; the clause type list is fixed at import time
+CLAUSE_EXTRACTION_SYSTEM_PROMPT = CLAUSE_EXTRACTION_PROMPT.format(
+    clause_types=", ".join(CLAUSE_TYPES)
+)
+
+# Structured output schema for clause extraction. Enforced server-side
+# (strict mode), so every clause has every key and a known clause type
+CLAUSE_EXTRACTION_SCHEMA = {
+    "name": "clause_extraction",
+    "strict": True,
+    "schema": {
+        "type": "object",
+        "properties": {
+            "clauses": {"type": "array", "items": {"$ref": "#/$defs/clause"}},
+            "warnings": {"type": "array", "items": {"type": "string"}}
+        },
+        "required": ["clauses", "warnings"],
+        "additionalProperties": False,
+        "$defs": {
+            "clause": {
+                "type": "object",
+                "properties": {
+                    "clause_number": {"type": "string"},
+                    "clause_type": {"type": "string", "enum": CLAUSE_TYPES},
+                    "title": {"type": "string"},
+                    "raw_text": {"type": "string"},
+                    "normalized_text": {"type": "string"},
+                    "confidence": {"type": "number"},
+                    "sub_clauses": {
+                        "type": "array",
+                        "items": {"$ref": "#/$defs/clause"}
+                    }
+                },
+                "required": [
+                    "clause_number", "clause_type", "title", "raw_text",
+                    "normalized_text", "confidence", "sub_clauses"
+                ],
+                "additionalProperties": False
+            }
+        }
+    }
+}
+
 
 class ClauseExtractor:
     """
@@ -159,14 +304,15 @@ class ClauseExtractor:
     def __init__(self):
         self.settings = get_settings()
         self._init_llm_client()
+        # Responses keyed by the full request, so repeated boilerplate
+        # batches across contracts skip the LLM round trip
+        self._llm_cache = Cache(str(self.settings.llm_cache_dir))
         
     def _init_llm_client(self):
         """Initialize the OpenAI LLM client."""
-        self.llm_client = AsyncOpenAI(
-            api_key=self.settings.openai_api_key,
-            timeout=300.0  # 5 minutes per request
-        )
+        self.llm_client = get_llm_client()
         self.model = self.settings.llm_model or "gpt-4o-mini"
+        self._rate_limiter = AsyncRateLimiter(self.settings.llm_requests_per_minute)
     
     async def extract_clauses(
         self, 
@@ -181,29 +327,93 @@ class ClauseExtractor:
         Returns:
             ExtractionResult with all classified clauses
         """
+        extracted_at = datetime.now(timezone.utc)
+        batches = [
+            batch async for batch in self.iter_clause_batches(document, extracted_at)
+        ]
+        return self.build_result(document.document_id, batches, extracted_at)
+    
+    async def iter_clause_batches(
+        self,
+        document: DocumentContent,
+        extracted_at: datetime | None = None
+    ) -> AsyncIterator[tuple[int, list[ExtractedClause], list[str]]]:
+        """
+        Extract clauses, yielding each LLM batch as soon as it completes.
+        
+        Lets callers start work on early clauses while later batches are
+        still with the LLM. Batches arrive in completion order; clauses whose
+        text was already yielded by an earlier batch are dropped.
+        
+        Args:
+            document: Processed document content from OCR
+            extracted_at: Timezone-aware timestamp recorded on every clause;
+                defaults to now (UTC). Pass the same value to build_result
+            
+        Yields:
+            Tuple of (batch_index, validated clauses, warnings), where
+            batch_index orders batches by their position in the document
+        """
         logger.info(f"Extracting clauses from document: {document.document_id}")
         
-        # Step 1: Pre-segment the document using rule-based patterns
-        segments = self._presegment_document(document)
+        # One timestamp for every clause in this extraction
+        if extracted_at is None:
+            extracted_at = datetime.now(timezone.utc)
+        extracted_at_iso = extracted_at.isoformat()
+        
+        # Step 1: Pre-segment the document using rule-based patterns.
+        # Runs in a worker thread; the regex scan releases the GIL, so a
+        # long contract doesn't stall other requests on the event loop
+        segments = await asyncio.to_thread(self._presegment_document, document)
         logger.info(f"Pre-segmented into {len(segments)} sections")
         
-        # Step 2: Process each segment with LLM for classification
-        all_clauses = []
-        all_warnings = []
+        clause_segments = [s for s in segments if looks_like_clause(s["text"])]
+        if len(clause_segments) < len(segments):
+            logger.info(
+                f"Skipped {len(segments) - len(clause_segments)} sections "
+                "with no clause text"
+            )
+        segments = clause_segments
         
-        # Process in batches concurrently
-        batch_size = 5
+        # Step 2: Classify boilerplate sections by heading; the rest go to
+        # the LLM. Runs of consecutive rule-classified sections form one
+        # batch each, keyed by position so document order is kept
+        rule_batches: list[tuple[int, list[ExtractedClause]]] = []
+        llm_segments: list[tuple[int, dict[str, Any]]] = []
+        for position, segment in enumerate(segments):
+            clause_type = match_rule_clause_type(segment["text"])
+            if clause_type is None:
+                llm_segments.append((position, segment))
+                continue
+            
+            clause = self._build_rule_clause(
+                segment, clause_type, document.document_id, position, extracted_at_iso
+            )
+            if rule_batches and rule_batches[-1][0] + len(rule_batches[-1][1]) == position:
+                rule_batches[-1][1].append(clause)
+            else:
+                rule_batches.append((position, [clause]))
+        
+        if len(llm_segments) < len(segments):
+            logger.info(
+                f"Classified {len(segments) - len(llm_segments)} sections by heading"
+            )
+        
+        # Step 3: Process remaining segments with LLM for classification
+        # Process in small batches so more requests run side by side
+        batch_size = self.settings.clause_batch_size
         batches = []
-        for i in range(0, len(segments), batch_size):
-            batch_segments = segments[i:i + batch_size]
+        for i in range(0, len(llm_segments), batch_size):
+            batch_segments = llm_segments[i:i + batch_size]
             batch_text = "\n\n---\n\n".join(
-                f"[Page {s['page']}]\n{s['text']}" for s in batch_segments
+                f"[Page {s['page']}]\n{s['text']}" for _, s in batch_segments
             )
-            batches.append((batch_text, i))
+            batches.append((batch_text, batch_segments[0][0]))
 
-        logger.info(f"Processing {len(batches)} batches concurrently (limit: 5)...")
+        max_concurrency = self.settings.llm_max_concurrency
+        logger.info(f"Processing {len(batches)} batches concurrently (limit: {max_concurrency})...")
         
-        semaphore = asyncio.Semaphore(5)  # Limit concurrent requests to avoid rate limits
+        semaphore = asyncio.Semaphore(max_concurrency)
         
         async def process_batch(batch_text: str, index: int, batch_num: int, total: int):
             async with semaphore:
@@ -211,34 +421,61 @@ class ClauseExtractor:
                 clauses, warnings = await self._extract_clauses_with_llm(
                     batch_text, 
                     document.document_id,
+                    extracted_at_iso,
                     start_index=index
                 )
                 logger.info(f"Batch {batch_num}/{total} complete. Found {len(clauses)} clauses.")
-                return clauses, warnings
+                return index, clauses, warnings
 
         tasks = [
-            process_batch(b[0], b[1], idx + 1, len(batches)) 
+            asyncio.create_task(process_batch(b[0], b[1], idx + 1, len(batches)))
             for idx, b in enumerate(batches)
         ]
         
-        results = await asyncio.gather(*tasks)
+        # Step 4: Post-process and validate each batch as it lands
+        seen_texts: set[str] = set()
+        try:
+            for position, clauses in rule_batches:
+                yield position, self._validate_clauses(clauses, seen_texts), []
+            
+            for next_batch in asyncio.as_completed(tasks):
+                batch_index, clauses, warnings = await next_batch
+                
+                fresh_clauses = self._validate_clauses(clauses, seen_texts)
+                yield batch_index, fresh_clauses, warnings
+        finally:
+            # Caller stopped early or failed; don't leave LLM calls running
+            for task in tasks:
+                task.cancel()
+    
+    def build_result(
+        self,
+        document_id: str,
+        batches: list[tuple[int, list[ExtractedClause], list[str]]],
+        extracted_at: datetime
+    ) -> ExtractionResult:
+        """
+        Assemble an ExtractionResult from batches yielded by
+        iter_clause_batches, restoring document order.
         
-        for clauses, warnings in results:
+        extracted_at should be the timestamp the batches were extracted
+        with, so the result and its clauses agree.
+        """
+        all_clauses = []
+        all_warnings = []
+        for _, clauses, warnings in sorted(batches, key=lambda b: b[0]):
             all_clauses.extend(clauses)
             all_warnings.extend(warnings)
         
-        # Step 3: Post-process and validate
-        validated_clauses = self._validate_clauses(all_clauses)
-        
-        # Step 4: Calculate statistics
-        type_distribution = self._calculate_type_distribution(validated_clauses)
-        avg_confidence = self._calculate_average_confidence(validated_clauses)
+        # Calculate statistics
+        type_distribution = self._calculate_type_distribution(all_clauses)
+        avg_confidence = self._calculate_average_confidence(all_clauses)
         
         return ExtractionResult(
-            document_id=document.document_id,
-            extracted_at=datetime.utcnow(),
-            clauses=validated_clauses,
-            total_clauses=len(validated_clauses),
+            document_id=document_id,
+            extracted_at=extracted_at,
+            clauses=all_clauses,
+            total_clauses=len(all_clauses),
             clause_type_distribution=type_distribution,
             average_confidence=avg_confidence,
             warnings=all_warnings
@@ -258,49 +495,30 @@ class ClauseExtractor:
         """
         segments = []
         
-        # Patterns for clause/section detection
-        patterns = [
-            r'^(?:ARTICLE|Article)\s+[\dIVXLCDM]+[.:]\s*',
-            r'^(?:SECTION|Section)\s+[\d.]+[.:]\s*',
-            r'^\d+\.\d*\s+[A-Z]',
-            r'^[A-Z][A-Z\s]{5,}$',  # All caps headers
-            r'^\([a-z]\)\s+',  # Sub-clause markers
-        ]
-        
-        combined_pattern = '|'.join(f'({p})' for p in patterns)
-        
         for page in document.pages:
             text = page.text
-            lines = text.split('\n')
-            
-            current_segment = []
-            segment_start = 0
             
-            for i, line in enumerate(lines):
-                # Check if line matches a section start pattern
-                if re.match(combined_pattern, line.strip()):
-                    # Save previous segment if exists
-                    if current_segment:
-                        segments.append({
-                            "page": page.page_number,
-                            "text": '\n'.join(current_segment),
-                            "start_line": segment_start,
-                            "end_line": i - 1
-                        })
-                    
-                    current_segment = [line]
-                    segment_start = i
-                else:
-                    current_segment.append(line)
+            # Segment boundaries: the page start plus every header line start
+            starts = [
+                m.start()
+                for m in SECTION_HEADER_RE.finditer(text, concurrent=True)
+            ]
+            if not starts or starts[0] != 0:
+                starts.insert(0, 0)
+            ends = starts[1:] + [len(text) + 1]
             
-            # Add final segment
-            if current_segment:
+            start_line = 0
+            for start, end in zip(starts, ends):
+                # Drop the newline that separates this segment from the next
+                segment_text = text[start:end - 1]
+                end_line = start_line + segment_text.count('\n')
                 segments.append({
                     "page": page.page_number,
-                    "text": '\n'.join(current_segment),
-                    "start_line": segment_start,
-                    "end_line": len(lines) - 1
+                    "text": segment_text,
+                    "start_line": start_line,
+                    "end_line": end_line
                 })
+                start_line = end_line + 1
         
         return segments
     
@@ -308,6 +526,7 @@ class ClauseExtractor:
         self,
         text: str,
         document_id: str,
+        extracted_at: str,
         start_index: int = 0
     ) -> tuple[list[ExtractedClause], list[str]]:
         """
@@ -317,87 +536,175 @@ class ClauseExtractor:
             Tuple of (extracted clauses, warnings)
         """
         # Prepare the prompt
-        system_prompt = CLAUSE_EXTRACTION_PROMPT.format(
-            clause_types=", ".join(CLAUSE_TYPES)
-        )
-        
         user_prompt = f"""Analyze the following legal document text and extract all clauses:
 
 {text}
 
 Provide your response as valid JSON only, no additional text."""
 
+        request = {
+            "model": self.model,
+            "messages": [
+                {"role": "system", "content": CLAUSE_EXTRACTION_SYSTEM_PROMPT},
+                {"role": "user", "content": user_prompt}
+            ],
+            "response_format": {
+                "type": "json_schema",
+                "json_schema": CLAUSE_EXTRACTION_SCHEMA
+            },
+            "temperature": 0.1,
+            "max_tokens": 4000
+        }
+        # Every request parameter is part of the key, so a prompt, schema,
+        # or model change never serves a stale response
+        cache_key = hashlib.sha256(
+            json.dumps(request, sort_keys=True).encode()
+        ).hexdigest()
+
         try:
-            logger.info(f"Using OpenAI LLM ({self.model}) to extract clauses from batch...")
-            # Use OpenAI for clause extraction
-            response = await self.llm_client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt}
-                ],
-                response_format={"type": "json_object"},
-                temperature=0.1,
-                max_tokens=4000
-            )
-            result_text = response.choices[0].message.content
+            result_text = self._llm_cache.get(cache_key)
+            from_cache = result_text is not None
             
-            # Parse JSON response
-            result = json.loads(result_text)
+            if from_cache:
+                logger.info("Using cached LLM response for clause extraction batch")
+            else:
+                logger.info(f"Using OpenAI LLM ({self.model}) to extract clauses from batch...")
+                # Use OpenAI for clause extraction
+                result_text = await self._create_completion(request)
             
-            clauses = []
-            for i, clause_data in enumerate(result.get("clauses", [])):
-                clause = self._parse_clause_data(
-                    clause_data, 
-                    document_id, 
-                    start_index + i
-                )
-                if clause:
-                    clauses.append(clause)
+            # Parse JSON response in a worker thread; with many batches in
+            # flight, the loop keeps reading other responses meanwhile
+            clauses, warnings = await asyncio.to_thread(
+                self._parse_llm_response,
+                result_text,
+                document_id,
+                start_index,
+                extracted_at
+            )
             
-            warnings = result.get("warnings", [])
+            # Only cache responses that parsed
+            if not from_cache:
+                self._llm_cache.set(
+                    cache_key,
+                    result_text,
+                    expire=self.settings.cache_ttl_seconds
+                )
             
             return clauses, warnings
             
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
+            # Structured outputs can still be cut off at max_tokens
             logger.error(f"Failed to parse LLM response: {e}")
             return [], [f"JSON parsing error: {str(e)}"]
         except Exception as e:
             logger.error(f"LLM extraction error: {e}")
             return [], [f"Extraction error: {str(e)}"]
     
+    def _parse_llm_response(
+        self,
+        result_text: str,
+        document_id: str,
+        start_index: int,
+        extracted_at: str
+    ) -> tuple[list[ExtractedClause], list[str]]:
+        """Parse a clause extraction response into clauses and warnings."""
+        result = orjson.loads(result_text)
+        
+        clauses = []
+        for i, clause_data in enumerate(result.get("clauses", [])):
+            clause = self._parse_clause_data(
+                clause_data, 
+                document_id, 
+                start_index + i,
+                extracted_at
+            )
+            if clause:
+                clauses.append(clause)
+        
+        return clauses, result.get("warnings", [])
+    
+    @retry(
+        retry=retry_if_exception_type(RateLimitError),
+        wait=wait_random_exponential(multiplier=1, max=30),
+        stop=stop_after_attempt(5),
+        reraise=True
+    )
+    async def _create_completion(self, request: dict[str, Any]) -> str:
+        """
+        Send a chat completion, paced and retried on rate limiting.
+        
+        The response is streamed so tokens are received while the model is
+        still generating, rather than in one burst at the end.
+        
+        Returns:
+            The full response content
+        """
+        await self._rate_limiter.acquire()
+        stream = await self.llm_client.chat.completions.create(
+            **request, stream=True
+        )
+        
+        parts = []
+        async for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                parts.append(chunk.choices[0].delta.content)
+        return "".join(parts)
+    
     def _parse_clause_data(
         self,
         data: dict[str, Any],
         document_id: str,
-        index: int
+        index: int,
+        extracted_at: str
     ) -> ExtractedClause | None:
-        """Parse raw clause data into ExtractedClause object."""
+        """
+        Parse raw clause data, including nested sub-clauses, into an
+        ExtractedClause.
+        
+        Sub-clauses are walked iteratively and identified by their path
+        from the top-level clause (e.g. "012.0.3"), so IDs stay unique at
+        any depth. Nesting deeper than MAX_SUB_CLAUSE_DEPTH is dropped.
+        """
+        path = f"{index:03d}"
+        root = self._build_clause(data, document_id, path, extracted_at)
+        if root is None:
+            return None
+        
+        stack = [(root, data, path, 0)]
+        while stack:
+            parent, parent_data, parent_path, depth = stack.pop()
+            if depth >= MAX_SUB_CLAUSE_DEPTH:
+                continue
+            
+            for j, sub_data in enumerate(parent_data.get("sub_clauses") or []):
+                sub_path = f"{parent_path}.{j}"
+                sub_clause = self._build_clause(
+                    sub_data, document_id, sub_path, extracted_at
+                )
+                if sub_clause:
+                    parent.sub_clauses.append(sub_clause)
+                    stack.append((sub_clause, sub_data, sub_path, depth + 1))
+        
+        return root
+    
+    def _build_clause(
+        self,
+        data: dict[str, Any],
+        document_id: str,
+        path: str,
+        extracted_at: str
+    ) -> ExtractedClause | None:
+        """Build a single clause (without sub-clauses) from raw clause data."""
         try:
             # Generate unique clause ID
             clause_id = self._generate_clause_id(
                 document_id, 
                 data.get("raw_text", ""),
-                index
+                path
             )
             
             # Map clause type
-            clause_type_str = data.get("clause_type", "unknown").lower()
-            try:
-                clause_type = ClauseType(clause_type_str)
-            except ValueError:
-                clause_type = ClauseType.UNKNOWN
-            
-            # Parse sub-clauses recursively
-            sub_clauses = []
-            for j, sub_data in enumerate(data.get("sub_clauses", [])):
-                sub_clause = self._parse_clause_data(
-                    sub_data, 
-                    document_id, 
-                    index * 100 + j
-                )
-                if sub_clause:
-                    sub_clauses.append(sub_clause)
+            clause_type = parse_clause_type(data.get("clause_type") or "unknown")
             
             return ExtractedClause(
                 clause_id=clause_id,
@@ -409,47 +716,86 @@ Provide your response as valid JSON only, no additional text."""
                 start_position=data.get("start_position", 0),
                 end_position=data.get("end_position", 0),
                 confidence=float(data.get("confidence", 0.5)),
-                sub_clauses=sub_clauses,
+                sub_clauses=[],
                 metadata={
-                    "clause_number": data.get("clause_number", f"C{index:03d}"),
-                    "extracted_at": datetime.utcnow().isoformat()
+                    "clause_number": data.get("clause_number", f"C{path}"),
+                    "extracted_at": extracted_at
                 }
             )
         except Exception as e:
             logger.warning(f"Failed to parse clause data: {e}")
             return None
     
+    def _build_rule_clause(
+        self,
+        segment: dict[str, Any],
+        clause_type: ClauseType,
+        document_id: str,
+        index: int,
+        extracted_at: str
+    ) -> ExtractedClause:
+        """Build a clause for a section classified by its heading."""
+        text = segment["text"].strip()
+        return ExtractedClause(
+            clause_id=self._generate_clause_id(document_id, text, f"{index:03d}"),
+            clause_type=clause_type,
+            title=clause_type.value.replace("_", " ").title(),
+            raw_text=text,
+            normalized_text=" ".join(text.split()),
+            page_number=segment["page"],
+            start_position=0,
+            end_position=len(text),
+            confidence=RULE_CLAUSE_CONFIDENCE,
+            sub_clauses=[],
+            metadata={
+                "clause_number": f"C{index:03d}",
+                "extracted_at": extracted_at,
+                "source": "rule"
+            }
+        )
+    
     def _generate_clause_id(
         self, 
         document_id: str, 
         text: str, 
-        index: int
+        path: str
     ) -> str:
-        """Generate a unique, deterministic clause ID."""
-        content = f"{document_id}:{index}:{text[:100]}"
-        hash_value = hashlib.sha256(content.encode()).hexdigest()[:12]
+        """Generate a unique, deterministic clause ID from the clause's path."""
+        content = f"{document_id}:{path}:{text[:100]}"
+        # A 6-byte BLAKE2b digest is the 12 hex chars we need, with no
+        # truncation, and is cheaper than SHA-256 on short inputs
+        hash_value = hashlib.blake2b(content.encode(), digest_size=6).hexdigest()
         return f"CL-{hash_value}"
     
     def _validate_clauses(
         self, 
-        clauses: list[ExtractedClause]
+        clauses: list[ExtractedClause],
+        seen_texts: set[str] | None = None
     ) -> list[ExtractedClause]:
-        """Validate and clean up extracted clauses."""
+        """
+        Validate and clean up extracted clauses.
+        
+        Args:
+            clauses: Clauses to validate
+            seen_texts: Stripped clause texts already accepted; updated in
+                place so duplicates are dropped across calls
+        """
         validated = []
+        if seen_texts is None:
+            seen_texts = set()
         
         for clause in clauses:
+            text = clause.raw_text.strip()
+            
             # Check minimum text length
-            if len(clause.raw_text.strip()) < 10:
+            if len(text) < 10:
                 continue
             
             # Check for duplicate text
-            is_duplicate = any(
-                c.raw_text.strip() == clause.raw_text.strip()
-                for c in validated
-            )
-            if is_duplicate:
+            if text in seen_texts:
                 continue
             
+            seen_texts.add(text)
             validated.append(clause)
         
         return validated
@@ -459,11 +805,9 @@ Provide your response as valid JSON only, no additional text."""
         clauses: list[ExtractedClause]
     ) -> dict[str, int]:
         """Calculate distribution of clause types."""
-        distribution = {}
-        for clause in clauses:
-            type_key = clause.clause_type.value
-            distribution[type_key] = distribution.get(type_key, 0) + 1
-        return distribution
+        # Count enum members first; .value is looked up once per type
+        counts = Counter(clause.clause_type for clause in clauses)
+        return {clause_type.value: count for clause_type, count in counts.items()}
     
     def _calculate_average_confidence(
         self, 
@@ -472,4 +816,4 @@ Provide your response as valid JSON only, no additional text."""
         """Calculate average confidence score across all clauses."""
         if not clauses:
             return 0.0
-        return sum(c.confidence for c in clauses) / len(clauses)
+        return fmean(c.confidence for c in clauses)
@@ -33,14 +33,68 @@ class Settings(BaseSettings):
         default="gpt-4o-mini",
         description="OpenAI model identifier"
     )
+    llm_max_concurrency: int = Field(
+        default=16,
+        description="Maximum number of concurrent LLM requests per pipeline stage"
+    )
+    llm_max_connections: int = Field(
+        default=128,
+        description="Connection pool size of the shared OpenAI client"
+    )
+    llm_requests_per_minute: int = Field(
+        default=500,
+        description="Client-side cap on clause-extraction LLM requests per minute"
+    )
+    clause_batch_size: int = Field(
+        default=2,
+        description="Number of document segments sent to the LLM per extraction request"
+    )
+    compliance_batch_size: int = Field(
+        default=4,
+        description="Number of clauses analyzed per compliance LLM request"
+    )
     
     # === Vector Database (Pinecone) ===
+    vector_search_backend: str = Field(
+        default="local",
+        description="Regulation vector search: 'local' (in-process index) or 'pinecone'"
+    )
     pinecone_api_key: str = Field(default="", description="Pinecone API key")
     pinecone_environment: str = Field(default="us-east-1", description="Pinecone environment")
     pinecone_index_name: str = Field(default="lawvisor-regulations", description="Pinecone index name")
     
+    # === Embeddings ===
+    embedding_backend: str = Field(
+        default="onnx",
+        description="Sentence-transformers inference backend: 'onnx' or 'torch'"
+    )
+    embedding_onnx_file: str = Field(
+        default="onnx/model_qint8_avx512_vnni.onnx",
+        description="ONNX export of the embedding model to load (int8-quantized by default)"
+    )
+    
     # === Cache Configuration (local disk) ===
     cache_ttl_seconds: int = Field(default=3600, description="Cache TTL in seconds")
+    llm_cache_dir: Path = Field(
+        default=Path("./cache/llm"),
+        description="Directory for cached LLM clause-extraction responses"
+    )
+    embedding_cache_dir: Path = Field(
+        default=Path("./cache/embeddings"),
+        description="Directory for the persisted regulation corpus embeddings"
+    )
+    ocr_cache_dir: Path = Field(
+        default=Path("./cache/ocr"),
+        description="Directory for cached OCR results of preprocessed pages"
+    )
+    semantic_cache_threshold: float = Field(
+        default=0.95,
+        description="Cosine similarity required to reuse a cached clause analysis"
+    )
+    semantic_cache_max_entries: int = Field(
+        default=10000,
+        description="Maximum number of clause analyses held in the semantic cache"
+    )
     
     # === OCR Configuration ===
     tesseract_path: str = Field(
@@ -51,10 +105,42 @@ class Settings(BaseSettings):
         default=0.7,
         description="Minimum OCR confidence score (0-1)"
     )
+    ocr_max_workers: int = Field(
+        default=4,
+        description="Maximum number of pages OCR'd concurrently"
+    )
+    ocr_high_noise: bool = Field(
+        default=False,
+        description="Denoise scans with non-local means (much slower; for very noisy scans)"
+    )
+    ocr_use_opencl: bool = Field(
+        default=False,
+        description="Run page preprocessing on an OpenCL device (GPU) when one is available"
+    )
     
     # === Document Storage ===
     upload_dir: Path = Field(default=Path("./uploads"), description="Upload directory")
     max_file_size_mb: int = Field(default=50, description="Maximum file size in MB")
+    document_store_backend: str = Field(
+        default="disk",
+        description="Document store backend: 'disk' (persistent, multi-worker) or 'memory'"
+    )
+    document_store_dir: Path = Field(
+        default=Path("./cache/documents"),
+        description="Directory for the disk document store"
+    )
+    analysis_timeout_seconds: int = Field(
+        default=3600,
+        description="Age after which an analysis still marked processing is treated as interrupted"
+    )
+    report_store_dir: Path = Field(
+        default=Path("./cache/reports"),
+        description="Directory where completed risk reports are persisted"
+    )
+    report_cache_size: int = Field(
+        default=32,
+        description="Number of risk reports kept in memory"
+    )
     
     # === Server Configuration ===
     api_host: str = Field(default="0.0.0.0", description="API host")
@@ -81,7 +167,7 @@ class Settings(BaseSettings):
         """Validate that the required API keys are set."""
         if not self.openai_api_key:
             raise ValueError("OPENAI_API_KEY is required")
-        if not self.pinecone_api_key:
+        if self.vector_search_backend == "pinecone" and not self.pinecone_api_key:
             raise ValueError("PINECONE_API_KEY is required")
 
 
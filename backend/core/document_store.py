@@ -0,0 +1,195 @@
+"""
+LawVisor Document Store Module
+==============================
+Storage for uploaded document metadata, status, and analysis results.
+
+Backends:
+- memory: process-local dict (tests, single-worker development)
+- disk: SQLite-backed diskcache shared by every worker on the host and
+  preserved across restarts
+
+All access goes through the async DocumentStore interface so a networked
+backend can be added without touching the API layer.
+"""
+
+import asyncio
+import logging
+from abc import ABC, abstractmethod
+from functools import lru_cache
+from typing import Any
+
+from diskcache import Cache
+
+from core.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+
+class DocumentStore(ABC):
+    """Async key-value store for document records."""
+
+    @abstractmethod
+    async def get(self, document_id: str) -> dict[str, Any] | None:
+        """Get a document record, or None if it doesn't exist."""
+
+    @abstractmethod
+    async def set(self, document_id: str, record: dict[str, Any]) -> None:
+        """Create or replace a document record."""
+
+    @abstractmethod
+    async def update(self, document_id: str, **fields: Any) -> dict[str, Any] | None:
+        """
+        Update fields on an existing record.
+
+        Returns:
+            The updated record, or None if the document doesn't exist
+        """
+
+    @abstractmethod
+    async def delete(self, document_id: str) -> None:
+        """Remove a document record if present."""
+
+    @abstractmethod
+    async def get_progress(self, document_id: str) -> dict[str, Any] | None:
+        """Get the latest analysis progress snapshot for a document."""
+
+    @abstractmethod
+    async def set_progress(self, document_id: str, progress: dict[str, Any] | None) -> None:
+        """
+        Replace (or with None, clear) a document's analysis progress.
+
+        Progress is kept apart from the document record, so frequent
+        progress writes don't rewrite the record or contend for its lock.
+        """
+
+    @abstractmethod
+    async def find_by_hash(self, content_hash: str) -> str | None:
+        """Get the document ID previously indexed under a content hash."""
+
+    @abstractmethod
+    async def index_hash(self, content_hash: str, document_id: str) -> None:
+        """Map a content hash to a document ID for duplicate detection."""
+
+    async def exists(self, document_id: str) -> bool:
+        """Check whether a document record exists."""
+        return await self.get(document_id) is not None
+
+    async def close(self) -> None:
+        """Release any resources held by the store."""
+
+
+class MemoryDocumentStore(DocumentStore):
+    """Process-local document store backed by a dict."""
+
+    def __init__(self):
+        self._records: dict[str, dict[str, Any]] = {}
+        self._progress: dict[str, dict[str, Any]] = {}
+        self._hashes: dict[str, str] = {}
+
+    async def get(self, document_id: str) -> dict[str, Any] | None:
+        record = self._records.get(document_id)
+        return dict(record) if record is not None else None
+
+    async def set(self, document_id: str, record: dict[str, Any]) -> None:
+        self._records[document_id] = dict(record)
+
+    async def update(self, document_id: str, **fields: Any) -> dict[str, Any] | None:
+        record = self._records.get(document_id)
+        if record is None:
+            return None
+        record.update(fields)
+        return dict(record)
+
+    async def delete(self, document_id: str) -> None:
+        self._records.pop(document_id, None)
+        self._progress.pop(document_id, None)
+
+    async def get_progress(self, document_id: str) -> dict[str, Any] | None:
+        progress = self._progress.get(document_id)
+        return dict(progress) if progress is not None else None
+
+    async def set_progress(self, document_id: str, progress: dict[str, Any] | None) -> None:
+        if progress is None:
+            self._progress.pop(document_id, None)
+        else:
+            self._progress[document_id] = dict(progress)
+
+    async def find_by_hash(self, content_hash: str) -> str | None:
+        return self._hashes.get(content_hash)
+
+    async def index_hash(self, content_hash: str, document_id: str) -> None:
+        self._hashes[content_hash] = document_id
+
+
+class DiskDocumentStore(DocumentStore):
+    """
+    Persistent document store backed by diskcache (SQLite).
+
+    Records are pickled, so they may hold datetimes, enums, and risk report
+    dataclasses. The cache file is safe to share between worker processes.
+    """
+
+    def __init__(self, directory: str):
+        self._cache = Cache(directory)
+
+    # SQLite reads/writes and (un)pickling block; every call runs in a
+    # worker thread so the event loop keeps serving other requests
+
+    async def get(self, document_id: str) -> dict[str, Any] | None:
+        return await asyncio.to_thread(self._cache.get, document_id)
+
+    async def set(self, document_id: str, record: dict[str, Any]) -> None:
+        await asyncio.to_thread(self._cache.set, document_id, record)
+
+    async def update(self, document_id: str, **fields: Any) -> dict[str, Any] | None:
+        return await asyncio.to_thread(self._update_sync, document_id, fields)
+
+    def _update_sync(self, document_id: str, fields: dict[str, Any]) -> dict[str, Any] | None:
+        # Read-modify-write under the cache's transaction lock so concurrent
+        # workers don't lose each other's updates
+        with self._cache.transact():
+            record = self._cache.get(document_id)
+            if record is None:
+                return None
+            record.update(fields)
+            self._cache.set(document_id, record)
+        return record
+
+    async def delete(self, document_id: str) -> None:
+        await asyncio.to_thread(self._delete_sync, document_id)
+
+    def _delete_sync(self, document_id: str) -> None:
+        self._cache.delete(document_id)
+        self._cache.delete(("progress", document_id))
+
+    async def get_progress(self, document_id: str) -> dict[str, Any] | None:
+        return await asyncio.to_thread(self._cache.get, ("progress", document_id))
+
+    async def set_progress(self, document_id: str, progress: dict[str, Any] | None) -> None:
+        if progress is None:
+            await asyncio.to_thread(self._cache.delete, ("progress", document_id))
+        else:
+            await asyncio.to_thread(self._cache.set, ("progress", document_id), progress)
+
+    async def find_by_hash(self, content_hash: str) -> str | None:
+        return await asyncio.to_thread(self._cache.get, ("sha256", content_hash))
+
+    async def index_hash(self, content_hash: str, document_id: str) -> None:
+        await asyncio.to_thread(self._cache.set, ("sha256", content_hash), document_id)
+
+    async def close(self) -> None:
+        self._cache.close()
+
+
+@lru_cache(maxsize=1)
+def get_document_store() -> DocumentStore:
+    """Get the configured document store instance."""
+    settings = get_settings()
+    backend = settings.document_store_backend.lower()
+
+    if backend == "memory":
+        return MemoryDocumentStore()
+    if backend == "disk":
+        return DiskDocumentStore(str(settings.document_store_dir))
+
+    raise ValueError(f"Unknown document store backend: {settings.document_store_backend}")
@@ -0,0 +1,34 @@
+"""
+LawVisor LLM Client Module
+==========================
+Process-wide OpenAI client shared by the pipeline stages.
+"""
+
+from functools import lru_cache
+
+import httpx
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
+
+from core.config import get_settings
+
+
+@lru_cache(maxsize=1)
+def get_llm_client() -> AsyncOpenAI:
+    """
+    Get the shared AsyncOpenAI client.
+
+    The clause extractor and RAG engine both send requests through this
+    client, so they share one connection pool and reuse warm keep-alive
+    connections instead of each opening (and TLS-handshaking) their own.
+    """
+    settings = get_settings()
+    return AsyncOpenAI(
+        api_key=settings.openai_api_key,
+        timeout=300.0,  # 5 minutes per request
+        http_client=DefaultAsyncHttpxClient(
+            limits=httpx.Limits(
+                max_connections=settings.llm_max_connections,
+                max_keepalive_connections=settings.llm_max_connections
+            )
+        )
+    )
@@ -12,30 +12,78 @@ Key Features:
 """
 
 import asyncio
+import dataclasses
+import functools
 import hashlib
-import json
 import logging
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any
+from pathlib import Path
+from typing import Any, Awaitable, Callable
 
-from openai import AsyncOpenAI
+import numpy as np
+import orjson
 from pinecone import Pinecone
 from sentence_transformers import SentenceTransformer
 
 from core.clause_extractor import ClauseType, ExtractedClause
 from core.config import get_settings
+from core.llm_client import get_llm_client
 from core.regulations import (
     RegulationArticle,
     RegulationsFetcher,
     get_regulations_fetcher,
 )
+from core.semantic_cache import SemanticCache
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
+# Sentence-transformers model used for clause and regulation embeddings
+EMBEDDING_MODEL_NAME = "all-MiniLM-L6-v2"
 
-@dataclass
+# Generous upper bound on the average characters per WordPiece token (English
+# averages about 4); text past max_seq_length tokens is dropped by the model
+EMBED_CHARS_PER_TOKEN = 8
+
+# Characters of regulation text kept per context; all the prompt shows
+CONTEXT_TEXT_MAX_CHARS = 1000
+
+# Embeddings are scaled onto the int8 grid before they are sent to Pinecone
+VECTOR_QUANT_LEVELS = 127
+
+
+def quantize_for_index(embedding: list[float]) -> list[float]:
+    """
+    Snap an embedding to int8 levels for the vector index.
+    
+    Each vector is scaled so its largest component lands on 127, which uses
+    the whole grid (a fixed scale would leave MiniLM's ~0.05 components on
+    a handful of levels). Cosine similarity ignores the scale, but rounding
+    still perturbs scores by up to a few thousandths, so near-tied
+    neighbours can swap order and recall drops slightly. In exchange,
+    whole-number components serialize in a few bytes each instead of ~20.
+    """
+    vector = np.asarray(embedding, dtype=np.float32)
+    peak = float(np.abs(vector).max(initial=0.0))
+    if peak == 0.0:
+        return vector.tolist()
+    return np.rint(vector * (VECTOR_QUANT_LEVELS / peak)).tolist()
+
+
+def _save_array(path: Path, array: np.ndarray) -> None:
+    """Write an .npy file atomically, so readers never see a partial file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(".tmp")
+    with open(tmp_path, "wb") as f:
+        np.save(f, array)
+    os.replace(tmp_path, path)
+
+
+@dataclass(slots=True)
 class RetrievedContext:
     """Context retrieved from vector search."""
     regulation_id: str
@@ -47,7 +95,7 @@ class RetrievedContext:
     regulation_type: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ComplianceAnalysis:
     """Analysis result for a single clause against regulations."""
     clause_id: str
@@ -88,6 +136,10 @@ class ComplianceAnalysis:
             "recommendations": self.recommendations,
             "confidence": self.confidence
         }
+    
+    def to_json(self) -> bytes:
+        """Serialize to JSON bytes (the to_dict shape) with orjson."""
+        return orjson.dumps(self.to_dict())
 
 
 # System prompt for compliance analysis
@@ -153,126 +205,364 @@ class RAGEngine:
         self._init_clients()
         self._regulations_fetcher = get_regulations_fetcher()
         self._pinecone_index = None
+        # In-process regulation index: row-normalized embedding matrix and
+        # the context each row maps to
+        self._local_index: tuple[np.ndarray, list[RetrievedContext]] | None = None
+        self._local_index_lock = asyncio.Lock()
+        # Prompt text of each regulation, split around the per-call
+        # relevance line; keyed by (regulation_id, article_number)
+        self._formatted_contexts: dict[tuple[str, str], tuple[str, str]] = {}
+        # Shared by every analyze_clauses call so concurrent batches stay
+        # within one provider-wide limit
+        self._analysis_semaphore = asyncio.Semaphore(self.settings.llm_max_concurrency)
+        self._semantic_cache: SemanticCache[ComplianceAnalysis] = SemanticCache(
+            threshold=self.settings.semantic_cache_threshold,
+            max_entries=self.settings.semantic_cache_max_entries
+        )
     
     def _init_clients(self):
         """Initialize LLM and embedding clients."""
-        # OpenAI client for LLM with increased timeout
-        self.llm_client = AsyncOpenAI(
-            api_key=self.settings.openai_api_key,
-            timeout=300.0  # 5 minutes per request
-        )
+        # Shared OpenAI client (one connection pool for all stages)
+        self.llm_client = get_llm_client()
         self.llm_model = self.settings.llm_model or "gpt-4o-mini"
         
         # Local embedding model (sentence-transformers)
-        # Using all-MiniLM-L6-v2 which produces 384-dim embeddings
-        self.embedding_model = SentenceTransformer('all-MiniLM-L6-v2')
+        # Using all-MiniLM-L6-v2 which produces 384-dim embeddings. The ONNX
+        # Runtime backend runs a pre-exported int8 graph from the model repo
+        if self.settings.embedding_backend == "onnx":
+            self.embedding_model = SentenceTransformer(
+                EMBEDDING_MODEL_NAME,
+                backend="onnx",
+                model_kwargs={"file_name": self.settings.embedding_onnx_file}
+            )
+        else:
+            self.embedding_model = SentenceTransformer(EMBEDDING_MODEL_NAME)
+        # Encoding gets its own threads so it neither waits behind nor
+        # starves the to_thread work (OCR, file I/O) in the default pool
+        self._embed_executor = ThreadPoolExecutor(
+            max_workers=min(4, os.cpu_count() or 1),
+            thread_name_prefix="embed"
+        )
+    
+    async def warmup(self) -> None:
+        """
+        Run one embedding pass so the model weights are resident, and
+        prepare the vector index.
+        """
+        await self._embed_text("warmup")
+        if self.settings.vector_search_backend == "local":
+            await self._get_local_index()
+        else:
+            # Connect now so the first clause doesn't pay for the round-trips
+            await self._get_pinecone_index()
+    
+    async def close(self) -> None:
+        """Shut down the embedding worker threads."""
+        self._embed_executor.shutdown(wait=False, cancel_futures=True)
     
     async def _get_pinecone_index(self):
-        """Get or create Pinecone index."""
+        """Get the Pinecone index, connecting on first use."""
         if self._pinecone_index is None:
-            pc = Pinecone(api_key=self.settings.pinecone_api_key)
-            
-            # Check if index exists
-            index_name = self.settings.pinecone_index_name
-            existing_indexes = pc.list_indexes()
-            
-            if index_name not in [idx.name for idx in existing_indexes]:
-                # Create index if it doesn't exist
-                # Using 384 dimensions for sentence-transformers all-MiniLM-L6-v2
-                pc.create_index(
-                    name=index_name,
-                    dimension=384,
-                    metric="cosine",
-                    spec={
-                        "serverless": {
-                            "cloud": "aws",
-                            "region": self.settings.pinecone_environment
-                        }
-                    }
-                )
-            
-            self._pinecone_index = pc.Index(index_name)
+            # Control-plane calls block; keep them off the event loop
+            self._pinecone_index = await asyncio.to_thread(self._connect_pinecone_index)
         
         return self._pinecone_index
     
+    def _connect_pinecone_index(self):
+        """Connect to the Pinecone index, creating it if it doesn't exist."""
+        pc = Pinecone(api_key=self.settings.pinecone_api_key)
+        
+        # Check if index exists
+        index_name = self.settings.pinecone_index_name
+        if index_name not in pc.list_indexes().names():
+            # Create index if it doesn't exist
+            # Using 384 dimensions for sentence-transformers all-MiniLM-L6-v2
+            pc.create_index(
+                name=index_name,
+                dimension=384,
+                metric="cosine",
+                spec={
+                    "serverless": {
+                        "cloud": "aws",
+                        "region": self.settings.pinecone_environment
+                    }
+                }
+            )
+        
+        return pc.Index(index_name)
+    
+    async def _get_local_index(self) -> tuple[np.ndarray, list[RetrievedContext]]:
+        """Get or build the in-process regulation index."""
+        if self._local_index is None:
+            async with self._local_index_lock:
+                if self._local_index is None:
+                    regulations = await self._load_regulation_corpus()
+                    embeddings = await self._embed_corpus(regulations)
+                    self._set_local_index(regulations, embeddings)
+        
+        return self._local_index
+    
+    def _set_local_index(
+        self,
+        regulations: list[RegulationArticle],
+        embeddings: np.ndarray
+    ) -> None:
+        """Replace the in-process index with the given corpus."""
+        matrix = np.asarray(embeddings, dtype=np.float32)
+        contexts = [
+            RetrievedContext(
+                regulation_id=reg.regulation_id,
+                article_number=reg.article_number,
+                title=reg.title,
+                text=reg.full_text[:CONTEXT_TEXT_MAX_CHARS],
+                relevance_score=0.0,
+                source_url=reg.source_url,
+                regulation_type=reg.regulation_type.value
+            )
+            for reg in regulations
+        ]
+        self._local_index = (matrix, contexts)
+    
     async def analyze_clause(
         self, 
-        clause: ExtractedClause
+        clause: ExtractedClause,
+        embedding: list[float] | None = None
     ) -> ComplianceAnalysis:
         """
         Analyze a single clause for regulatory compliance.
         
         Args:
             clause: Extracted clause to analyze
+            embedding: Precomputed embedding of clause.normalized_text;
+                computed here when not given
             
         Returns:
             ComplianceAnalysis with full risk assessment
         """
+        embedding, cached, contexts = await self._prepare_clause(clause, embedding)
+        if cached is not None:
+            return cached
+        
+        # Step 3: Analyze compliance with LLM
+        analysis = await self._analyze_with_llm(clause, contexts)
+        self._cache_analysis(clause, embedding, analysis)
+        
+        return analysis
+    
+    async def _prepare_clause(
+        self,
+        clause: ExtractedClause,
+        embedding: list[float] | None
+    ) -> tuple[list[float] | None, ComplianceAnalysis | None, list[RetrievedContext]]:
+        """
+        Run the steps that precede the LLM call for one clause.
+        
+        Returns:
+            Tuple of (embedding, cached_analysis, contexts). On a semantic
+            cache hit cached_analysis is set and contexts is empty.
+        """
         logger.info(f"Analyzing clause {clause.clause_id} of type {clause.clause_type}")
         
-        # Step 1: Get relevant regulations based on clause type
-        regulations = await self._regulations_fetcher.get_relevant_regulations(
-            clause.clause_type.value
-        )
+        # Step 0: Reuse the analysis of a near-identical clause if we have one
+        clause_type = clause.clause_type.value
+        if embedding is None:
+            try:
+                embedding = await self._embed_text(clause.normalized_text)
+            except Exception as e:
+                logger.warning(f"Clause embedding failed, skipping semantic cache: {e}")
         
-        # Step 2: Retrieve additional context via semantic search
-        additional_context = await self._semantic_search(
-            clause.normalized_text,
-            top_k=5
+        if embedding is not None:
+            cached = self._semantic_cache.get(embedding, namespace=clause_type)
+            if cached is not None:
+                logger.info(f"Semantic cache hit for clause {clause.clause_id}")
+                return embedding, dataclasses.replace(
+                    cached,
+                    clause_id=clause.clause_id,
+                    clause_text=clause.raw_text[:1000]
+                ), []
+        
+        # Steps 1 and 2 are independent, so run them concurrently:
+        # regulations for the clause type, and additional context via
+        # semantic search (which degrades to [] on failure by itself)
+        regulations, additional_context = await asyncio.gather(
+            self._regulations_fetcher.get_relevant_regulations(clause_type),
+            self._semantic_search(
+                clause.normalized_text,
+                top_k=5,
+                query_embedding=embedding
+            )
         )
         
         # Combine retrieved contexts
-        all_contexts = self._prepare_regulatory_context(regulations, additional_context)
-        
-        # Step 3: Analyze compliance with LLM
-        analysis = await self._analyze_with_llm(clause, all_contexts)
-        
-        return analysis
+        return embedding, None, self._prepare_regulatory_context(
+            regulations, additional_context
+        )
+    
+    def _cache_analysis(
+        self,
+        clause: ExtractedClause,
+        embedding: list[float] | None,
+        analysis: ComplianceAnalysis
+    ) -> None:
+        """Store a fresh analysis in the semantic cache."""
+        # Error analyses carry zero confidence and must not be reused
+        if embedding is not None and analysis.confidence > 0:
+            self._semantic_cache.set(
+                embedding, analysis, namespace=clause.clause_type.value
+            )
     
     async def analyze_clauses(
         self, 
-        clauses: list[ExtractedClause]
+        clauses: list[ExtractedClause],
+        max_concurrency: int | None = None,
+        on_result: Callable[[ComplianceAnalysis], Awaitable[None]] | None = None
     ) -> list[ComplianceAnalysis]:
         """
         Analyze multiple clauses for regulatory compliance.
         
+        Clauses repeated verbatim within the document (same type and same
+        text ignoring case and whitespace) are analyzed once and the result
+        is copied to each occurrence.
+        
+        Unique clauses that miss the semantic cache are sent to the LLM
+        ``settings.compliance_batch_size`` at a time, so the system prompt
+        and per-request overhead are paid once per batch. All batches are
+        scheduled at once; a semaphore caps how many LLM requests are in
+        flight so a long contract overlaps its embedding, vector search and
+        LLM round-trips without tripping provider rate limits.
+        
         Args:
             clauses: List of extracted clauses
+            max_concurrency: Maximum LLM requests in flight for this call;
+                by default the engine-wide settings.llm_max_concurrency
+                limit is shared with other concurrent calls
+            on_result: Optional callback awaited with each analysis as soon
+                as it finishes (completion order, not input order)
             
         Returns:
-            List of ComplianceAnalysis objects
+            List of ComplianceAnalysis objects, in input order
         """
-        # Process in parallel batches
-        batch_size = 5
-        all_analyses = []
-        
-        for i in range(0, len(clauses), batch_size):
-            batch = clauses[i:i + batch_size]
-            batch_analyses = await asyncio.gather(
-                *[self.analyze_clause(c) for c in batch],
+        # Group identical clauses; the first occurrence is analyzed
+        groups: dict[tuple[str, str], list[ExtractedClause]] = {}
+        positions: dict[tuple[str, str], list[int]] = {}
+        for i, clause in enumerate(clauses):
+            key = (
+                clause.clause_type.value,
+                " ".join(clause.normalized_text.lower().split())
+            )
+            groups.setdefault(key, []).append(clause)
+            positions.setdefault(key, []).append(i)
+        
+        unique_groups = list(groups.values())
+        if len(unique_groups) < len(clauses):
+            logger.info(
+                f"Analyzing {len(unique_groups)} unique clauses "
+                f"({len(clauses) - len(unique_groups)} duplicates reused)"
+            )
+        
+        # Embed every unique clause in one batched forward pass up front;
+        # the vectors are reused for the semantic cache and vector search
+        try:
+            embeddings = await self._embed_texts(
+                [group[0].normalized_text for group in unique_groups]
+            )
+        except Exception as e:
+            logger.warning(f"Batch embedding failed, embedding per clause: {e}")
+            embeddings = [None] * len(unique_groups)
+        
+        semaphore = (
+            asyncio.Semaphore(max_concurrency)
+            if max_concurrency
+            else self._analysis_semaphore
+        )
+        
+        async def analyze_batch(
+            batch: list[tuple[list[ExtractedClause], list[float] | None]]
+        ) -> list[list[ComplianceAnalysis] | BaseException]:
+            prepared = await asyncio.gather(
+                *[self._prepare_clause(group[0], e) for group, e in batch],
                 return_exceptions=True
             )
             
-            for j, analysis in enumerate(batch_analyses):
-                if isinstance(analysis, Exception):
-                    logger.error(f"Error analyzing clause: {analysis}")
-                    # Create a minimal error analysis
-                    all_analyses.append(ComplianceAnalysis(
-                        clause_id=batch[j].clause_id,
-                        clause_type=batch[j].clause_type.value,
-                        clause_text=batch[j].raw_text[:500],
+            # One LLM request for every clause the cache couldn't answer
+            pending = [
+                i for i, p in enumerate(prepared)
+                if not isinstance(p, BaseException) and p[1] is None
+            ]
+            fresh: dict[int, ComplianceAnalysis] = {}
+            if pending:
+                async with semaphore:
+                    analyses = await self._analyze_batch_with_llm(
+                        [batch[i][0][0] for i in pending],
+                        [prepared[i][2] for i in pending]
+                    )
+                for i, analysis in zip(pending, analyses):
+                    self._cache_analysis(batch[i][0][0], prepared[i][0], analysis)
+                    fresh[i] = analysis
+            
+            results: list[list[ComplianceAnalysis] | BaseException] = []
+            for i, ((group, _), p) in enumerate(zip(batch, prepared)):
+                if isinstance(p, BaseException):
+                    results.append(p)
+                    continue
+                
+                analysis = fresh.get(i) or p[1]
+                analyses = [analysis] + [
+                    dataclasses.replace(
+                        analysis,
+                        clause_id=duplicate.clause_id,
+                        clause_text=duplicate.raw_text[:1000]
+                    )
+                    for duplicate in group[1:]
+                ]
+                if on_result is not None:
+                    for a in analyses:
+                        await on_result(a)
+                results.append(analyses)
+            return results
+        
+        batch_size = max(1, self.settings.compliance_batch_size)
+        work = list(zip(unique_groups, embeddings))
+        batches = [work[i:i + batch_size] for i in range(0, len(work), batch_size)]
+        batch_results = await asyncio.gather(
+            *[analyze_batch(b) for b in batches],
+            return_exceptions=True
+        )
+        
+        # Flatten back to one entry per unique group
+        results: list[list[ComplianceAnalysis] | BaseException] = []
+        for batch, batch_result in zip(batches, batch_results):
+            if isinstance(batch_result, BaseException):
+                results.extend([batch_result] * len(batch))
+            else:
+                results.extend(batch_result)
+        
+        all_analyses: list[ComplianceAnalysis | None] = [None] * len(clauses)
+        for group, group_positions, analyses in zip(
+            unique_groups, positions.values(), results
+        ):
+            if isinstance(analyses, BaseException):
+                logger.error(f"Error analyzing clause: {analyses}")
+                # Create a minimal error analysis
+                analyses = [
+                    ComplianceAnalysis(
+                        clause_id=clause.clause_id,
+                        clause_type=clause.clause_type.value,
+                        clause_text=clause.raw_text[:500],
                         is_compliant=False,
                         risk_level="high",
                         risk_score=75,
                         violated_regulations=[],
                         matched_regulations=[],
-                        explanation=f"Analysis failed: {str(analysis)}",
+                        explanation=f"Analysis failed: {str(analyses)}",
                         reasoning_chain=["Error during analysis"],
                         recommendations=["Manual review required"],
                         confidence=0.0
-                    ))
-                else:
-                    all_analyses.append(analysis)
+                    )
+                    for clause in group
+                ]
+            for i, analysis in zip(group_positions, analyses):
+                all_analyses[i] = analysis
         
         return all_analyses
     
@@ -281,21 +571,45 @@ class RAGEngine:
         Generate embedding for text using sentence-transformers.
         Uses all-MiniLM-L6-v2 which produces 384-dimensional embeddings.
         """
-        # Truncate if too long (model max is ~256 tokens, but we handle longer text)
-        truncated_text = text[:8000]
-        
-        # Run in executor to not block async loop
-        loop = asyncio.get_event_loop()
-        embedding = await loop.run_in_executor(
-            None,
-            lambda: self.embedding_model.encode(truncated_text).tolist()
+        return (await self._embed_texts([text]))[0]
+    
+    async def _embed_texts(
+        self,
+        texts: list[str],
+        batch_size: int = 64
+    ) -> list[list[float]]:
+        """
+        Generate embeddings for many texts in one batched encode call.
+        
+        Embeddings are L2-normalized, so dot product equals cosine similarity.
+        """
+        if not texts:
+            return []
+        
+        # The model only reads its first max_seq_length tokens; cut the rest
+        # before tokenizing rather than tokenize pages of text to discard
+        max_chars = self.embedding_model.max_seq_length * EMBED_CHARS_PER_TOKEN
+        truncated_texts = [text[:max_chars] for text in texts]
+        
+        # Run on the embedding threads to not block the event loop
+        encode = functools.partial(
+            self.embedding_model.encode,
+            truncated_texts,
+            batch_size=batch_size,
+            convert_to_numpy=True,
+            normalize_embeddings=True,
+            show_progress_bar=False
         )
-        return embedding
+        embeddings = await asyncio.get_running_loop().run_in_executor(
+            self._embed_executor, encode
+        )
+        return embeddings.tolist()
     
     async def _semantic_search(
         self, 
         query: str, 
-        top_k: int = 5
+        top_k: int = 5,
+        query_embedding: list[float] | None = None
     ) -> list[RetrievedContext]:
         """
         Search for relevant regulations using semantic similarity.
@@ -303,18 +617,24 @@ class RAGEngine:
         Args:
             query: Text to search for
             top_k: Number of results to return
+            query_embedding: Precomputed embedding of query, if available
             
         Returns:
             List of relevant regulatory contexts
         """
         try:
             # Generate embedding for query
-            query_embedding = await self._embed_text(query)
+            if query_embedding is None:
+                query_embedding = await self._embed_text(query)
+            
+            if self.settings.vector_search_backend == "local":
+                return await self._search_local(query_embedding, top_k)
             
             # Search in Pinecone
             index = await self._get_pinecone_index()
-            results = index.query(
-                vector=query_embedding,
+            results = await asyncio.to_thread(
+                index.query,
+                vector=quantize_for_index(query_embedding),
                 top_k=top_k,
                 include_metadata=True
             )
@@ -338,31 +658,72 @@ class RAGEngine:
             logger.warning(f"Semantic search failed: {e}")
             return []
     
+    async def _search_local(
+        self,
+        query_embedding: list[float],
+        top_k: int
+    ) -> list[RetrievedContext]:
+        """
+        Exact nearest-neighbour search over the in-process index.
+        
+        The corpus is a few hundred articles, so one matrix-vector product
+        scores all of them in well under a millisecond; an ANN structure
+        would only add approximation.
+        """
+        matrix, contexts = await self._get_local_index()
+        if not contexts:
+            return []
+        
+        # Rows and query are normalized: dot product is cosine similarity
+        scores = matrix @ np.asarray(query_embedding, dtype=np.float32)
+        k = min(top_k, len(contexts))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        
+        return [
+            dataclasses.replace(contexts[i], relevance_score=float(scores[i]))
+            for i in top
+        ]
+    
     def _prepare_regulatory_context(
         self,
         regulations: list[RegulationArticle],
         additional_context: list[RetrievedContext]
     ) -> list[RetrievedContext]:
-        """Prepare combined regulatory context for LLM."""
+        """
+        Prepare combined regulatory context for LLM.
+        
+        Direct regulations come first, then semantic search results. Each
+        article appears once, whichever list repeats it.
+        """
         contexts = []
+        seen: set[tuple[str, str]] = set()
         
         # Add direct regulations
         for reg in regulations:
+            key = (reg.regulation_id, reg.article_number)
+            if key in seen:
+                continue
+            seen.add(key)
             contexts.append(RetrievedContext(
                 regulation_id=reg.regulation_id,
                 article_number=reg.article_number,
                 title=reg.title,
-                text=reg.full_text,
+                text=reg.full_text[:CONTEXT_TEXT_MAX_CHARS],
                 relevance_score=1.0,  # Direct match
                 source_url=reg.source_url,
                 regulation_type=reg.regulation_type.value
             ))
         
         # Add semantic search results (avoiding duplicates)
-        existing_ids = {c.regulation_id for c in contexts}
         for ctx in additional_context:
-            if ctx.regulation_id not in existing_ids:
-                contexts.append(ctx)
+            key = (ctx.regulation_id, ctx.article_number)
+            if key in seen:
+                continue
+            seen.add(key)
+            if len(ctx.text) > CONTEXT_TEXT_MAX_CHARS:
+                ctx = dataclasses.replace(ctx, text=ctx.text[:CONTEXT_TEXT_MAX_CHARS])
+            contexts.append(ctx)
         
         return contexts
     
@@ -377,57 +738,161 @@ class RAGEngine:
         # Prepare context text
         context_text = self._format_context_for_llm(contexts)
         
-        user_prompt = f"""Analyze the following contract clause for regulatory compliance.
+        # Invariant text first: the system prompt plus the regulations for
+        # this clause type form a prefix shared by every request for that
+        # type, which the provider's prompt cache can reuse
+        user_prompt = f"""Analyze the contract clause below for regulatory compliance.
+
+## RELEVANT REGULATIONS
+{context_text}
 
 ## CLAUSE TO ANALYZE
 Type: {clause.clause_type.value}
 Text: {clause.normalized_text}
 
-## RELEVANT REGULATIONS
-{context_text}
-
 Provide your compliance analysis as JSON."""
 
         try:
             logger.info(f"Using OpenAI LLM ({self.llm_model}) to analyze clause {clause.clause_id}...")
             # Use OpenAI for LLM analysis
-            response = await self.llm_client.chat.completions.create(
-                model=self.llm_model,
-                messages=[
-                    {"role": "system", "content": COMPLIANCE_ANALYSIS_PROMPT},
-                    {"role": "user", "content": user_prompt}
-                ],
-                response_format={"type": "json_object"},
-                temperature=0.1,
-                max_tokens=2000
-            )
-            result_text = response.choices[0].message.content
+            result_text = await self._complete_json(user_prompt, max_tokens=2000)
             
             # Parse JSON response
-            result = json.loads(result_text)
+            result = orjson.loads(result_text)
             
-            return ComplianceAnalysis(
-                clause_id=clause.clause_id,
-                clause_type=clause.clause_type.value,
-                clause_text=clause.raw_text[:1000],  # Truncate for storage
-                is_compliant=result.get("is_compliant", False),
-                risk_level=result.get("risk_level", "medium"),
-                risk_score=float(result.get("risk_score", 50)),
-                violated_regulations=result.get("violated_regulations", []),
-                matched_regulations=contexts[:5],  # Top 5 relevant
-                explanation=result.get("explanation", ""),
-                reasoning_chain=result.get("reasoning_chain", []),
-                recommendations=result.get("recommendations", []),
-                confidence=float(result.get("confidence", 0.5))
-            )
+            return self._build_analysis(clause, result, contexts)
             
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             logger.error(f"Failed to parse LLM response: {e}")
             return self._create_error_analysis(clause, str(e))
         except Exception as e:
             logger.error(f"LLM analysis error: {e}")
             return self._create_error_analysis(clause, str(e))
     
+    async def _analyze_batch_with_llm(
+        self,
+        clauses: list[ExtractedClause],
+        contexts_per_clause: list[list[RetrievedContext]]
+    ) -> list[ComplianceAnalysis]:
+        """
+        Analyze several clauses in a single LLM request.
+        
+        The model returns one analysis per clause keyed by clause_id. A
+        clause missing from the response is re-analyzed on its own.
+        
+        Returns:
+            ComplianceAnalysis per clause, in input order
+        """
+        if len(clauses) == 1:
+            return [await self._analyze_with_llm(clauses[0], contexts_per_clause[0])]
+        
+        # As in _analyze_with_llm, regulations precede clause text and the
+        # preamble is fixed, so requests share the longest possible prefix
+        sections = [
+            f"""Relevant regulations for the clause below:
+{self._format_context_for_llm(contexts)}
+
+## CLAUSE {clause.clause_id}
+Type: {clause.clause_type.value}
+Text: {clause.normalized_text}"""
+            for clause, contexts in zip(clauses, contexts_per_clause)
+        ]
+        clauses_text = "\n\n".join(sections)
+        
+        user_prompt = f"""Analyze each of the contract clauses below for regulatory compliance. Judge every clause independently, against only the regulations listed directly above it.
+
+{clauses_text}
+
+Provide your compliance analyses as a JSON object {{"results": [...]}} with one analysis per clause, each in the format above plus a "clause_id" field naming its clause."""
+        
+        try:
+            logger.info(
+                f"Using OpenAI LLM ({self.llm_model}) to analyze "
+                f"{len(clauses)} clauses in one request..."
+            )
+            result_text = await self._complete_json(
+                user_prompt, max_tokens=2000 * len(clauses)
+            )
+            results = orjson.loads(result_text).get("results", [])
+        except orjson.JSONDecodeError as e:
+            logger.error(f"Failed to parse LLM batch response: {e}")
+            return [self._create_error_analysis(c, str(e)) for c in clauses]
+        except Exception as e:
+            logger.error(f"LLM batch analysis error: {e}")
+            return [self._create_error_analysis(c, str(e)) for c in clauses]
+        
+        by_id = {
+            r.get("clause_id"): r for r in results if isinstance(r, dict)
+        }
+        
+        async def resolve(
+            clause: ExtractedClause,
+            contexts: list[RetrievedContext]
+        ) -> ComplianceAnalysis:
+            result = by_id.get(clause.clause_id)
+            if result is None:
+                logger.warning(f"Clause {clause.clause_id} missing from batch response")
+                return await self._analyze_with_llm(clause, contexts)
+            try:
+                return self._build_analysis(clause, result, contexts)
+            except (TypeError, ValueError) as e:
+                return self._create_error_analysis(clause, str(e))
+        
+        return list(await asyncio.gather(*[
+            resolve(c, ctx) for c, ctx in zip(clauses, contexts_per_clause)
+        ]))
+    
+    async def _complete_json(self, user_prompt: str, max_tokens: int) -> str:
+        """
+        Run a compliance prompt and return the model's JSON text.
+        
+        The response is streamed, so tokens arrive while the model is still
+        generating and the text is ready to parse the moment it ends.
+        """
+        stream = await self.llm_client.chat.completions.create(
+            model=self.llm_model,
+            messages=[
+                {"role": "system", "content": COMPLIANCE_ANALYSIS_PROMPT},
+                {"role": "user", "content": user_prompt}
+            ],
+            response_format={"type": "json_object"},
+            temperature=0.1,
+            max_tokens=max_tokens,
+            stream=True
+        )
+        
+        parts = []
+        async for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                parts.append(chunk.choices[0].delta.content)
+        return "".join(parts)
+    
+    def _build_analysis(
+        self,
+        clause: ExtractedClause,
+        result: dict[str, Any],
+        contexts: list[RetrievedContext]
+    ) -> ComplianceAnalysis:
+        """Build a ComplianceAnalysis from one parsed LLM result."""
+        return ComplianceAnalysis(
+            clause_id=clause.clause_id,
+            clause_type=clause.clause_type.value,
+            clause_text=clause.raw_text[:1000],  # Truncate for storage
+            is_compliant=result.get("is_compliant", False),
+            risk_level=result.get("risk_level", "medium"),
+            risk_score=float(result.get("risk_score", 50)),
+            # Interned: the same few citations repeat across most clauses
+            violated_regulations=[
+                sys.intern(regulation) if isinstance(regulation, str) else regulation
+                for regulation in result.get("violated_regulations", [])
+            ],
+            matched_regulations=contexts[:5],  # Top 5 relevant
+            explanation=result.get("explanation", ""),
+            reasoning_chain=result.get("reasoning_chain", []),
+            recommendations=result.get("recommendations", []),
+            confidence=float(result.get("confidence", 0.5))
+        )
+    
     def _format_context_for_llm(
         self, 
         contexts: list[RetrievedContext]
@@ -438,12 +903,18 @@ Provide your compliance analysis as JSON."""
         
         formatted = []
         for ctx in contexts:
-            formatted.append(
-                f"### {ctx.regulation_id}: {ctx.title}\n"
-                f"Source: {ctx.source_url}\n"
-                f"Relevance: {ctx.relevance_score:.2f}\n"
-                f"Text: {ctx.text[:1000]}..."
-            )
+            key = (ctx.regulation_id, ctx.article_number)
+            parts = self._formatted_contexts.get(key)
+            if parts is None:
+                parts = (
+                    f"### {ctx.regulation_id}: {ctx.title}\n"
+                    f"Source: {ctx.source_url}\n",
+                    f"Text: {ctx.text[:CONTEXT_TEXT_MAX_CHARS]}..."
+                )
+                self._formatted_contexts[key] = parts
+            
+            header, body = parts
+            formatted.append(f"{header}Relevance: {ctx.relevance_score:.2f}\n{body}")
         
         return "\n\n".join(formatted)
     
@@ -475,22 +946,21 @@ Provide your compliance analysis as JSON."""
         """
         logger.info("Indexing regulations in vector database...")
         
-        # Fetch all regulations
-        gdpr_set = await self._regulations_fetcher.fetch_all_gdpr_articles()
-        sec_set = await self._regulations_fetcher.fetch_all_sec_regulations()
+        all_regulations = await self._load_regulation_corpus()
+        embeddings = await self._embed_corpus(all_regulations)
         
-        all_regulations = gdpr_set.articles + sec_set.articles
+        self._set_local_index(all_regulations, embeddings)
+        if self.settings.vector_search_backend == "local":
+            logger.info(f"Indexed {len(all_regulations)} regulations in memory")
+            return
         
         # Prepare vectors for upsert
         vectors = []
-        for reg in all_regulations:
-            # Generate embedding
-            embedding = await self._embed_text(reg.full_text)
-            
-            vector_id = hashlib.md5(reg.regulation_id.encode()).hexdigest()
+        for reg, embedding in zip(all_regulations, embeddings):
             vectors.append({
-                "id": vector_id,
-                "values": embedding,
+                # Regulation IDs are short, unique and ASCII: usable as-is
+                "id": reg.regulation_id,
+                "values": quantize_for_index(embedding),
                 "metadata": {
                     "regulation_id": reg.regulation_id,
                     "regulation_type": reg.regulation_type.value,
@@ -504,10 +974,56 @@ Provide your compliance analysis as JSON."""
         # Upsert to Pinecone
         index = await self._get_pinecone_index()
         
-        # Batch upsert
+        # Batch upsert; batches are independent, so send them in parallel
         batch_size = 100
-        for i in range(0, len(vectors), batch_size):
-            batch = vectors[i:i + batch_size]
-            index.upsert(vectors=batch)
+        await asyncio.gather(*[
+            asyncio.to_thread(index.upsert, vectors=vectors[i:i + batch_size])
+            for i in range(0, len(vectors), batch_size)
+        ])
         
         logger.info(f"Indexed {len(vectors)} regulations")
+    
+    async def _load_regulation_corpus(self) -> list[RegulationArticle]:
+        """Fetch every regulation article that is indexed for search."""
+        gdpr_set = await self._regulations_fetcher.fetch_all_gdpr_articles()
+        sec_set = await self._regulations_fetcher.fetch_all_sec_regulations()
+        
+        return gdpr_set.articles + sec_set.articles
+    
+    async def _embed_corpus(self, regulations: list[RegulationArticle]) -> np.ndarray:
+        """
+        Embed the regulation corpus, reusing the copy persisted on disk.
+        
+        The file is named by a hash of the model variant and every article's
+        text, so any change to the corpus is re-embedded and the saved
+        matrix rows always line up with the articles.
+        """
+        digest = hashlib.blake2b(self._embedding_model_key().encode(), digest_size=16)
+        for reg in regulations:
+            digest.update(b"\0")
+            digest.update(reg.full_text.encode())
+        path = self.settings.embedding_cache_dir / f"regulations-{digest.hexdigest()}.npy"
+        
+        if path.exists():
+            try:
+                return await asyncio.to_thread(np.load, path)
+            except (OSError, ValueError) as e:
+                logger.warning(f"Ignoring unreadable embedding cache {path}: {e}")
+        
+        # Embed the whole corpus in one batched pass
+        embeddings = np.asarray(
+            await self._embed_texts([reg.full_text for reg in regulations]),
+            dtype=np.float32
+        )
+        try:
+            await asyncio.to_thread(_save_array, path, embeddings)
+        except OSError as e:
+            logger.warning(f"Could not persist regulation embeddings: {e}")
+        
+        return embeddings
+    
+    def _embedding_model_key(self) -> str:
+        """Identify the model variant; quantized graphs embed slightly differently."""
+        if self.settings.embedding_backend == "onnx":
+            return f"{EMBEDDING_MODEL_NAME}:onnx:{self.settings.embedding_onnx_file}"
+        return EMBEDDING_MODEL_NAME
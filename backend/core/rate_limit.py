@@ -0,0 +1,32 @@
+"""
+LawVisor Rate Limit Module
+==========================
+Client-side request pacing for external APIs.
+"""
+
+import asyncio
+import time
+
+
+class AsyncRateLimiter:
+    """
+    Spaces calls evenly to stay within a request budget per period.
+
+    Each acquire() reserves the next free slot and sleeps until it arrives.
+    Slot reservation has no await in it, so it is atomic on the event loop
+    and needs no lock.
+    """
+
+    def __init__(self, max_rate: int, period: float = 60.0):
+        self._interval = period / max_rate
+        self._next_slot = 0.0
+
+    async def acquire(self) -> None:
+        """Wait for the next request slot."""
+        now = time.monotonic()
+        slot = max(self._next_slot, now)
+        self._next_slot = slot + self._interval
+
+        delay = slot - now
+        if delay > 0:
+            await asyncio.sleep(delay)
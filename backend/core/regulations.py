@@ -16,20 +16,31 @@ import hashlib
 import json
 import logging
 import re
+import sys
+import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
-import aiohttp
+import httpx
+import orjson
 from diskcache import Cache
+from selectolax.parser import HTMLParser
 
 from core.config import REGULATORY_SOURCES, get_settings
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
+# Article name in the text of a gdpr-info.eu page heading, e.g.
+# "Art. 5 GDPR – Principles relating to processing of personal data"
+GDPR_TITLE_RE = re.compile(r'Art\.\s*\d+\s*GDPR\s*[–-]?\s*(.+)')
+WHITESPACE_RE = re.compile(r'\s+')
+
 
 class RegulationType(str, Enum):
     """Types of regulations supported."""
@@ -39,7 +50,7 @@ class RegulationType(str, Enum):
     HIPAA = "hipaa"  # Future support
 
 
-@dataclass
+@dataclass(slots=True)
 class RegulationArticle:
     """A single regulatory article or rule."""
     regulation_id: str
@@ -69,9 +80,13 @@ class RegulationArticle:
             "source_url": self.source_url,
             "related_articles": self.related_articles
         }
+    
+    def to_json(self) -> bytes:
+        """Serialize to JSON bytes (the to_dict shape) with orjson."""
+        return orjson.dumps(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class RegulationSet:
     """A collection of related regulations."""
     regulation_type: RegulationType
@@ -271,6 +286,99 @@ SEC_REGULATIONS_DATA = {
     }
 }
 
+# Mapping of clause types to relevant regulations
+CLAUSE_REGULATION_MAP: dict[str, tuple[tuple[str, tuple[str, ...]], ...]] = {
+    "data_protection": (
+        ("gdpr", ("5", "6", "7", "12", "13", "25", "32")),
+    ),
+    "liability": (
+        ("sec", ("10b-5",)),
+    ),
+    "confidentiality": (
+        ("gdpr", ("5", "32")),
+    ),
+    "intellectual_property": (
+        ("gdpr", ("5",)),
+    ),
+    "jurisdiction": (
+        ("gdpr", ("44", "46")),
+    ),
+    "termination": (
+        ("gdpr", ("17",)),
+    ),
+    "indemnification": (
+        ("sec", ("10b-5",)),
+    ),
+}
+
+
+def _intern_all(strings: list[str]) -> list[str]:
+    """Intern strings that repeat across articles so they are held once."""
+    return [sys.intern(s) for s in strings]
+
+
+def _build_gdpr_article(
+    article_number: str,
+    data: dict[str, Any],
+    loaded_at: datetime
+) -> RegulationArticle:
+    """Build a GDPR article from pre-defined data."""
+    # Construct full text from subsections if available
+    full_text_parts = [data["title"]]
+    if "subsections" in data:
+        for key, value in data["subsections"].items():
+            full_text_parts.append(f"({key}) {value}")
+    
+    return RegulationArticle(
+        regulation_id=sys.intern(f"GDPR-Art-{article_number}"),
+        regulation_type=RegulationType.GDPR,
+        article_number=sys.intern(article_number),
+        title=data["title"],
+        full_text=" ".join(full_text_parts),
+        summary=data["title"],
+        key_requirements=_intern_all(data.get("key_requirements", [])),
+        penalties=_intern_all(data.get("penalties", [])),
+        last_updated=loaded_at,
+        source_url=f"https://gdpr-info.eu/art-{article_number}-gdpr/",
+        related_articles=[]
+    )
+
+
+def _build_sec_article(
+    regulation_id: str,
+    data: dict[str, Any],
+    loaded_at: datetime
+) -> RegulationArticle:
+    """Build an SEC regulation from pre-defined data."""
+    full_text = f"{data['title']}. "
+    full_text += ". ".join(data["key_requirements"])
+    
+    return RegulationArticle(
+        regulation_id=sys.intern(f"SEC-{regulation_id}"),
+        regulation_type=RegulationType.SEC,
+        article_number=sys.intern(regulation_id),
+        title=data["title"],
+        full_text=full_text,
+        summary=data["title"],
+        key_requirements=_intern_all(data["key_requirements"]),
+        penalties=[],  # SEC penalties are case-specific
+        last_updated=loaded_at,
+        source_url=f"https://www.sec.gov/rules/{regulation_id.lower()}",
+        related_articles=[]
+    )
+
+
+# Pre-defined articles are static, so build them once at import
+_PREDEFINED_LOADED_AT = datetime.utcnow()
+PREDEFINED_GDPR_ARTICLES = {
+    number: _build_gdpr_article(number, data, _PREDEFINED_LOADED_AT)
+    for number, data in GDPR_ARTICLES_DATA.items()
+}
+PREDEFINED_SEC_REGULATIONS = {
+    reg_id: _build_sec_article(reg_id, data, _PREDEFINED_LOADED_AT)
+    for reg_id, data in SEC_REGULATIONS_DATA.items()
+}
+
 
 class RegulationsFetcher:
     """
@@ -283,17 +391,47 @@ class RegulationsFetcher:
     - Normalized output for downstream processing
     """
     
+    # In-memory LRU in front of the disk cache; the regulation set is small
+    MEMORY_CACHE_SIZE = 256
+    
+    # How long a failed lookup is remembered before the network is retried
+    NEGATIVE_CACHE_TTL = timedelta(hours=1)
+    
+    # Live requests in flight at once, to stay polite to source websites
+    LIVE_FETCH_CONCURRENCY = 8
+    
     def __init__(self):
         self.settings = get_settings()
         self._cache = Cache(str(Path("./cache/regulations")))
         self._cache_ttl = timedelta(hours=24)  # Cache for 24 hours
-        self._session: aiohttp.ClientSession | None = None
+        # TTLs as plain seconds for the per-lookup expiry checks
+        self._cache_ttl_s = self._cache_ttl.total_seconds()
+        self._negative_ttl_s = self.NEGATIVE_CACHE_TTL.total_seconds()
+        self._memory_cache: OrderedDict[
+            str, tuple[float, RegulationArticle | None]
+        ] = OrderedDict()
+        self._session: httpx.AsyncClient | None = None
+        self._live_fetch_slots = asyncio.Semaphore(self.LIVE_FETCH_CONCURRENCY)
+        # Resolved articles per clause type, built at warmup; expires with
+        # the article TTL so refreshed articles are picked up
+        self._clause_index: dict[str, tuple[RegulationArticle, ...]] = {}
+        self._clause_index_expires = 0.0
     
-    async def _get_session(self) -> aiohttp.ClientSession:
-        """Get or create aiohttp session."""
-        if self._session is None or self._session.closed:
-            self._session = aiohttp.ClientSession(
-                timeout=aiohttp.ClientTimeout(total=30),
+    async def _get_session(self) -> httpx.AsyncClient:
+        """
+        Get or create the HTTP client.
+        
+        HTTP/2 lets concurrent article fetches share one TLS connection per
+        host instead of opening one each.
+        """
+        if self._session is None or self._session.is_closed:
+            self._session = httpx.AsyncClient(
+                http2=True,
+                timeout=30.0,
+                limits=httpx.Limits(
+                    max_connections=self.LIVE_FETCH_CONCURRENCY,
+                    max_keepalive_connections=self.LIVE_FETCH_CONCURRENCY
+                ),
                 headers={
                     "User-Agent": "LawVisor/1.0 Legal Compliance Analyzer"
                 }
@@ -302,8 +440,29 @@ class RegulationsFetcher:
     
     async def close(self):
         """Close the HTTP session."""
-        if self._session and not self._session.closed:
-            await self._session.close()
+        if self._session and not self._session.is_closed:
+            await self._session.aclose()
+    
+    async def warmup(self) -> None:
+        """Load every known GDPR article and SEC regulation into the cache."""
+        await asyncio.gather(
+            self.fetch_all_gdpr_articles(),
+            self.fetch_all_sec_regulations()
+        )
+        await self._build_clause_index()
+    
+    async def _build_clause_index(self) -> None:
+        """Resolve the articles of every clause type in CLAUSE_REGULATION_MAP."""
+        clause_types = list(CLAUSE_REGULATION_MAP)
+        resolved = await asyncio.gather(*[
+            self._fetch_relevant_regulations(clause_type)
+            for clause_type in clause_types
+        ])
+        self._clause_index = {
+            clause_type: tuple(articles)
+            for clause_type, articles in zip(clause_types, resolved)
+        }
+        self._clause_index_expires = time.monotonic() + self._cache_ttl_s
     
     async def fetch_gdpr_article(
         self, 
@@ -320,9 +479,9 @@ class RegulationsFetcher:
         """
         cache_key = f"gdpr_article_{article_number}"
         
-        # Check cache first
-        cached = self._get_cached(cache_key)
-        if cached:
+        # Check cache first; a hit may be a remembered "not found"
+        hit, cached = self._get_cached(cache_key)
+        if hit:
             logger.debug(f"Cache hit for GDPR Article {article_number}")
             return cached
         
@@ -335,10 +494,10 @@ class RegulationsFetcher:
         except Exception as e:
             logger.warning(f"Live GDPR fetch failed: {e}")
         
-        # Fallback to pre-defined data
-        article = self._get_gdpr_predefined(article_number)
-        if article:
-            self._set_cached(cache_key, article)
+        # Fallback to pre-defined data. Cache misses too, so an unknown
+        # article doesn't cost a network round-trip on every call
+        article = PREDEFINED_GDPR_ARTICLES.get(article_number)
+        self._set_cached(cache_key, article)
         
         return article
     
@@ -352,17 +511,18 @@ class RegulationsFetcher:
         session = await self._get_session()
         
         try:
-            async with session.get(url) as response:
-                if response.status != 200:
+            async with self._live_fetch_slots:
+                response = await session.get(url)
+                if response.status_code != 200:
                     return None
                 
-                html = await response.text()
+                html = response.text
                 
                 # Parse the article content
                 article = self._parse_gdpr_html(html, article_number, url)
                 return article
                 
-        except aiohttp.ClientError as e:
+        except httpx.HTTPError as e:
             logger.error(f"Failed to fetch GDPR article {article_number}: {e}")
             return None
     
@@ -373,27 +533,22 @@ class RegulationsFetcher:
         source_url: str
     ) -> RegulationArticle | None:
         """Parse GDPR article from HTML content."""
+        tree = HTMLParser(html)
+        
         # Extract title
-        title_match = re.search(
-            r'<h1[^>]*>Art\.\s*\d+\s*GDPR\s*[–-]\s*([^<]+)</h1>', 
-            html
+        heading = tree.css_first("h1")
+        title_match = GDPR_TITLE_RE.search(
+            WHITESPACE_RE.sub(" ", heading.text(separator=" ")) if heading else ""
         )
         title = title_match.group(1).strip() if title_match else f"Article {article_number}"
         
-        # Extract article text
-        text_match = re.search(
-            r'<div class="entry-content"[^>]*>(.*?)</div>', 
-            html, 
-            re.DOTALL
-        )
+        # Extract article text; the parser drops tags and decodes entities
+        body = tree.css_first("div.entry-content")
         
-        if not text_match:
+        if body is None:
             return None
         
-        raw_text = text_match.group(1)
-        # Clean HTML tags
-        full_text = re.sub(r'<[^>]+>', '', raw_text)
-        full_text = re.sub(r'\s+', ' ', full_text).strip()
+        full_text = WHITESPACE_RE.sub(" ", body.text(separator=" ")).strip()
         
         # Get additional data from predefined if available
         predefined = GDPR_ARTICLES_DATA.get(article_number, {})
@@ -412,36 +567,6 @@ class RegulationsFetcher:
             related_articles=[]
         )
     
-    def _get_gdpr_predefined(
-        self, 
-        article_number: str
-    ) -> RegulationArticle | None:
-        """Get GDPR article from pre-defined data."""
-        data = GDPR_ARTICLES_DATA.get(article_number)
-        
-        if not data:
-            return None
-        
-        # Construct full text from subsections if available
-        full_text_parts = [data["title"]]
-        if "subsections" in data:
-            for key, value in data["subsections"].items():
-                full_text_parts.append(f"({key}) {value}")
-        
-        return RegulationArticle(
-            regulation_id=f"GDPR-Art-{article_number}",
-            regulation_type=RegulationType.GDPR,
-            article_number=article_number,
-            title=data["title"],
-            full_text=" ".join(full_text_parts),
-            summary=data["title"],
-            key_requirements=data.get("key_requirements", []),
-            penalties=data.get("penalties", []),
-            last_updated=datetime.utcnow(),
-            source_url=f"https://gdpr-info.eu/art-{article_number}-gdpr/",
-            related_articles=[]
-        )
-    
     async def fetch_sec_regulation(
         self, 
         regulation_id: str
@@ -458,53 +583,25 @@ class RegulationsFetcher:
         cache_key = f"sec_regulation_{regulation_id}"
         
         # Check cache first
-        cached = self._get_cached(cache_key)
-        if cached:
+        hit, cached = self._get_cached(cache_key)
+        if hit:
             logger.debug(f"Cache hit for SEC Regulation {regulation_id}")
             return cached
         
         # Use pre-defined SEC data (SEC website requires special access)
-        article = self._get_sec_predefined(regulation_id)
+        article = PREDEFINED_SEC_REGULATIONS.get(regulation_id)
         if article:
             self._set_cached(cache_key, article)
         
         return article
     
-    def _get_sec_predefined(
-        self, 
-        regulation_id: str
-    ) -> RegulationArticle | None:
-        """Get SEC regulation from pre-defined data."""
-        data = SEC_REGULATIONS_DATA.get(regulation_id)
-        
-        if not data:
-            return None
-        
-        full_text = f"{data['title']}. "
-        full_text += ". ".join(data["key_requirements"])
-        
-        return RegulationArticle(
-            regulation_id=f"SEC-{regulation_id}",
-            regulation_type=RegulationType.SEC,
-            article_number=regulation_id,
-            title=data["title"],
-            full_text=full_text,
-            summary=data["title"],
-            key_requirements=data["key_requirements"],
-            penalties=[],  # SEC penalties are case-specific
-            last_updated=datetime.utcnow(),
-            source_url=f"https://www.sec.gov/rules/{regulation_id.lower()}",
-            related_articles=[]
-        )
-    
     async def fetch_all_gdpr_articles(self) -> RegulationSet:
         """Fetch all key GDPR articles."""
-        articles = []
-        
-        for article_num in GDPR_ARTICLES_DATA.keys():
-            article = await self.fetch_gdpr_article(article_num)
-            if article:
-                articles.append(article)
+        fetched = await asyncio.gather(*[
+            self.fetch_gdpr_article(article_num)
+            for article_num in GDPR_ARTICLES_DATA.keys()
+        ])
+        articles = [article for article in fetched if article]
         
         return RegulationSet(
             regulation_type=RegulationType.GDPR,
@@ -516,12 +613,11 @@ class RegulationsFetcher:
     
     async def fetch_all_sec_regulations(self) -> RegulationSet:
         """Fetch all key SEC regulations."""
-        articles = []
-        
-        for reg_id in SEC_REGULATIONS_DATA.keys():
-            article = await self.fetch_sec_regulation(reg_id)
-            if article:
-                articles.append(article)
+        fetched = await asyncio.gather(*[
+            self.fetch_sec_regulation(reg_id)
+            for reg_id in SEC_REGULATIONS_DATA.keys()
+        ])
+        articles = [article for article in fetched if article]
         
         return RegulationSet(
             regulation_type=RegulationType.SEC,
@@ -538,86 +634,113 @@ class RegulationsFetcher:
         """
         Get regulations relevant to a specific clause type.
         
-        Maps clause types to relevant regulatory articles.
+        Maps clause types to relevant regulatory articles. After warmup
+        this is a lookup in the prebuilt clause index.
         """
-        # Mapping of clause types to relevant regulations
-        relevance_map = {
-            "data_protection": [
-                ("gdpr", ["5", "6", "7", "12", "13", "25", "32"]),
-            ],
-            "liability": [
-                ("sec", ["10b-5"]),
-            ],
-            "confidentiality": [
-                ("gdpr", ["5", "32"]),
-            ],
-            "intellectual_property": [
-                ("gdpr", ["5"]),
-            ],
-            "jurisdiction": [
-                ("gdpr", ["44", "46"]),
-            ],
-            "termination": [
-                ("gdpr", ["17"]),
-            ],
-            "indemnification": [
-                ("sec", ["10b-5"]),
-            ],
-        }
+        if time.monotonic() < self._clause_index_expires:
+            articles = self._clause_index.get(clause_type)
+            if articles is not None:
+                return list(articles)
         
-        regulations = []
-        mappings = relevance_map.get(clause_type, [])
+        return await self._fetch_relevant_regulations(clause_type)
+    
+    async def _fetch_relevant_regulations(
+        self,
+        clause_type: str
+    ) -> list[RegulationArticle]:
+        """Fetch the mapped articles for a clause type through the cache."""
+        fetchers = {
+            "gdpr": self.fetch_gdpr_article,
+            "sec": self.fetch_sec_regulation,
+        }
+        mappings = CLAUSE_REGULATION_MAP.get(clause_type, ())
         
-        for reg_type, article_ids in mappings:
-            for article_id in article_ids:
-                if reg_type == "gdpr":
-                    article = await self.fetch_gdpr_article(article_id)
-                elif reg_type == "sec":
-                    article = await self.fetch_sec_regulation(article_id)
-                else:
-                    continue
-                
-                if article:
-                    regulations.append(article)
+        # Articles are independent; fetch them concurrently, in map order
+        fetched = await asyncio.gather(*[
+            fetchers[reg_type](article_id)
+            for reg_type, article_ids in mappings
+            if reg_type in fetchers
+            for article_id in article_ids
+        ])
+        regulations = [article for article in fetched if article]
         
         return regulations
     
-    def _get_cached(self, key: str) -> RegulationArticle | None:
-        """Get item from cache if not expired."""
+    def _get_cached(self, key: str) -> tuple[bool, RegulationArticle | None]:
+        """
+        Get item from cache if not expired.
+        
+        Returns:
+            Tuple of (hit, article). A hit with article None is a cached
+            "not found".
+        """
+        # Memory first: no SQLite read or dict -> dataclass rebuild
+        entry = self._memory_cache.get(key)
+        if entry is not None:
+            expires_at, article = entry
+            if time.monotonic() < expires_at:
+                self._memory_cache.move_to_end(key)
+                return True, article
+            del self._memory_cache[key]
+        
         try:
             cached_data = self._cache.get(key)
+            if isinstance(cached_data, bytes):
+                cached_data = orjson.loads(cached_data)
             if cached_data:
                 # Check TTL
                 cached_at = cached_data.get("cached_at")
                 if cached_at:
-                    cached_time = datetime.fromisoformat(cached_at)
-                    if datetime.utcnow() - cached_time < self._cache_ttl:
-                        return self._dict_to_article(cached_data["article"])
+                    if isinstance(cached_at, str):
+                        # Entries written before epoch timestamps (naive UTC)
+                        cached_at = datetime.fromisoformat(cached_at).replace(
+                            tzinfo=timezone.utc
+                        ).timestamp()
+                    article_data = cached_data["article"]
+                    ttl = self._cache_ttl_s if article_data else self._negative_ttl_s
+                    age = time.time() - cached_at
+                    if age < ttl:
+                        article = self._dict_to_article(article_data) if article_data else None
+                        self._remember(key, article, ttl - age)
+                        return True, article
         except Exception as e:
             logger.warning(f"Cache read error: {e}")
-        return None
+        return False, None
     
-    def _set_cached(self, key: str, article: RegulationArticle):
-        """Set item in cache."""
+    def _remember(self, key: str, article: RegulationArticle | None, ttl: float):
+        """Put an article (or a "not found") in the in-memory LRU for ttl seconds."""
+        self._memory_cache[key] = (time.monotonic() + ttl, article)
+        self._memory_cache.move_to_end(key)
+        while len(self._memory_cache) > self.MEMORY_CACHE_SIZE:
+            self._memory_cache.popitem(last=False)
+    
+    def _set_cached(self, key: str, article: RegulationArticle | None):
+        """Set item in cache; None records a short-lived "not found"."""
+        self._remember(
+            key, article, self._cache_ttl_s if article else self._negative_ttl_s
+        )
         try:
-            self._cache.set(key, {
-                "cached_at": datetime.utcnow().isoformat(),
-                "article": article.to_dict()
-            })
+            # Stored as JSON bytes: diskcache keeps bytes as-is, no pickling
+            self._cache.set(key, orjson.dumps({
+                "cached_at": time.time(),
+                "article": article
+            }))
         except Exception as e:
             logger.warning(f"Cache write error: {e}")
     
     def _dict_to_article(self, data: dict) -> RegulationArticle:
         """Convert dictionary back to RegulationArticle."""
+        # Decoded strings are fresh copies; interning maps the ids and
+        # shared requirement/penalty text back onto the pre-defined ones
         return RegulationArticle(
-            regulation_id=data["regulation_id"],
+            regulation_id=sys.intern(data["regulation_id"]),
             regulation_type=RegulationType(data["regulation_type"]),
-            article_number=data["article_number"],
+            article_number=sys.intern(data["article_number"]),
             title=data["title"],
             full_text=data["full_text"],
             summary=data["summary"],
-            key_requirements=data["key_requirements"],
-            penalties=data["penalties"],
+            key_requirements=_intern_all(data["key_requirements"]),
+            penalties=_intern_all(data["penalties"]),
             last_updated=datetime.fromisoformat(data["last_updated"]),
             source_url=data["source_url"],
             related_articles=data.get("related_articles", [])
@@ -625,24 +748,26 @@ class RegulationsFetcher:
     
     def _generate_summary(self, text: str, max_length: int = 200) -> str:
         """Generate a summary from full text."""
-        # Simple extraction of first sentences
-        sentences = text.split('.')
-        summary = ""
-        for sentence in sentences:
-            if len(summary) + len(sentence) < max_length:
-                summary += sentence.strip() + ". "
-            else:
+        # Simple extraction of first sentences. Walk the text with find()
+        # so only the sentences that fit are ever sliced out
+        parts = []
+        length = 0
+        pos = 0
+        while True:
+            end = text.find('.', pos)
+            sentence = text[pos:] if end < 0 else text[pos:end]
+            if length + len(sentence) >= max_length:
                 break
-        return summary.strip()
-
-
-# Singleton instance
-_regulations_fetcher: RegulationsFetcher | None = None
+            sentence = sentence.strip()
+            parts.append(sentence)
+            length += len(sentence) + 2  # plus the ". " separator
+            if end < 0:
+                break
+            pos = end + 1
+        return ". ".join(parts) + "." if parts else ""
 
 
+@lru_cache(maxsize=1)
 def get_regulations_fetcher() -> RegulationsFetcher:
     """Get singleton RegulationsFetcher instance."""
-    global _regulations_fetcher
-    if _regulations_fetcher is None:
-        _regulations_fetcher = RegulationsFetcher()
-    return _regulations_fetcher
+    return RegulationsFetcher()
@@ -0,0 +1,101 @@
+"""
+LawVisor Report Store Module
+============================
+Persistent storage for completed risk reports.
+
+Reports are large (every clause risk, factor, and citation), so they are
+kept out of the document records: status polls then read only a small
+metadata record, and process memory stays bounded no matter how many
+documents have been analyzed. A small in-memory LRU keeps recently viewed
+reports resident.
+"""
+
+import asyncio
+import hashlib
+import logging
+import pickle
+from collections import OrderedDict
+from functools import lru_cache
+
+from diskcache import Cache
+
+from core.config import get_settings
+from core.risk_engine import ContractRiskReport
+
+logger = logging.getLogger(__name__)
+
+
+class ReportStore:
+    """Disk-backed risk report store with an in-memory LRU in front."""
+
+    def __init__(self, directory: str, memory_size: int = 32):
+        self._cache = Cache(directory)
+        self._memory: OrderedDict[str, ContractRiskReport] = OrderedDict()
+        self._memory_size = memory_size
+
+    def _remember(self, document_id: str, report: ContractRiskReport) -> None:
+        """Put a report in the LRU, evicting the least recently used."""
+        self._memory[document_id] = report
+        self._memory.move_to_end(document_id)
+        while len(self._memory) > self._memory_size:
+            self._memory.popitem(last=False)
+
+    async def get(self, document_id: str) -> ContractRiskReport | None:
+        """Get a document's risk report, or None if there isn't one."""
+        report = self._memory.get(document_id)
+        if report is not None:
+            self._memory.move_to_end(document_id)
+            return report
+
+        # Unpickling a large report is CPU work; keep it off the event loop
+        report = await asyncio.to_thread(self._get_sync, document_id)
+        if report is not None:
+            self._remember(document_id, report)
+        return report
+
+    async def set(self, document_id: str, report: ContractRiskReport) -> str:
+        """
+        Persist a document's risk report.
+
+        Returns:
+            A strong ETag (quoted) identifying this report's content
+        """
+        etag = await asyncio.to_thread(self._set_sync, document_id, report)
+        self._remember(document_id, report)
+        return etag
+
+    def _get_sync(self, document_id: str) -> ContractRiskReport | None:
+        """Load and unpickle a stored report."""
+        data = self._cache.get(document_id)
+        return pickle.loads(data) if data is not None else None
+
+    def _set_sync(self, document_id: str, report: ContractRiskReport) -> str:
+        """
+        Store a report and hash its serialized form.
+
+        The report is pickled once here and stored as those bytes, so the
+        ETag hash and the stored copy share a single serialization.
+        """
+        data = pickle.dumps(report, protocol=pickle.HIGHEST_PROTOCOL)
+        digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+        self._cache.set(document_id, data)
+        return f'"{digest}"'
+
+    async def delete(self, document_id: str) -> None:
+        """Remove a document's risk report if present."""
+        self._memory.pop(document_id, None)
+        await asyncio.to_thread(self._cache.delete, document_id)
+
+    async def close(self) -> None:
+        """Close the underlying cache."""
+        self._cache.close()
+
+
+@lru_cache(maxsize=1)
+def get_report_store() -> ReportStore:
+    """Get the shared ReportStore instance."""
+    settings = get_settings()
+    return ReportStore(
+        str(settings.report_store_dir),
+        memory_size=settings.report_cache_size
+    )
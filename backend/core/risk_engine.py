@@ -11,13 +11,18 @@ Key Features:
 - Full explainability of scores
 """
 
+import heapq
 import logging
-from dataclasses import dataclass, field
-from datetime import datetime
+from bisect import bisect_right
+from dataclasses import dataclass
+from datetime import datetime, timezone
 from enum import Enum
-from typing import Any
+from functools import lru_cache
+from typing import Any, Iterable
 
-from core.clause_extractor import ExtractedClause
+import numpy as np
+
+from core.clause_extractor import ClauseType, ExtractedClause
 from core.config import RISK_LEVELS
 from core.rag_engine import ComplianceAnalysis
 
@@ -33,8 +38,51 @@ class RiskLevel(str, Enum):
     MINIMAL = "minimal"
 
 
-@dataclass
-class ClauseRisk:
+@lru_cache(maxsize=4096)
+def _citation(
+    regulation_id: str,
+    title: str,
+    source_url: str,
+    regulation_type: str
+) -> dict[str, str]:
+    """
+    Citation entry for a regulation.
+    
+    The same handful of regulations is cited across clauses and reports,
+    so one dict per regulation is shared by every report citing it;
+    treat it as read-only.
+    """
+    return {
+        "regulation_id": regulation_id,
+        "title": title,
+        "source_url": source_url,
+        "regulation_type": regulation_type
+    }
+
+
+def _first_unique(items: Iterable[str], limit: int) -> list[str]:
+    """The first `limit` distinct items, in order; stops reading once found."""
+    unique: dict[str, None] = {}
+    for item in items:
+        unique[item] = None
+        if len(unique) == limit:
+            break
+    return list(unique)
+
+
+class _DictMemo:
+    """
+    Slot for the to_dict() memo; unset until to_dict() first runs.
+    
+    It is not a dataclass field, so it stays out of fields(), comparisons,
+    and pickled state: a stored report never carries a second copy of its
+    dict.
+    """
+    __slots__ = ("_dict",)
+
+
+@dataclass(slots=True, frozen=True)
+class ClauseRisk(_DictMemo):
     """Risk assessment for a single clause."""
     clause_id: str
     clause_type: str
@@ -42,14 +90,60 @@ class ClauseRisk:
     clause_text_preview: str
     risk_score: float  # 0-100
     risk_level: RiskLevel
-    contributing_factors: list[dict[str, Any]]
+    base_score: float | None  # compliance score; None when no analysis was available
+    weight: float  # clause type weight
+    confidence_factor: float
     violated_regulations: list[str]
     recommendations: list[str]
     explanation: str
     confidence: float
     
+    @property
+    def contributing_factors(self) -> list[dict[str, Any]]:
+        """The factors behind risk_score, built from the stored values on demand."""
+        if self.base_score is None:
+            return [
+                {
+                    "factor": "Missing Analysis",
+                    "value": 50,
+                    "description": "Default score - analysis not available"
+                }
+            ]
+        return [
+            {
+                "factor": "Base Compliance Score",
+                "value": self.base_score,
+                "description": "Score from regulatory compliance analysis"
+            },
+            {
+                "factor": "Clause Type Weight",
+                "value": self.weight,
+                "description": f"Importance weight for {self.clause_type}"
+            },
+            {
+                "factor": "Confidence Factor",
+                "value": self.confidence_factor,
+                "description": "Adjustment based on analysis confidence"
+            }
+        ]
+    
     def to_dict(self) -> dict[str, Any]:
-        """Convert to dictionary."""
+        """
+        Convert to dictionary.
+        
+        The result is built once and shared: a clause appears in its
+        category, in all_clause_risks, and possibly in top_risks, so a
+        report would otherwise serialize it up to three times. Treat the
+        returned dict as read-only.
+        """
+        memo = getattr(self, "_dict", None)
+        if memo is None:
+            memo = self._build_dict()
+            object.__setattr__(self, "_dict", memo)
+        return memo
+    
+    def _build_dict(self) -> dict[str, Any]:
+        """Build the dictionary returned by to_dict."""
         return {
             "clause_id": self.clause_id,
             "clause_type": self.clause_type,
@@ -65,8 +159,8 @@ class ClauseRisk:
         }
 
 
-@dataclass
-class CategoryRisk:
+@dataclass(slots=True, frozen=True)
+class CategoryRisk(_DictMemo):
     """Aggregated risk for a clause category."""
     category: str
     category_display: str
@@ -78,7 +172,15 @@ class CategoryRisk:
     clauses: list[ClauseRisk]
     
     def to_dict(self) -> dict[str, Any]:
-        """Convert to dictionary."""
+        """Convert to dictionary (built once; treat as read-only)."""
+        memo = getattr(self, "_dict", None)
+        if memo is None:
+            memo = self._build_dict()
+            object.__setattr__(self, "_dict", memo)
+        return memo
+    
+    def _build_dict(self) -> dict[str, Any]:
+        """Build the dictionary returned by to_dict."""
         return {
             "category": self.category,
             "category_display": self.category_display,
@@ -91,8 +193,8 @@ class CategoryRisk:
         }
 
 
-@dataclass
-class ContractRiskReport:
+@dataclass(slots=True, frozen=True)
+class ContractRiskReport(_DictMemo):
     """Complete risk assessment for a contract."""
     document_id: str
     analyzed_at: datetime
@@ -111,10 +213,25 @@ class ContractRiskReport:
     scoring_breakdown: dict[str, Any]
     
     def to_dict(self) -> dict[str, Any]:
-        """Convert to dictionary."""
+        """
+        Convert to dictionary.
+        
+        analyzed_at stays a datetime; the API serializes with orjson, which
+        encodes datetimes natively. The dict is built once per report and
+        reused while the report stays in the in-memory report cache; treat
+        it as read-only.
+        """
+        memo = getattr(self, "_dict", None)
+        if memo is None:
+            memo = self._build_dict()
+            object.__setattr__(self, "_dict", memo)
+        return memo
+    
+    def _build_dict(self) -> dict[str, Any]:
+        """Build the dictionary returned by to_dict."""
         return {
             "document_id": self.document_id,
-            "analyzed_at": self.analyzed_at.isoformat(),
+            "analyzed_at": self.analyzed_at,
             "overall_risk_score": round(self.overall_risk_score, 2),
             "overall_risk_level": self.overall_risk_level.value,
             "total_clauses_analyzed": self.total_clauses_analyzed,
@@ -177,6 +294,69 @@ CATEGORY_DISPLAY_NAMES = {
     "unknown": "Other Provisions"
 }
 
+# Lookup tables indexed by a clause type's position in ClauseType, so
+# per-clause weights and names are array gathers rather than dict probes
+CLAUSE_TYPE_INDEX = {clause_type: i for i, clause_type in enumerate(ClauseType)}
+CLAUSE_TYPE_NAMES = tuple(clause_type.value for clause_type in ClauseType)
+WEIGHT_LUT = np.array([CLAUSE_TYPE_WEIGHTS.get(name, 1.0) for name in CLAUSE_TYPE_NAMES])
+CATEGORY_DISPLAY_LUT = tuple(
+    CATEGORY_DISPLAY_NAMES.get(name, name) for name in CLAUSE_TYPE_NAMES
+)
+
+# Lower score bound of each risk level above MINIMAL; bisect_right (or
+# np.digitize) against these gives the position of a score's level in
+# RISK_LEVEL_BY_BIN
+RISK_LEVEL_BOUNDS = (20, 40, 60, 80)
+RISK_LEVEL_THRESHOLDS = np.array(RISK_LEVEL_BOUNDS)
+RISK_LEVEL_BY_BIN = (
+    RiskLevel.MINIMAL,
+    RiskLevel.LOW,
+    RiskLevel.MEDIUM,
+    RiskLevel.HIGH,
+    RiskLevel.CRITICAL
+)
+HIGH_RISK_BIN = RISK_LEVEL_BY_BIN.index(RiskLevel.HIGH)
+
+# How the report summary describes a contract at each overall risk level
+RISK_LEVEL_DESCRIPTIONS = {
+    RiskLevel.CRITICAL: "requires immediate attention",
+    RiskLevel.HIGH: "contains significant compliance concerns",
+    RiskLevel.MEDIUM: "has moderate compliance issues that should be addressed",
+    RiskLevel.LOW: "has minor issues that may warrant review",
+    RiskLevel.MINIMAL: "appears to be well-structured with minimal compliance concerns"
+}
+
+
+@dataclass(slots=True)
+class ClauseScores:
+    """
+    Per-clause scoring inputs and results as parallel arrays.
+    
+    Element i of every array belongs to the i-th clause of the report, so
+    the scoring math runs as a handful of vectorized operations instead of
+    a Python loop over ClauseRisk objects.
+    """
+    base: np.ndarray  # compliance risk score (50 when no analysis)
+    weights: np.ndarray  # clause type weight
+    confidence: np.ndarray  # analysis confidence (0 when no analysis)
+    confidence_factor: np.ndarray
+    final: np.ndarray  # final clause risk score
+    levels: np.ndarray  # RISK_LEVEL_BY_BIN index of the final score
+    category_idx: np.ndarray  # index into category_types
+    category_types: np.ndarray  # clause type index of each category, by first appearance
+
+
+@dataclass(slots=True)
+class RiskStats:
+    """Contract-wide clause statistics, computed once per report."""
+    clause_count: int
+    weighted_avg: float  # clause scores averaged by clause type weight
+    max_risk: float
+    high: int  # HIGH or CRITICAL clauses
+    medium: int
+    low: int  # LOW or MINIMAL clauses
+    avg_confidence: float
+
 
 class RiskEngine:
     """
@@ -192,11 +372,7 @@ class RiskEngine:
     All calculations are deterministic and explainable.
     """
     
-    def __init__(self):
-        self.clause_weights = CLAUSE_TYPE_WEIGHTS
-        self.category_names = CATEGORY_DISPLAY_NAMES
-    
-    async def calculate_risk_report(
+    def calculate_risk_report(
         self,
         document_id: str,
         clauses: list[ExtractedClause],
@@ -208,7 +384,9 @@ class RiskEngine:
         Args:
             document_id: Unique document identifier
             clauses: Extracted clauses from the document
-            analyses: Compliance analyses for each clause
+            analyses: Compliance analyses for each clause; normally one per
+                clause in the same order (matched by position), otherwise
+                matched by clause_id
             
         Returns:
             ContractRiskReport with full risk breakdown
@@ -216,40 +394,23 @@ class RiskEngine:
         logger.info(f"Calculating risk report for document: {document_id}")
         
         # Step 1: Calculate individual clause risks
-        clause_risks = self._calculate_clause_risks(clauses, analyses)
+        matched = self._match_analyses(clauses, analyses)
+        scores = self._score_clauses(clauses, matched)
+        clause_risks = self._calculate_clause_risks(clauses, matched, scores)
+        
+        stats = self._compute_stats(scores)
         
         # Step 2: Aggregate by category
-        category_risks = self._aggregate_by_category(clause_risks)
+        category_risks = self._aggregate_by_category(clause_risks, scores)
         
         # Step 3: Calculate overall contract risk
-        overall_score, scoring_breakdown = self._calculate_overall_score(
-            clause_risks, 
-            category_risks
-        )
+        overall_score, scoring_breakdown = self._calculate_overall_score(stats)
         overall_level = self._score_to_level(overall_score)
         
         # Step 4: Extract top risks
-        top_risks = sorted(
-            clause_risks, 
-            key=lambda r: r.risk_score, 
-            reverse=True
-        )[:5]
-        
-        # Step 5: Count risk levels
-        high_risk_count = sum(
-            1 for r in clause_risks 
-            if r.risk_level in [RiskLevel.CRITICAL, RiskLevel.HIGH]
-        )
-        medium_risk_count = sum(
-            1 for r in clause_risks 
-            if r.risk_level == RiskLevel.MEDIUM
-        )
-        low_risk_count = sum(
-            1 for r in clause_risks 
-            if r.risk_level in [RiskLevel.LOW, RiskLevel.MINIMAL]
-        )
+        top_risks = heapq.nlargest(5, clause_risks, key=lambda r: r.risk_score)
         
-        # Step 6: Generate summary
+        # Step 5: Generate summary
         summary = self._generate_summary(
             overall_score, 
             overall_level, 
@@ -257,85 +418,143 @@ class RiskEngine:
             top_risks
         )
         
-        # Step 7: Collect all citations
+        # Step 6: Collect all citations
         citations = self._collect_citations(analyses)
         
-        # Step 8: Calculate overall confidence
-        avg_confidence = (
-            sum(r.confidence for r in clause_risks) / len(clause_risks)
-            if clause_risks else 0
-        )
-        
         return ContractRiskReport(
             document_id=document_id,
-            analyzed_at=datetime.utcnow(),
+            analyzed_at=datetime.now(timezone.utc),
             overall_risk_score=overall_score,
             overall_risk_level=overall_level,
-            total_clauses_analyzed=len(clause_risks),
-            high_risk_clause_count=high_risk_count,
-            medium_risk_clause_count=medium_risk_count,
-            low_risk_clause_count=low_risk_count,
+            total_clauses_analyzed=stats.clause_count,
+            high_risk_clause_count=stats.high,
+            medium_risk_clause_count=stats.medium,
+            low_risk_clause_count=stats.low,
             category_risks=category_risks,
             top_risks=top_risks,
             all_clause_risks=clause_risks,
             summary=summary,
             citations=citations,
-            confidence=avg_confidence,
+            confidence=stats.avg_confidence,
             scoring_breakdown=scoring_breakdown
         )
     
-    def _calculate_clause_risks(
+    def _match_analyses(
         self,
         clauses: list[ExtractedClause],
         analyses: list[ComplianceAnalysis]
-    ) -> list[ClauseRisk]:
-        """Calculate risk for each individual clause."""
-        # Build analysis lookup
+    ) -> list[ComplianceAnalysis | None]:
+        """Pair each clause with its analysis (None if it has none)."""
+        # The pipeline passes analyses aligned with the clauses; the ids are
+        # then the same string objects, so the check is identity compares
+        if len(analyses) == len(clauses) and all(
+            analysis.clause_id == clause.clause_id
+            for clause, analysis in zip(clauses, analyses)
+        ):
+            return list(analyses)
+        
         analysis_map = {a.clause_id: a for a in analyses}
+        return [analysis_map.get(clause.clause_id) for clause in clauses]
+    
+    def _score_clauses(
+        self,
+        clauses: list[ExtractedClause],
+        matched: list[ComplianceAnalysis | None]
+    ) -> ClauseScores:
+        """Compute every clause's risk score in one vectorized pass."""
+        count = len(clauses)
+        has_analysis = np.fromiter(
+            (analysis is not None for analysis in matched), bool, count
+        )
+        base = np.fromiter(
+            (analysis.risk_score if analysis else 50 for analysis in matched),
+            float,
+            count
+        )
+        confidence = np.fromiter(
+            (analysis.confidence if analysis else 0.0 for analysis in matched),
+            float,
+            count
+        )
+        type_idx = np.fromiter(
+            (CLAUSE_TYPE_INDEX[clause.clause_type] for clause in clauses),
+            np.intp,
+            count
+        )
+        weights = WEIGHT_LUT[type_idx]
+        
+        # Number categories in order of first appearance
+        present_types, first_seen = np.unique(type_idx, return_index=True)
+        category_types = present_types[np.argsort(first_seen)]
+        category_of_type = np.empty(len(CLAUSE_TYPE_NAMES), np.intp)
+        category_of_type[category_types] = np.arange(category_types.size)
+        category_idx = category_of_type[type_idx]
+        
+        # Apply clause type weight, then factor in confidence; clauses
+        # without an analysis get a flat medium score
+        confidence_factor = 0.5 + confidence * 0.5
+        weighted = np.minimum(100, base * weights)
+        final = np.where(has_analysis, weighted * confidence_factor, 50.0)
+        levels = np.digitize(final, RISK_LEVEL_THRESHOLDS)
+        
+        return ClauseScores(
+            base=base,
+            weights=weights,
+            confidence=confidence,
+            confidence_factor=confidence_factor,
+            final=final,
+            levels=levels,
+            category_idx=category_idx,
+            category_types=category_types
+        )
+    
+    def _compute_stats(self, scores: ClauseScores) -> RiskStats:
+        """Compute the contract-wide statistics in one go over the score arrays."""
+        final = scores.final
+        if not final.size:
+            return RiskStats(0, 0.0, 0.0, 0, 0, 0, 0.0)
+        
+        minimal, low, medium, high, critical = np.bincount(
+            scores.levels, minlength=len(RISK_LEVEL_BY_BIN)
+        ).tolist()
+        return RiskStats(
+            clause_count=final.size,
+            weighted_avg=float(np.average(final, weights=scores.weights)),
+            max_risk=float(final.max()),
+            high=high + critical,
+            medium=medium,
+            low=low + minimal,
+            avg_confidence=float(scores.confidence.mean())
+        )
+    
+    def _calculate_clause_risks(
+        self,
+        clauses: list[ExtractedClause],
+        matched: list[ComplianceAnalysis | None],
+        scores: ClauseScores
+    ) -> list[ClauseRisk]:
+        """Build the ClauseRisk for each clause from its computed scores."""
+        base_scores = scores.base.tolist()
+        weights = scores.weights.tolist()
+        confidence_factors = scores.confidence_factor.tolist()
+        final_scores = scores.final.tolist()
+        levels = scores.levels.tolist()
         
         clause_risks = []
-        for clause in clauses:
-            analysis = analysis_map.get(clause.clause_id)
+        for i, (clause, analysis) in enumerate(zip(clauses, matched)):
+            final_score = final_scores[i]
             
             if analysis:
-                # Get base risk score from analysis
-                base_score = analysis.risk_score
-                
-                # Apply clause type weight
-                weight = self.clause_weights.get(clause.clause_type.value, 1.0)
-                weighted_score = min(100, base_score * weight)
-                
-                # Factor in confidence
-                confidence_factor = 0.5 + (analysis.confidence * 0.5)
-                final_score = weighted_score * confidence_factor
-                
-                # Build contributing factors
-                contributing_factors = [
-                    {
-                        "factor": "Base Compliance Score",
-                        "value": base_score,
-                        "description": "Score from regulatory compliance analysis"
-                    },
-                    {
-                        "factor": "Clause Type Weight",
-                        "value": weight,
-                        "description": f"Importance weight for {clause.clause_type.value}"
-                    },
-                    {
-                        "factor": "Confidence Factor",
-                        "value": confidence_factor,
-                        "description": "Adjustment based on analysis confidence"
-                    }
-                ]
-                
                 clause_risks.append(ClauseRisk(
                     clause_id=clause.clause_id,
                     clause_type=clause.clause_type.value,
                     clause_title=clause.title,
-                    clause_text_preview=clause.raw_text[:300] + "...",
+                    clause_text_preview=clause.text_preview,
                     risk_score=final_score,
-                    risk_level=self._score_to_level(final_score),
-                    contributing_factors=contributing_factors,
+                    risk_level=RISK_LEVEL_BY_BIN[levels[i]],
+                    base_score=base_scores[i],
+                    weight=weights[i],
+                    confidence_factor=confidence_factors[i],
                     violated_regulations=analysis.violated_regulations,
                     recommendations=analysis.recommendations,
                     explanation=analysis.explanation,
@@ -347,16 +566,12 @@ class RiskEngine:
                     clause_id=clause.clause_id,
                     clause_type=clause.clause_type.value,
                     clause_title=clause.title,
-                    clause_text_preview=clause.raw_text[:300] + "...",
-                    risk_score=50,
+                    clause_text_preview=clause.text_preview,
+                    risk_score=final_score,
                     risk_level=RiskLevel.MEDIUM,
-                    contributing_factors=[
-                        {
-                            "factor": "Missing Analysis",
-                            "value": 50,
-                            "description": "Default score - analysis not available"
-                        }
-                    ],
+                    base_score=None,
+                    weight=weights[i],
+                    confidence_factor=confidence_factors[i],
                     violated_regulations=[],
                     recommendations=["Manual review recommended"],
                     explanation="Compliance analysis not available for this clause.",
@@ -367,51 +582,63 @@ class RiskEngine:
     
     def _aggregate_by_category(
         self, 
-        clause_risks: list[ClauseRisk]
+        clause_risks: list[ClauseRisk],
+        scores: ClauseScores
     ) -> list[CategoryRisk]:
         """Aggregate clause risks by category."""
         # Group clauses by type
-        categories: dict[str, list[ClauseRisk]] = {}
-        for risk in clause_risks:
-            cat = risk.clause_type
-            if cat not in categories:
-                categories[cat] = []
-            categories[cat].append(risk)
+        num_categories = scores.category_types.size
+        grouped: list[list[ClauseRisk]] = [[] for _ in range(num_categories)]
+        for risk, idx in zip(clause_risks, scores.category_idx.tolist()):
+            grouped[idx].append(risk)
+        
+        # Weighted average score and high risk count of every category
+        weighted_sums = np.bincount(
+            scores.category_idx,
+            weights=scores.final * scores.weights,
+            minlength=num_categories
+        )
+        total_weights = np.bincount(
+            scores.category_idx, weights=scores.weights, minlength=num_categories
+        )
+        high_risk_counts = np.bincount(
+            scores.category_idx,
+            weights=scores.levels >= HIGH_RISK_BIN,
+            minlength=num_categories
+        )
+        avg_scores = np.divide(
+            weighted_sums,
+            total_weights,
+            out=np.zeros(num_categories),
+            where=total_weights > 0
+        )
         
         # Calculate category-level risks
         category_risks = []
-        for category, risks in categories.items():
-            # Weighted average score
-            total_weight = sum(
-                self.clause_weights.get(r.clause_type, 1.0) 
-                for r in risks
-            )
-            weighted_sum = sum(
-                r.risk_score * self.clause_weights.get(r.clause_type, 1.0)
-                for r in risks
-            )
-            avg_score = weighted_sum / total_weight if total_weight > 0 else 0
-            
-            # Count high risk clauses
-            high_risk = sum(
-                1 for r in risks 
-                if r.risk_level in [RiskLevel.CRITICAL, RiskLevel.HIGH]
-            )
-            
+        for type_idx, risks, avg_score, risk_level, high_risk in zip(
+            scores.category_types.tolist(),
+            grouped,
+            avg_scores.tolist(),
+            self._scores_to_levels(avg_scores),
+            high_risk_counts.tolist()
+        ):
             # Extract top issues
-            top_issues = []
-            for r in sorted(risks, key=lambda x: x.risk_score, reverse=True)[:3]:
-                if r.violated_regulations:
-                    top_issues.extend(r.violated_regulations[:2])
-            top_issues = list(set(top_issues))[:5]
+            top_issues = _first_unique(
+                (
+                    regulation
+                    for r in heapq.nlargest(3, risks, key=lambda x: x.risk_score)
+                    for regulation in r.violated_regulations[:2]
+                ),
+                5
+            )
             
             category_risks.append(CategoryRisk(
-                category=category,
-                category_display=self.category_names.get(category, category),
+                category=CLAUSE_TYPE_NAMES[type_idx],
+                category_display=CATEGORY_DISPLAY_LUT[type_idx],
                 risk_score=avg_score,
-                risk_level=self._score_to_level(avg_score),
+                risk_level=risk_level,
                 clause_count=len(risks),
-                high_risk_clauses=high_risk,
+                high_risk_clauses=int(high_risk),
                 top_issues=top_issues,
                 clauses=risks
             ))
@@ -423,8 +650,7 @@ class RiskEngine:
     
     def _calculate_overall_score(
         self,
-        clause_risks: list[ClauseRisk],
-        category_risks: list[CategoryRisk]
+        stats: RiskStats
     ) -> tuple[float, dict[str, Any]]:
         """
         Calculate overall contract risk score.
@@ -434,29 +660,19 @@ class RiskEngine:
         2. Maximum clause risk penalty (20%)
         3. High-risk clause density (20%)
         """
-        if not clause_risks:
+        if not stats.clause_count:
             return 0.0, {}
         
         # Factor 1: Weighted average of all clause scores
-        total_weight = sum(
-            self.clause_weights.get(r.clause_type, 1.0) 
-            for r in clause_risks
-        )
-        weighted_avg = sum(
-            r.risk_score * self.clause_weights.get(r.clause_type, 1.0)
-            for r in clause_risks
-        ) / total_weight if total_weight > 0 else 0
+        weighted_avg = stats.weighted_avg
         
         # Factor 2: Maximum risk penalty
-        max_risk = max(r.risk_score for r in clause_risks)
+        max_risk = stats.max_risk
         max_penalty = (max_risk - weighted_avg) * 0.3 if max_risk > weighted_avg else 0
         
         # Factor 3: High-risk density
-        high_risk_count = sum(
-            1 for r in clause_risks 
-            if r.risk_level in [RiskLevel.CRITICAL, RiskLevel.HIGH]
-        )
-        density = high_risk_count / len(clause_risks) if clause_risks else 0
+        high_risk_count = stats.high
+        density = high_risk_count / stats.clause_count
         density_penalty = density * 20  # Up to 20 points
         
         # Combined score
@@ -475,7 +691,7 @@ class RiskEngine:
             },
             "high_risk_density": {
                 "high_risk_count": high_risk_count,
-                "total_clauses": len(clause_risks),
+                "total_clauses": stats.clause_count,
                 "density": round(density, 2),
                 "penalty": round(density_penalty, 2)
             },
@@ -486,16 +702,14 @@ class RiskEngine:
     
     def _score_to_level(self, score: float) -> RiskLevel:
         """Convert numeric score to risk level."""
-        if score >= 80:
-            return RiskLevel.CRITICAL
-        elif score >= 60:
-            return RiskLevel.HIGH
-        elif score >= 40:
-            return RiskLevel.MEDIUM
-        elif score >= 20:
-            return RiskLevel.LOW
-        else:
-            return RiskLevel.MINIMAL
+        return RISK_LEVEL_BY_BIN[bisect_right(RISK_LEVEL_BOUNDS, score)]
+    
+    def _scores_to_levels(self, scores: np.ndarray) -> list[RiskLevel]:
+        """Convert an array of scores to risk levels in one vectorized pass."""
+        return [
+            RISK_LEVEL_BY_BIN[i]
+            for i in np.digitize(scores, RISK_LEVEL_THRESHOLDS).tolist()
+        ]
     
     def _generate_summary(
         self,
@@ -505,18 +719,9 @@ class RiskEngine:
         top_risks: list[ClauseRisk]
     ) -> str:
         """Generate human-readable summary of risk assessment."""
-        # Level descriptions
-        level_descriptions = {
-            RiskLevel.CRITICAL: "requires immediate attention",
-            RiskLevel.HIGH: "contains significant compliance concerns",
-            RiskLevel.MEDIUM: "has moderate compliance issues that should be addressed",
-            RiskLevel.LOW: "has minor issues that may warrant review",
-            RiskLevel.MINIMAL: "appears to be well-structured with minimal compliance concerns"
-        }
-        
         summary_parts = [
             f"This contract has an overall risk score of {overall_score:.0f}/100 "
-            f"({overall_level.value.upper()}) and {level_descriptions[overall_level]}."
+            f"({overall_level.value.upper()}) and {RISK_LEVEL_DESCRIPTIONS[overall_level]}."
         ]
         
         # Add category highlights
@@ -532,10 +737,14 @@ class RiskEngine:
             )
         
         # Add top violations
-        all_violations = []
-        for risk in top_risks:
-            all_violations.extend(risk.violated_regulations)
-        unique_violations = list(set(all_violations))[:3]
+        unique_violations = _first_unique(
+            (
+                regulation
+                for risk in top_risks
+                for regulation in risk.violated_regulations
+            ),
+            3
+        )
         
         if unique_violations:
             summary_parts.append(
@@ -556,11 +765,11 @@ class RiskEngine:
             for reg in analysis.matched_regulations:
                 if reg.regulation_id not in seen_ids:
                     seen_ids.add(reg.regulation_id)
-                    citations.append({
-                        "regulation_id": reg.regulation_id,
-                        "title": reg.title,
-                        "source_url": reg.source_url,
-                        "regulation_type": reg.regulation_type
-                    })
+                    citations.append(_citation(
+                        reg.regulation_id,
+                        reg.title,
+                        reg.source_url,
+                        reg.regulation_type
+                    ))
         
         return citations
@@ -0,0 +1,172 @@
+"""
+LawVisor Semantic Cache Module
+==============================
+Similarity-keyed cache for expensive per-clause results.
+
+Contracts repeat the same boilerplate (indemnification, governing law,
+arbitration, ...) across documents. Instead of keying on exact text, this
+cache keys on the clause embedding and returns a stored result when a new
+embedding is close enough (cosine similarity >= threshold).
+
+Design:
+- Random-projection LSH buckets narrow each lookup to a few candidates
+- Embeddings live in one contiguous int8 matrix (symmetric per-vector
+  scale, 4x smaller than float32) with precomputed L2 norms, so scoring a
+  bucket is a single matrix-vector product
+- Fixed capacity with FIFO eviction keeps memory bounded
+"""
+
+from typing import Any, Generic, Hashable, TypeVar
+
+import numpy as np
+
+T = TypeVar("T")
+
+
+class SemanticCache(Generic[T]):
+    """
+    Approximate-match cache keyed by embedding vectors.
+
+    Lookups hash the query with ``num_planes`` random hyperplanes; only
+    entries in the same bucket (and namespace) are scored. A hit requires
+    cosine similarity of at least ``threshold``.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.95,
+        num_planes: int = 16,
+        max_entries: int = 10_000,
+        seed: int = 0
+    ):
+        self.threshold = threshold
+        self.num_planes = num_planes
+        self.max_entries = max_entries
+        self._rng = np.random.default_rng(seed)
+        self._bit_values = np.left_shift(1, np.arange(num_planes, dtype=np.int64))
+
+        # Initialized lazily once the embedding dimension is known
+        self._planes: np.ndarray | None = None
+        self._codes: np.ndarray | None = None
+        self._scales: np.ndarray | None = None
+        self._norms: np.ndarray | None = None
+
+        self._values: list[T | None] = []
+        self._row_keys: list[tuple[Hashable, int] | None] = []
+        self._buckets: dict[tuple[Hashable, int], list[int]] = {}
+        self._next_row = 0
+        self._size = 0
+
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _init_storage(self, dim: int) -> None:
+        """Allocate projection planes and the embedding matrix."""
+        self._planes = self._rng.standard_normal(
+            (self.num_planes, dim)
+        ).astype(np.float32)
+        self._codes = np.zeros((self.max_entries, dim), dtype=np.int8)
+        self._scales = np.zeros(self.max_entries, dtype=np.float32)
+        self._norms = np.zeros(self.max_entries, dtype=np.float32)
+        self._values = [None] * self.max_entries
+        self._row_keys = [None] * self.max_entries
+
+    def _bucket_key(self, vector: np.ndarray) -> int:
+        """Hash a vector to its LSH bucket (one bit per hyperplane)."""
+        bits = (self._planes @ vector) > 0
+        return int(bits.astype(np.int64) @ self._bit_values)
+
+    def get(self, embedding: Any, namespace: Hashable = None) -> T | None:
+        """
+        Return the cached value for the most similar stored embedding.
+
+        Args:
+            embedding: Query embedding (sequence of floats or ndarray)
+            namespace: Optional partition key; only entries stored under the
+                same namespace are considered
+
+        Returns:
+            The cached value, or None on a miss
+        """
+        if self._codes is None:
+            self.misses += 1
+            return None
+
+        query = np.asarray(embedding, dtype=np.float32)
+        query_norm = float(np.linalg.norm(query))
+        if query_norm == 0.0:
+            self.misses += 1
+            return None
+
+        rows = self._buckets.get((namespace, self._bucket_key(query)))
+        if not rows:
+            self.misses += 1
+            return None
+
+        candidates = np.fromiter(rows, dtype=np.intp, count=len(rows))
+        # Dequantize by folding each row's scale into its dot product
+        dots = (self._codes[candidates] @ query) * self._scales[candidates]
+        sims = dots / (self._norms[candidates] * query_norm)
+        best = int(np.argmax(sims))
+
+        if sims[best] >= self.threshold:
+            self.hits += 1
+            return self._values[candidates[best]]
+
+        self.misses += 1
+        return None
+
+    def set(self, embedding: Any, value: T, namespace: Hashable = None) -> None:
+        """
+        Store a value under an embedding.
+
+        When the cache is full the oldest entry is evicted.
+        """
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = float(np.linalg.norm(vector))
+        if norm == 0.0:
+            return
+
+        if self._codes is None:
+            self._init_storage(vector.shape[0])
+
+        row = self._next_row
+        self._next_row = (row + 1) % self.max_entries
+
+        # Evict whatever currently occupies this row
+        old_key = self._row_keys[row]
+        if old_key is not None:
+            bucket = self._buckets.get(old_key)
+            if bucket is not None:
+                bucket.remove(row)
+                if not bucket:
+                    del self._buckets[old_key]
+        else:
+            self._size += 1
+
+        # Symmetric int8 quantization with one scale per vector
+        scale = float(np.abs(vector).max()) / 127.0
+        codes = np.round(vector / scale).astype(np.int8)
+
+        key = (namespace, self._bucket_key(vector))
+        self._codes[row] = codes
+        self._scales[row] = scale
+        self._norms[row] = float(np.linalg.norm(codes.astype(np.float32))) * scale
+        self._values[row] = value
+        self._row_keys[row] = key
+        self._buckets.setdefault(key, []).append(row)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._planes = None
+        self._codes = None
+        self._scales = None
+        self._norms = None
+        self._values = []
+        self._row_keys = []
+        self._buckets = {}
+        self._next_row = 0
+        self._size = 0
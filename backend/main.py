@@ -20,13 +20,18 @@ from contextlib import asynccontextmanager
 from datetime import datetime
 from pathlib import Path
 
+import orjson
 import structlog
 from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse, Response
 
 from api import analyze_router, risk_router, upload_router
+from api.analyze import get_ocr, get_rag, warmup_engines
 from core.config import get_settings
+from core.document_store import get_document_store
+from core.llm_client import get_llm_client
+from core.report_store import get_report_store
 from core.regulations import get_regulations_fetcher
 from schemas import ErrorResponse, HealthCheckResponse
 
@@ -104,6 +109,15 @@ async def lifespan(app: FastAPI):
     cache_dir.mkdir(parents=True, exist_ok=True)
     logger.info("Cache directory ready", path=str(cache_dir))
     
+    # Load pipeline engines once so the first request doesn't pay for it
+    await warmup_engines()
+    
+    # Pre-load regulations so lookups are served from memory
+    try:
+        await get_regulations_fetcher().warmup()
+    except Exception as e:
+        logger.warning("Regulations warmup failed", error=str(e))
+    
     yield
     
     # Cleanup
@@ -112,6 +126,19 @@ async def lifespan(app: FastAPI):
     # Close regulations fetcher
     fetcher = get_regulations_fetcher()
     await fetcher.close()
+    
+    # Close the shared LLM client's connection pool
+    await get_llm_client().close()
+    
+    # Release Tesseract handles and embedding threads held by the engines
+    # (only if they were built; constructing one here would load its models)
+    for get_engine in (get_ocr, get_rag):
+        if get_engine.cache_info().currsize:
+            await get_engine().close()
+    
+    # Close document and report stores
+    await get_document_store().close()
+    await get_report_store().close()
 
 
 # === Application Setup ===
@@ -159,20 +186,18 @@ app = FastAPI(
     docs_url="/docs",
     redoc_url="/redoc",
     openapi_url="/openapi.json",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
 
 # === CORS Middleware ===
+# allow_origins entries are matched literally, so wildcard subdomains go in
+# the regex: local dev servers and Vercel / Netlify deployments
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=[
-        "http://localhost:3000",  # Next.js dev server
-        "http://localhost:3001",
-        "https://*.vercel.app",   # Vercel deployments
-        "https://*.netlify.app",  # Netlify deployments
-        "*",                      # Allow all for development/testing
-    ],
+    allow_origins=["*"] if settings.debug else [],  # Allow all when debugging
+    allow_origin_regex=r"https?://(localhost:\d+|[^.]+\.(vercel|netlify)\.app)",
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
@@ -252,6 +277,37 @@ app.include_router(analyze_router)
 app.include_router(risk_router)
 
 
+# === OpenAPI Document ===
+# FastAPI caches the schema dict but re-encodes it on every /openapi.json
+# request; keep the encoded bytes alongside the schema they were built from
+_openapi_json: tuple[dict, bytes] | None = None
+
+app.router.routes = [
+    route for route in app.router.routes
+    if getattr(route, "path", None) != app.openapi_url
+]
+
+
+@app.get(app.openapi_url, include_in_schema=False)
+async def openapi_json(request: Request) -> Response:
+    """Serve the OpenAPI document, encoded once per schema build."""
+    global _openapi_json
+    
+    # Same as FastAPI's built-in route: advertise a proxy path prefix in
+    # `servers` (rebuilding the schema) so "Try it out" uses the right base URL
+    root_path = request.scope.get("root_path", "").rstrip("/")
+    server_urls = {server.get("url") for server in app.servers}
+    if root_path and app.root_path_in_servers and root_path not in server_urls:
+        app.servers.insert(0, {"url": root_path})
+        app.openapi_schema = None
+    
+    schema = app.openapi()
+    if _openapi_json is None or _openapi_json[0] is not schema:
+        _openapi_json = (schema, orjson.dumps(schema))
+    
+    return Response(_openapi_json[1], media_type="application/json")
+
+
 # === Main Entry Point ===
 if __name__ == "__main__":
     import uvicorn
@@ -9,7 +9,7 @@ from datetime import datetime
 from enum import Enum
 from typing import Any
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 
 # === Enums ===
@@ -61,9 +61,21 @@ class AnalysisStatusEnum(str, Enum):
     FAILED = "failed"
 
 
+# === Base Model ===
+
+class SchemaModel(BaseModel):
+    """
+    Base for the API schemas.
+    
+    Schema instances are never modified after they are built, so they
+    are frozen.
+    """
+    model_config = ConfigDict(frozen=True)
+
+
 # === Upload Schemas ===
 
-class UploadResponse(BaseModel):
+class UploadResponse(SchemaModel):
     """Response for document upload."""
     document_id: str = Field(..., description="Unique identifier for the uploaded document")
     filename: str = Field(..., description="Original filename")
@@ -72,8 +84,8 @@ class UploadResponse(BaseModel):
     status: AnalysisStatusEnum = Field(..., description="Current processing status")
     message: str = Field(..., description="Status message")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "document_id": "doc-abc123def456",
                 "filename": "contract.pdf",
@@ -83,11 +95,12 @@ class UploadResponse(BaseModel):
                 "message": "Document uploaded successfully. Ready for analysis."
             }
         }
+    )
 
 
 # === Clause Schemas ===
 
-class ClauseSchema(BaseModel):
+class ClauseSchema(SchemaModel):
     """Schema for an extracted clause."""
     clause_id: str = Field(..., description="Unique clause identifier")
     clause_type: ClauseTypeEnum = Field(..., description="Classification of the clause")
@@ -97,8 +110,8 @@ class ClauseSchema(BaseModel):
     page_number: int = Field(..., description="Page where clause appears")
     confidence: float = Field(..., ge=0, le=1, description="Extraction confidence (0-1)")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "clause_id": "CL-abc123",
                 "clause_type": "data_protection",
@@ -109,9 +122,10 @@ class ClauseSchema(BaseModel):
                 "confidence": 0.92
             }
         }
+    )
 
 
-class ExtractionResultSchema(BaseModel):
+class ExtractionResultSchema(SchemaModel):
     """Result of clause extraction."""
     document_id: str
     extracted_at: datetime
@@ -123,14 +137,16 @@ class ExtractionResultSchema(BaseModel):
 
 # === Risk Assessment Schemas ===
 
-class ContributingFactorSchema(BaseModel):
+class ContributingFactorSchema(SchemaModel):
     """A factor contributing to risk score."""
     factor: str = Field(..., description="Name of the factor")
     value: float = Field(..., description="Factor value")
     description: str = Field(..., description="Explanation of the factor")
+    
+    model_config = ConfigDict(from_attributes=True)
 
 
-class ClauseRiskSchema(BaseModel):
+class ClauseRiskSchema(SchemaModel):
     """Risk assessment for a single clause."""
     clause_id: str
     clause_type: ClauseTypeEnum
@@ -144,8 +160,9 @@ class ClauseRiskSchema(BaseModel):
     explanation: str
     confidence: float = Field(..., ge=0, le=1)
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        from_attributes=True,
+        json_schema_extra={
             "example": {
                 "clause_id": "CL-abc123",
                 "clause_type": "data_protection",
@@ -169,9 +186,10 @@ class ClauseRiskSchema(BaseModel):
                 "confidence": 0.85
             }
         }
+    )
 
 
-class CategoryRiskSchema(BaseModel):
+class CategoryRiskSchema(SchemaModel):
     """Aggregated risk for a clause category."""
     category: str
     category_display: str
@@ -180,9 +198,11 @@ class CategoryRiskSchema(BaseModel):
     clause_count: int
     high_risk_clauses: int
     top_issues: list[str]
+    
+    model_config = ConfigDict(from_attributes=True)
 
 
-class CitationSchema(BaseModel):
+class CitationSchema(SchemaModel):
     """A regulatory citation."""
     regulation_id: str
     title: str
@@ -190,7 +210,7 @@ class CitationSchema(BaseModel):
     regulation_type: str
 
 
-class ScoringBreakdownSchema(BaseModel):
+class ScoringBreakdownSchema(SchemaModel):
     """Breakdown of how overall score was calculated."""
     weighted_average: dict[str, float]
     max_risk_penalty: dict[str, float]
@@ -198,7 +218,7 @@ class ScoringBreakdownSchema(BaseModel):
     formula: str
 
 
-class RiskReportSchema(BaseModel):
+class RiskReportSchema(SchemaModel):
     """Complete risk assessment report."""
     document_id: str
     analyzed_at: datetime
@@ -215,9 +235,9 @@ class RiskReportSchema(BaseModel):
     confidence: float = Field(..., ge=0, le=1)
     scoring_breakdown: ScoringBreakdownSchema
     
-    class Config:
-        populate_by_name = True
-        json_schema_extra = {
+    model_config = ConfigDict(
+        populate_by_name=True,
+        json_schema_extra={
             "example": {
                 "document_id": "doc-abc123def456",
                 "analyzed_at": "2024-01-15T10:45:00Z",
@@ -235,11 +255,12 @@ class RiskReportSchema(BaseModel):
                 "scoring_breakdown": {}
             }
         }
+    )
 
 
 # === Analysis Request/Response ===
 
-class AnalyzeRequest(BaseModel):
+class AnalyzeRequest(SchemaModel):
     """Request to analyze a document."""
     include_all_clauses: bool = Field(
         default=False, 
@@ -253,7 +274,7 @@ class AnalyzeRequest(BaseModel):
     )
 
 
-class AnalyzeResponse(BaseModel):
+class AnalyzeResponse(SchemaModel):
     """Response for document analysis."""
     document_id: str
     status: AnalysisStatusEnum
@@ -264,7 +285,7 @@ class AnalyzeResponse(BaseModel):
 
 # === Status Schemas ===
 
-class DocumentStatusResponse(BaseModel):
+class DocumentStatusResponse(SchemaModel):
     """Response for document status check."""
     document_id: str
     filename: str
@@ -277,25 +298,26 @@ class DocumentStatusResponse(BaseModel):
 
 # === Error Schemas ===
 
-class ErrorResponse(BaseModel):
+class ErrorResponse(SchemaModel):
     """Standard error response."""
     error: str = Field(..., description="Error type")
     message: str = Field(..., description="Error message")
     details: dict[str, Any] | None = Field(None, description="Additional error details")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "error": "ValidationError",
                 "message": "Invalid file format. Only PDF files are accepted.",
                 "details": {"accepted_formats": ["application/pdf"]}
             }
         }
+    )
 
 
 # === Health Check ===
 
-class HealthCheckResponse(BaseModel):
+class HealthCheckResponse(SchemaModel):
     """API health check response."""
     status: str = Field(..., description="API status")
     version: str = Field(..., description="API version")
@@ -4,11 +4,14 @@ Pytest configuration and fixtures for LawVisor tests.
 import os
 import sys
 from pathlib import Path
-from typing import Generator
+from typing import AsyncGenerator
 from unittest.mock import MagicMock, patch
 
+import httpx
+import orjson
 import pytest
-from fastapi.testclient import TestClient
+import pytest_asyncio
+from httpx import ASGITransport, AsyncClient
 
 # Add backend to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -34,16 +37,42 @@ def mock_settings():
         yield
 
 
-@pytest.fixture
-def test_client(mock_settings) -> Generator[TestClient, None, None]:
-    """Create a test client for the FastAPI app."""
+@pytest.fixture(scope="session", autouse=True)
+def orjson_responses():
+    """Decode test client JSON responses with orjson instead of stdlib json."""
+    stdlib_json = httpx.Response.json
+    
+    def json(self: httpx.Response, **kwargs):
+        if kwargs:
+            return stdlib_json(self, **kwargs)
+        return orjson.loads(self.content)
+    
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(httpx.Response, "json", json)
+        yield
+
+
+@pytest_asyncio.fixture(scope="session")
+async def async_client(mock_settings) -> AsyncGenerator[AsyncClient, None]:
+    """
+    Create an in-process async client for the FastAPI app.
+    
+    Requests run on the session event loop, without TestClient's thread hop.
+    ASGITransport doesn't send lifespan events, so the app lifespan is run
+    here, once. API tests must use the session loop too
+    (pytest.mark.asyncio(scope="session")): lazily built singletons such as
+    the regulations fetcher's HTTP client are bound to the loop they were
+    first used on.
+    """
     from main import app
     
-    with TestClient(app) as client:
-        yield client
+    transport = ASGITransport(app=app)
+    async with app.router.lifespan_context(app):
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            yield client
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_pdf_content() -> bytes:
     """Generate sample PDF content for testing."""
     # Minimal valid PDF structure
@@ -82,10 +111,13 @@ startxref
     return pdf_content
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_extracted_clauses():
-    """Sample extracted clauses for testing."""
-    return [
+    """
+    Sample extracted clauses for testing.
+    Shared across the session, so returned as a tuple.
+    """
+    return (
         {
             "clause_id": "clause-001",
             "clause_type": "data_protection",
@@ -119,7 +151,7 @@ def sample_extracted_clauses():
                 "paragraph": 1
             }
         }
-    ]
+    )
 
 
 @pytest.fixture
@@ -162,7 +194,7 @@ def sample_risk_report():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_ocr_processor():
     """Mock OCR processor."""
     mock = MagicMock()
@@ -175,7 +207,7 @@ def mock_ocr_processor():
     return mock
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_clause_extractor():
     """Mock clause extractor."""
     mock = MagicMock()
@@ -193,7 +225,7 @@ def mock_clause_extractor():
     return mock
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_rag_engine():
     """Mock RAG engine."""
     mock = MagicMock()
@@ -205,7 +237,7 @@ def mock_rag_engine():
     return mock
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_risk_engine():
     """Mock risk engine."""
     mock = MagicMock()
@@ -0,0 +1,84 @@
+"""
+Tests for the OCR module's native PDF extraction.
+"""
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core import ocr
+from core.ocr import OCRProcessor
+
+
+def build_text_pdf(page_texts: list[str]) -> bytes:
+    """Build a minimal native PDF with one line of Helvetica text per page."""
+    page_count = len(page_texts)
+    font_id = 3 + 2 * page_count
+    page_ids = [3 + 2 * i for i in range(page_count)]
+
+    objects = {
+        1: b"<< /Type /Catalog /Pages 2 0 R >>",
+        2: (
+            b"<< /Type /Pages /Kids ["
+            + b" ".join(b"%d 0 R" % page_id for page_id in page_ids)
+            + b"] /Count %d >>" % page_count
+        ),
+        font_id: b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    }
+    for page_id, text in zip(page_ids, page_texts):
+        stream = b"BT /F1 12 Tf 72 720 Td (%s) Tj ET" % text.encode("latin-1")
+        objects[page_id] = (
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            b"/Resources << /Font << /F1 %d 0 R >> >> /Contents %d 0 R >>"
+            % (font_id, page_id + 1)
+        )
+        objects[page_id + 1] = (
+            b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream)
+        )
+
+    pdf = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for obj_id in range(1, len(objects) + 1):
+        offsets.append(len(pdf))
+        pdf += b"%d 0 obj\n%s\nendobj\n" % (obj_id, objects[obj_id])
+
+    xref_offset = len(pdf)
+    pdf += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    for offset in offsets:
+        pdf += b"%010d 00000 n \n" % offset
+    pdf += (
+        b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n"
+        % (len(objects) + 1, xref_offset)
+    )
+    return bytes(pdf)
+
+
+@pytest.fixture
+def processor(tmp_path, monkeypatch):
+    """OCR processor with its result cache in a temporary directory."""
+    monkeypatch.setattr(ocr.settings, "ocr_cache_dir", tmp_path / "ocr-cache")
+    processor = OCRProcessor()
+    yield processor
+    asyncio.run(processor.close())
+
+
+class TestNativeExtraction:
+    """Tests for pdfplumber-based extraction of native PDFs."""
+
+    def test_extracts_every_page(self, processor, tmp_path):
+        """Test that a multi-page native PDF yields one PageContent per page."""
+        page_texts = [f"Section {i}. The parties agree to term {i}." for i in range(1, 8)]
+        pdf_path = tmp_path / "contract.pdf"
+        pdf_path.write_bytes(build_text_pdf(page_texts))
+
+        pages = processor._extract_native_pdf_sync(pdf_path)
+
+        assert [page.page_number for page in pages] == list(range(1, 8))
+        for page, expected in zip(pages, page_texts):
+            assert page.text.strip() == expected
+            assert page.confidence == 1.0
+            assert not page.is_scanned
@@ -0,0 +1,81 @@
+"""
+Tests for the SemanticCache module.
+"""
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.semantic_cache import SemanticCache
+
+
+@pytest.fixture
+def vectors():
+    """Random unit vectors for cache tests."""
+    rng = np.random.default_rng(42)
+    v = rng.standard_normal((10, 64)).astype(np.float32)
+    return v / np.linalg.norm(v, axis=1, keepdims=True)
+
+
+class TestSemanticCache:
+    """Tests for similarity-keyed lookups."""
+
+    def test_empty_cache_misses(self, vectors):
+        """Test that an empty cache returns None."""
+        cache = SemanticCache()
+
+        assert cache.get(vectors[0]) is None
+        assert cache.misses == 1
+
+    def test_exact_match_hits(self, vectors):
+        """Test that the same embedding returns the stored value."""
+        cache = SemanticCache()
+        cache.set(vectors[0], "analysis-0")
+
+        assert cache.get(vectors[0]) == "analysis-0"
+        assert cache.hits == 1
+
+    def test_dissimilar_vector_misses(self, vectors):
+        """Test that unrelated embeddings do not hit."""
+        cache = SemanticCache(threshold=0.95)
+        cache.set(vectors[0], "analysis-0")
+
+        assert cache.get(vectors[1]) is None
+
+    def test_namespaces_are_isolated(self, vectors):
+        """Test that entries are only visible within their namespace."""
+        cache = SemanticCache()
+        cache.set(vectors[0], "liability", namespace="liability")
+
+        assert cache.get(vectors[0], namespace="termination") is None
+        assert cache.get(vectors[0], namespace="liability") == "liability"
+
+    def test_zero_vector_is_ignored(self):
+        """Test that zero vectors are neither stored nor matched."""
+        cache = SemanticCache()
+        cache.set(np.zeros(8), "zero")
+
+        assert len(cache) == 0
+        assert cache.get(np.zeros(8)) is None
+
+    def test_eviction_bounds_size(self, vectors):
+        """Test that the oldest entry is evicted once full."""
+        cache = SemanticCache(max_entries=3)
+        for i in range(5):
+            cache.set(vectors[i], f"analysis-{i}")
+
+        assert len(cache) == 3
+        assert cache.get(vectors[0]) is None
+        assert cache.get(vectors[4]) == "analysis-4"
+
+    def test_entries_stored_as_int8(self, vectors):
+        """Test that embeddings are quantized but still match themselves."""
+        cache = SemanticCache(threshold=0.99)
+        cache.set(vectors[0], "analysis-0")
+
+        assert cache._codes.dtype == np.int8
+        assert cache.get(vectors[0]) == "analysis-0"
@@ -164,13 +164,46 @@ export async function uploadDocument(file: File): Promise<UploadResponse> {
 }
 
 /**
- * Analyze an uploaded document.
+ * Start analysis of an uploaded document.
+ *
+ * The backend queues the analysis and returns immediately with status
+ * `processing`; use `waitForAnalysis` to obtain the completed report.
  */
 export async function analyzeDocument(documentId: string): Promise<AnalyzeResponse> {
   const response = await api.post<AnalyzeResponse>(`/analyze/${documentId}`);
   return response.data;
 }
 
+/**
+ * Start analysis and poll until it completes or fails.
+ */
+export async function waitForAnalysis(
+  documentId: string,
+  pollIntervalMs = 2000
+): Promise<AnalyzeResponse> {
+  let result = await analyzeDocument(documentId);
+
+  while (result.status === 'processing' || result.status === 'pending') {
+    await new Promise((resolve) => setTimeout(resolve, pollIntervalMs));
+    const docStatus = await getDocumentStatus(documentId);
+
+    if (docStatus.status === 'completed') {
+      // Re-posting a completed document returns its report
+      result = await analyzeDocument(documentId);
+    } else if (docStatus.status === 'failed') {
+      result = {
+        document_id: documentId,
+        status: 'failed',
+        risk_report: null,
+        processing_time_seconds: null,
+        error_message: docStatus.error_message,
+      };
+    }
+  }
+
+  return result;
+}
+
 /**
  * Get document analysis status.
  */
@@ -18,7 +18,7 @@ import {
 import {
   UploadResponse,
   RiskReport,
-  analyzeDocument,
+  waitForAnalysis,
   getErrorMessage,
 } from '../lib/api';
 
@@ -49,7 +49,7 @@ export default function Home() {
     setError(null);
 
     try {
-      const analysisResult = await analyzeDocument(response.document_id);
+      const analysisResult = await waitForAnalysis(response.document_id);
       
       if (analysisResult.status === 'completed' && analysisResult.risk_report) {
         setRiskReport(analysisResult.risk_report);